@@ -87,6 +87,7 @@ from .helpers import (
     translation,
 )
 from .helpers.dispatcher import async_dispatcher_send_internal
+from .helpers.startup_profile import async_get_startup_profile
 from .helpers.storage import get_internal_store_manager
 from .helpers.system_info import async_get_system_info, is_official_image
 from .helpers.typing import ConfigType
@@ -451,6 +452,8 @@ async def async_from_config_dict(
     start = monotonic()
 
     hass.config_entries = config_entries.ConfigEntries(hass, config)
+    # Resolve the integrations from the persistent manifest cache
+    await loader.async_load_manifest_cache(hass)
     # Prime custom component cache early so we know if registry entries are tied
     # to a custom integration
     await loader.async_get_custom_components(hass)
@@ -803,8 +806,12 @@ async def async_setup_multi_components(
 
 async def _async_resolve_domains_to_setup(
     hass: core.HomeAssistant, config: dict[str, Any]
-) -> tuple[set[str], dict[str, loader.Integration]]:
-    """Resolve all dependencies and return list of domains to set up."""
+) -> tuple[set[str], dict[str, loader.Integration], asyncio.Task[None]]:
+    """Resolve all dependencies and return list of domains to set up.
+
+    The task that checks which requirements are already installed is
+    returned as well.
+    """
     domains_to_setup = _get_domains(hass, config)
     needed_requirements: set[str] = set()
     platform_integrations = conf_util.extract_platform_integrations(
@@ -844,6 +851,7 @@ async def _async_resolve_domains_to_setup(
     # Resolve all dependencies so we know all integrations
     # that will have to be loaded and start right-away
     integration_cache: dict[str, loader.Integration] = {}
+    startup_profile = async_get_startup_profile(hass)
     to_resolve: set[str] = domains_to_setup
     while to_resolve or additional_manifests_to_load:
         old_to_resolve: set[str] = to_resolve
@@ -903,6 +911,8 @@ async def _async_resolve_domains_to_setup(
                     integration_cache[dependant_domain] = dependant_itg
                     needed_requirements.update(dependant_itg.requirements)
 
+        startup_profile.async_resolved(integration_cache)
+
         if resolve_dependencies_tasks:
             await asyncio.gather(*resolve_dependencies_tasks)
 
@@ -924,7 +934,7 @@ async def _async_resolve_domains_to_setup(
     # Optimistically check if requirements are already installed
     # ahead of setting up the integrations so we can prime the cache
     # We do not wait for this since its an optimization only
-    hass.async_create_background_task(
+    check_requirements_task = hass.async_create_background_task(
         requirements.async_load_installed_versions(hass, needed_requirements),
         "check installed requirements",
         eager_start=True,
@@ -962,7 +972,7 @@ async def _async_resolve_domains_to_setup(
         eager_start=True,
     )
 
-    return domains_to_setup, integration_cache
+    return domains_to_setup, integration_cache, check_requirements_task
 
 
 async def _async_set_up_integrations(
@@ -972,10 +982,18 @@ async def _async_set_up_integrations(
     watcher = _WatchPendingSetups(hass, _setup_started(hass))
     watcher.async_start()
 
-    domains_to_setup, integration_cache = await _async_resolve_domains_to_setup(
-        hass, config
+    # Load the profile of the last start while the integrations are resolved
+    startup_profile = async_get_startup_profile(hass)
+    load_profile_task = create_eager_task(
+        startup_profile.async_load(), name="load startup profile", loop=hass.loop
     )
 
+    (
+        domains_to_setup,
+        integration_cache,
+        check_requirements_task,
+    ) = await _async_resolve_domains_to_setup(hass, config)
+
     # Initialize recorder
     if "recorder" in domains_to_setup:
         recorder.async_initialize_recorder(hass)
@@ -1008,6 +1026,30 @@ async def _async_set_up_integrations(
 
     stage_2_domains = domains_to_setup - stage_1_domains
 
+    # Import the integrations in the background in the order that unblocks
+    # the setups the soonest, so the import executor does not sit idle while
+    # the integrations of the earlier stages are set up
+    await load_profile_task
+    import_plan = startup_profile.async_plan_imports(
+        {
+            domain: integration
+            for domain in domains_to_setup
+            if (integration := integration_cache.get(domain)) is not None
+        },
+        chain(
+            stage_1_domains, *(domain_group for _, domain_group in pre_stage_domains)
+        ),
+    )
+
+    async def _async_preimport() -> None:
+        """Pre-import the integrations once the installed requirements are known."""
+        await check_requirements_task
+        await startup_profile.async_preimport(import_plan)
+
+    hass.async_create_background_task(
+        _async_preimport(), "pre-import integrations", eager_start=True
+    )
+
     for name, domain_group in pre_stage_domains:
         if domain_group:
             stage_2_domains -= domain_group
@@ -1068,8 +1110,10 @@ async def _async_set_up_integrations(
 
     watcher.async_stop()
 
+    setup_time = async_get_setup_timings(hass)
+    startup_profile.async_set_up(setup_time)
+
     if _LOGGER.isEnabledFor(logging.DEBUG):
-        setup_time = async_get_setup_timings(hass)
         _LOGGER.debug(
             "Integration setup times: %s",
             dict(sorted(setup_time.items(), key=itemgetter(1), reverse=True)),
@@ -80,8 +80,8 @@ def websocket_list_entities_for_display(
     inner = b",".join(
         [
             entry.display_json_repr
-            for entry in registry.entities.values()
-            if entry.disabled_by is None and entry.display_json_repr is not None
+            for entry in registry.entities.get_enabled_entries()
+            if entry.display_json_repr is not None
         ]
     )
     msg_json = b"".join((msg_json_prefix, inner, b"]}}"))
@@ -1,7 +1,13 @@
 """History integration constants."""
 
+from datetime import timedelta
+
 DOMAIN = "history"
 
 EVENT_COALESCE_TIME = 0.35
 
 MAX_PENDING_HISTORY_STATES = 2048
+
+# The size of the chunks of a chunked history_during_period response
+HISTORY_CHUNK_TIME = timedelta(days=1)
+HISTORY_CHUNK_ENTITIES = 50
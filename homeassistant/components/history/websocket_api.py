@@ -38,7 +38,12 @@ from homeassistant.helpers.json import json_bytes
 from homeassistant.util.async_ import create_eager_task
 import homeassistant.util.dt as dt_util
 
-from .const import EVENT_COALESCE_TIME, MAX_PENDING_HISTORY_STATES
+from .const import (
+    EVENT_COALESCE_TIME,
+    HISTORY_CHUNK_ENTITIES,
+    HISTORY_CHUNK_TIME,
+    MAX_PENDING_HISTORY_STATES,
+)
 from .helpers import entities_may_have_state_changes_after, has_recorder_run_after
 
 _LOGGER = logging.getLogger(__name__)
@@ -103,13 +108,18 @@ def _ws_get_significant_states(
         vol.Optional("significant_changes_only", default=True): bool,
         vol.Optional("minimal_response", default=False): bool,
         vol.Optional("no_attributes", default=False): bool,
+        vol.Optional("chunked", default=False): bool,
     }
 )
 @websocket_api.async_response
 async def ws_get_history_during_period(
     hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg: dict[str, Any]
 ) -> None:
-    """Handle history during period websocket command."""
+    """Handle history during period websocket command.
+
+    In chunked mode the result is empty and the states are sent as events
+    in chunks of time and entities, followed by an event marking the end.
+    """
     start_time_str = msg["start_time"]
     end_time_str = msg.get("end_time")
 
@@ -128,8 +138,9 @@ async def ws_get_history_during_period(
     else:
         end_time = None
 
-    if start_time > dt_util.utcnow():
-        connection.send_result(msg["id"], {})
+    utc_now = dt_util.utcnow()
+    if start_time > utc_now:
+        _async_send_empty_history_result(connection, msg)
         return
 
     entity_ids: list[str] = msg["entity_ids"]
@@ -149,12 +160,31 @@ async def ws_get_history_during_period(
             hass, entity_ids, start_time, no_attributes
         )
     ):
-        connection.send_result(msg["id"], {})
+        _async_send_empty_history_result(connection, msg)
         return
 
     significant_changes_only = msg["significant_changes_only"]
     minimal_response = msg["minimal_response"]
 
+    if msg["chunked"]:
+        msg_id: int = msg["id"]
+        connection.subscriptions[msg_id] = callback(lambda: None)
+        connection.send_result(msg_id)
+        await _async_send_history_chunks(
+            hass,
+            connection,
+            msg_id,
+            start_time,
+            end_time,
+            utc_now,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+        )
+        return
+
     connection.send_message(
         await get_instance(hass).async_add_executor_job(
             _ws_get_significant_states,
@@ -171,6 +201,137 @@ async def ws_get_history_during_period(
     )
 
 
+@callback
+def _async_send_empty_history_result(
+    connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Send an empty history_during_period result."""
+    if not msg["chunked"]:
+        connection.send_result(msg["id"], {})
+        return
+    connection.send_result(msg["id"])
+    connection.send_message(
+        json_bytes(messages.event_message(msg["id"], {"complete": True}))
+    )
+
+
+def _generate_history_chunk(
+    hass: HomeAssistant,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt,
+    query_end_time: dt | None,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> bytes | None:
+    """Fetch a chunk of history and convert it to json in the executor."""
+    # The history queries exclude states at the start time, move the
+    # start time back so states at the end of the previous chunk are
+    # included in this chunk unless we fetch the start time state
+    query_start_time = (
+        start_time
+        if include_start_time_state
+        else start_time - timedelta(microseconds=1)
+    )
+    states = cast(
+        dict[str, list[dict[str, Any]]],
+        history.get_significant_states(
+            hass,
+            query_start_time,
+            query_end_time,
+            entity_ids,
+            None,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            no_attributes,
+            True,
+        ),
+    )
+    if not states:
+        return None
+    return _generate_websocket_response(msg_id, start_time, end_time, states)
+
+
+async def _async_send_history_chunks(
+    hass: HomeAssistant,
+    connection: ActiveConnection,
+    msg_id: int,
+    start_time: dt,
+    end_time: dt | None,
+    utc_now: dt,
+    entity_ids: list[str],
+    include_start_time_state: bool,
+    significant_changes_only: bool,
+    minimal_response: bool,
+    no_attributes: bool,
+) -> None:
+    """Fetch the history in chunks of time and entities and send them.
+
+    Only one chunk is kept in memory at a time and the client can
+    render the history while the next chunk is fetched. Without an end
+    time, the last chunk is not limited to the time of the request,
+    like the history that is not chunked.
+    """
+    instance = get_instance(hass)
+    last_end_time = end_time or utc_now
+    chunk_start_time = start_time
+    try:
+        while chunk_start_time < last_end_time:
+            chunk_end_time = min(chunk_start_time + HISTORY_CHUNK_TIME, last_end_time)
+            query_end_time = (
+                None
+                if end_time is None and chunk_end_time == last_end_time
+                else chunk_end_time
+            )
+            for idx in range(0, len(entity_ids), HISTORY_CHUNK_ENTITIES):
+                payload = await instance.async_add_executor_job(
+                    _generate_history_chunk,
+                    hass,
+                    msg_id,
+                    chunk_start_time,
+                    chunk_end_time,
+                    query_end_time,
+                    entity_ids[idx : idx + HISTORY_CHUNK_ENTITIES],
+                    # Only the first chunk has the start time state
+                    include_start_time_state and chunk_start_time == start_time,
+                    significant_changes_only,
+                    minimal_response,
+                    no_attributes,
+                )
+                if msg_id not in connection.subscriptions:
+                    # Unsubscribe happened while fetching the chunk
+                    return
+                if payload:
+                    connection.send_message(payload)
+            chunk_start_time = chunk_end_time
+    except Exception:
+        _LOGGER.exception("Error fetching the history of %s", entity_ids)
+        if connection.subscriptions.pop(msg_id, None) is not None:
+            connection.send_message(
+                json_bytes(
+                    messages.event_message(
+                        msg_id,
+                        {
+                            "error": {
+                                "code": websocket_api.ERR_UNKNOWN_ERROR,
+                                "message": "Error fetching history",
+                            }
+                        },
+                    )
+                )
+            )
+        return
+
+    connection.subscriptions.pop(msg_id)
+    connection.send_message(
+        json_bytes(messages.event_message(msg_id, {"complete": True}))
+    )
+
+
 def _generate_stream_message(
     states: dict[str, list[dict[str, Any]]],
     start_day: dt,
@@ -2,11 +2,20 @@
 
 from __future__ import annotations
 
+from bisect import bisect_right
 from dataclasses import dataclass
 import datetime
+import math
+from operator import attrgetter
 
 from homeassistant.components.recorder import get_instance, history
-from homeassistant.core import Event, EventStateChangedData, HomeAssistant, State
+from homeassistant.core import (
+    Event,
+    EventStateChangedData,
+    HomeAssistant,
+    State,
+    callback,
+)
 from homeassistant.helpers.template import Template
 import homeassistant.util.dt as dt_util
 
@@ -14,6 +23,10 @@ from .helpers import async_calculate_period, floored_timestamp
 
 MIN_TIME_UTC = datetime.datetime.min.replace(tzinfo=dt_util.UTC)
 
+# Seconds on top of the recorder commit interval that tracked state changes
+# are kept for, as they may not be in the database yet when it is queried
+UNCOMMITTED_MARGIN = 30
+
 
 @dataclass
 class HistoryStatsState:
@@ -50,12 +63,34 @@ class HistoryStats:
         self._period = (MIN_TIME_UTC, MIN_TIME_UTC)
         self._state: HistoryStatsState = HistoryStatsState(None, None, self._period)
         self._history_current_period: list[HistoryState] = []
+        # Tracked state changes after the end of the period
+        self._history_after_end: list[HistoryState] = []
+        # Recently tracked state changes, which may not be committed yet
+        self._recent_changes: list[HistoryState] = []
         self._previous_run_before_start = False
+        # While tracking, every state change of the entity is passed to
+        # async_update so the history is complete from the last query on
+        self._tracking = False
+        self._history_complete = False
         self._entity_states = set(entity_states)
         self._duration = duration
         self._start = start
         self._end = end
 
+    @callback
+    def async_set_tracking(self, tracking: bool) -> None:
+        """Set if every state change of the entity is passed to async_update.
+
+        While tracking, the window can move forward without querying the
+        database, the history is kept up to date from the state changes and
+        the states before the new start are dropped. Changes before the
+        tracking started may be missing so the next update queries again.
+        """
+        self._tracking = tracking
+        self._history_complete = False
+        self._history_after_end = []
+        self._recent_changes = []
+
     async def async_update(
         self, event: Event[EventStateChangedData] | None
     ) -> HistoryStatsState:
@@ -80,11 +115,15 @@ class HistoryStats:
         previous_period_end_timestamp = floored_timestamp(previous_period_end)
         utc_now = dt_util.utcnow()
         now_timestamp = floored_timestamp(utc_now)
+        if self._tracking:
+            self._async_add_recent_change(event, now_timestamp)
 
         if current_period_start_timestamp > now_timestamp:
             # History cannot tell the future
             self._history_current_period = []
             self._previous_run_before_start = True
+            self._history_complete = False
+            self._history_after_end = []
             self._state = HistoryStatsState(None, None, self._period)
             return self._state
         #
@@ -119,15 +158,50 @@ class HistoryStats:
                         )
                     )
                     new_data = True
+                elif self._history_complete:
+                    # Keep the changes after the end for when the window moves
+                    self._async_add_event(
+                        event,
+                        current_period_start_timestamp,
+                        current_period_end_timestamp,
+                    )
             if not new_data and current_period_end_timestamp < now_timestamp:
                 # If period has not changed and current time after the period end...
                 # Don't compute anything as the value cannot have changed
                 return self._state
+        elif (
+            self._history_complete
+            and not self._previous_run_before_start
+            and current_period_start_timestamp >= previous_period_start_timestamp
+            and current_period_end_timestamp >= previous_period_end_timestamp
+        ):
+            # The window moved forward and all the state changes since the
+            # last query were tracked, drop the ones that fell out of it
+            self._async_move_history_after_end(current_period_end_timestamp)
+            self._async_add_event(
+                event, current_period_start_timestamp, current_period_end_timestamp
+            )
+            self._async_trim_history(current_period_start_timestamp)
         else:
             await self._async_history_from_db(
                 current_period_start_timestamp, current_period_end_timestamp
             )
             self._previous_run_before_start = False
+            self._history_after_end = []
+            self._async_merge_recent_changes(
+                current_period_start_timestamp, current_period_end_timestamp
+            )
+            # The state changes after the query are tracked, so the history
+            # is only complete if the query covered everything until now
+            self._history_complete = (
+                self._tracking
+                and current_period_end_timestamp >= now_timestamp
+                and (
+                    not self._history_current_period
+                    or math.floor(self._history_current_period[-1].last_changed)
+                    <= current_period_end_timestamp
+                )
+            )
 
         seconds_matched, match_count = self._async_compute_seconds_and_changes(
             now_timestamp,
@@ -137,6 +211,100 @@ class HistoryStats:
         self._state = HistoryStatsState(seconds_matched, match_count, self._period)
         return self._state
 
+    @callback
+    def _async_add_event(
+        self,
+        event: Event[EventStateChangedData] | None,
+        start_timestamp: float,
+        end_timestamp: float,
+    ) -> None:
+        """Add the state change of an event after the start to the history.
+
+        State changes after the end are kept aside until the window moves.
+        """
+        if event and (new_state := event.data["new_state"]) is not None:
+            self._async_add_history_state(
+                HistoryState(new_state.state, new_state.last_changed.timestamp()),
+                start_timestamp,
+                end_timestamp,
+            )
+
+    @callback
+    def _async_add_history_state(
+        self, history_state: HistoryState, start_timestamp: float, end_timestamp: float
+    ) -> None:
+        """Add a state change after the start to the history."""
+        if (last_changed := math.floor(history_state.last_changed)) < start_timestamp:
+            return
+        if last_changed <= end_timestamp:
+            self._history_current_period.append(history_state)
+        else:
+            self._history_after_end.append(history_state)
+
+    @callback
+    def _async_add_recent_change(
+        self, event: Event[EventStateChangedData] | None, now_timestamp: float
+    ) -> None:
+        """Keep the state change of an event until it must be in the database."""
+        recent_changes = self._recent_changes
+        keep_after = (
+            now_timestamp - get_instance(self.hass).commit_interval - UNCOMMITTED_MARGIN
+        )
+        index = bisect_right(recent_changes, keep_after, key=attrgetter("last_changed"))
+        if index:
+            del recent_changes[:index]
+        if event and (new_state := event.data["new_state"]) is not None:
+            recent_changes.append(
+                HistoryState(new_state.state, new_state.last_changed.timestamp())
+            )
+
+    @callback
+    def _async_merge_recent_changes(
+        self, start_timestamp: float, end_timestamp: float
+    ) -> None:
+        """Add the recent state changes which the query did not return.
+
+        The recorder commits in batches, so the last state changes, including
+        the one that triggered the update, may not be in the database yet.
+        """
+        history = self._history_current_period
+        last_changed = history[-1].last_changed if history else start_timestamp
+        for history_state in self._recent_changes:
+            if history_state.last_changed > last_changed:
+                self._async_add_history_state(
+                    history_state, start_timestamp, end_timestamp
+                )
+
+    @callback
+    def _async_move_history_after_end(self, end_timestamp: float) -> None:
+        """Move the tracked state changes that are now before the end to the history."""
+        history_after_end = self._history_after_end
+        index = bisect_right(
+            history_after_end,
+            end_timestamp,
+            key=lambda history_state: math.floor(history_state.last_changed),
+        )
+        if index:
+            self._history_current_period.extend(history_after_end[:index])
+            del history_after_end[:index]
+
+    @callback
+    def _async_trim_history(self, start_timestamp: float) -> None:
+        """Drop the states that ended before the start of the period.
+
+        The last state before the start is kept as the state at the start,
+        like the database query does with include_start_time_state.
+        """
+        history = self._history_current_period
+        index = bisect_right(history, start_timestamp, key=attrgetter("last_changed"))
+        if index == 0:
+            return
+        start_state = history[index - 1]
+        self._history_current_period = [
+            HistoryState(start_state.state, start_timestamp),
+            *history[index:],
+        ]
+
     async def _async_history_from_db(
         self,
         current_period_start_timestamp: float,
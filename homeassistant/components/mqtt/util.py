@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import asyncio
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Iterator
 from functools import lru_cache
 import logging
 import os
@@ -145,6 +145,113 @@ class EnsureJobAfterCooldown:
             _LOGGER.exception("Error cleaning up task")
 
 
+class _TopicTrieNode[_T]:
+    """A node in a topic trie."""
+
+    __slots__ = ("children", "items")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TopicTrieNode[_T]] = {}
+        self.items: set[_T] = set()
+
+
+class TopicTrie[_T]:
+    """Trie of MQTT topic filters supporting `+` and `#` wildcards.
+
+    Items are stored at the node of the topic filter they were added
+    with. Matching a topic walks the trie once per topic level, so the
+    cost depends on the depth of the topic and not on the number of
+    topic filters that were added.
+    """
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TopicTrieNode[_T] = _TopicTrieNode()
+        self._size = 0
+
+    def __len__(self) -> int:
+        """Return the number of items in the trie."""
+        return self._size
+
+    def __iter__(self) -> Iterator[_T]:
+        """Iterate over all items in the trie."""
+        nodes = [self._root]
+        while nodes:
+            node = nodes.pop()
+            yield from node.items
+            nodes.extend(node.children.values())
+
+    def add(self, topic_filter: str, item: _T) -> None:
+        """Add an item for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                child = node.children[level] = _TopicTrieNode()
+            node = child
+        if item not in node.items:
+            node.items.add(item)
+            self._size += 1
+
+    def remove(self, topic_filter: str, item: _T) -> None:
+        """Remove an item for a topic filter.
+
+        Raises KeyError if the item was not added for the topic filter.
+        """
+        path: list[tuple[_TopicTrieNode[_T], str]] = []
+        node = self._root
+        for level in topic_filter.split("/"):
+            path.append((node, level))
+            node = node.children[level]
+        node.items.remove(item)
+        self._size -= 1
+        # Prune the branch back to the first node still in use
+        for parent, level in reversed(path):
+            child = parent.children[level]
+            if child.items or child.children:
+                break
+            del parent.children[level]
+
+    def has_topic_filter(self, topic_filter: str) -> bool:
+        """Return if any item was added for exactly this topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            if (child := node.children.get(level)) is None:
+                return False
+            node = child
+        return bool(node.items)
+
+    def matches(self, topic: str) -> list[_T]:
+        """Return all items with a topic filter matching the topic.
+
+        Follows the MQTT specification: `+` matches exactly one level,
+        `#` matches the parent level and any number of child levels, and
+        wildcards at the first level do not match topics starting with `$`.
+        """
+        levels = topic.split("/")
+        depth = len(levels)
+        # Wildcards at the first level must not match $SYS style topics
+        wildcards_at_root = not topic.startswith("$")
+        result: list[_T] = []
+        stack: list[tuple[_TopicTrieNode[_T], int]] = [(self._root, 0)]
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+            wildcard_allowed = index > 0 or wildcards_at_root
+            if wildcard_allowed and (multi := children.get("#")) is not None:
+                result.extend(multi.items)
+            if index == depth:
+                result.extend(node.items)
+                continue
+            if (child := children.get(levels[index])) is not None:
+                stack.append((child, index + 1))
+            if wildcard_allowed and (single := children.get("+")) is not None:
+                stack.append((single, index + 1))
+        return result
+
+
 def platforms_from_config(config: list[ConfigType]) -> set[Platform | str]:
     """Return the platforms to be set up."""
     return {key for platform in config for key in platform}
@@ -67,6 +67,9 @@ class PlugwiseClimateEntity(PlugwiseEntity, ClimateEntity):
     ) -> None:
         """Set up the Plugwise API."""
         super().__init__(coordinator, device_id)
+        # The HVAC action and mode also depend on the gateway and heater
+        # devices, so update on every change instead of per device
+        self.coordinator_context = None
         self._attr_extra_state_attributes = {}
         self._attr_unique_id = f"{device_id}-climate"
         self.cdr_gateway = coordinator.data.gateway
@@ -71,6 +71,15 @@ DEFAULT_SCAN_INTERVAL: Final[dict[str, timedelta]] = {
 }
 DEFAULT_USERNAME: Final = "smile"
 
+# Adaptive polling directives
+UPDATE_INTERVAL: Final = timedelta(seconds=60)
+# Poll faster for a few updates after a command was sent to the device
+COMMAND_UPDATE_INTERVAL: Final = timedelta(seconds=10)
+COMMAND_UPDATES: Final = 3
+# Back off after a number of updates without any changed device
+IDLE_UPDATES_BEFORE_BACKOFF: Final = 3
+MAX_UPDATE_INTERVAL: Final = timedelta(minutes=3)
+
 MASTER_THERMOSTATS: Final[list[str]] = [
     "thermostat",
     "thermostatic_radiator_valve",
@@ -1,8 +1,9 @@
 """DataUpdateCoordinator for Plugwise."""
 
-from datetime import timedelta
+from copy import deepcopy
 
 from plugwise import PlugwiseData, Smile
+from plugwise.constants import DeviceData, GatewayData
 from plugwise.exceptions import (
     ConnectionFailedError,
     InvalidAuthentication,
@@ -14,14 +15,25 @@ from plugwise.exceptions import (
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_PORT, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import ConfigEntryError
 from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.debounce import Debouncer
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .const import DEFAULT_PORT, DEFAULT_USERNAME, DOMAIN, GATEWAY_ID, LOGGER
+from .const import (
+    COMMAND_UPDATE_INTERVAL,
+    COMMAND_UPDATES,
+    DEFAULT_PORT,
+    DEFAULT_USERNAME,
+    DOMAIN,
+    GATEWAY_ID,
+    IDLE_UPDATES_BEFORE_BACKOFF,
+    LOGGER,
+    MAX_UPDATE_INTERVAL,
+    UPDATE_INTERVAL,
+)
 
 
 class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[PlugwiseData]):
@@ -37,7 +49,7 @@ class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[PlugwiseData]):
             hass,
             LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=60),
+            update_interval=UPDATE_INTERVAL,
             # Don't refresh immediately, give the device time to process
             # the change in state before we query it.
             request_refresh_debouncer=Debouncer(
@@ -58,6 +70,10 @@ class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[PlugwiseData]):
         )
         self._current_devices: set[str] = set()
         self.new_devices: set[str] = set()
+        self._previous_devices: dict[str, DeviceData] = {}
+        self._previous_gateway: GatewayData = {}
+        self._command_updates = 0
+        self._idle_updates = 0
 
     async def _connect(self) -> None:
         """Connect to the Plugwise Smile."""
@@ -85,9 +101,55 @@ class PlugwiseDataUpdateCoordinator(DataUpdateCoordinator[PlugwiseData]):
             raise ConfigEntryError("Device with unsupported firmware") from err
         else:
             self._async_add_remove_devices(data, self.config_entry)
+            self._async_track_changed_devices(data)
 
         return data
 
+    @callback
+    def async_command_sent(self) -> None:
+        """Poll faster for a few updates after a command was sent."""
+        self._command_updates = COMMAND_UPDATES
+        self._idle_updates = 0
+        self.update_interval = COMMAND_UPDATE_INTERVAL
+
+    def _async_track_changed_devices(self, data: PlugwiseData) -> None:
+        """Find the devices changed since the previous update."""
+        previous_devices = self._previous_devices
+        changed_devices = {
+            device_id
+            for device_id, device in data.devices.items()
+            if previous_devices.get(device_id) != device
+        }
+        changed_devices.update(previous_devices.keys() - data.devices.keys())
+        if data.gateway != self._previous_gateway:
+            changed_devices.add(data.gateway[GATEWAY_ID])
+
+        # The Smile API updates its data in place, so keep a copy to compare with
+        self._previous_devices = deepcopy(data.devices)
+        self._previous_gateway = deepcopy(data.gateway)
+        # Entities use their device_id as coordinator context
+        self.async_set_changed_contexts(changed_devices)
+        self._async_adapt_update_interval(bool(changed_devices))
+
+    def _async_adapt_update_interval(self, changed: bool) -> None:
+        """Adapt the update interval to how often the devices change."""
+        if self._command_updates:
+            self._command_updates -= 1
+            if self._command_updates:
+                return
+            self.update_interval = UPDATE_INTERVAL
+            return
+
+        if changed:
+            self._idle_updates = 0
+            self.update_interval = UPDATE_INTERVAL
+            return
+
+        self._idle_updates += 1
+        if self._idle_updates >= IDLE_UPDATES_BEFORE_BACKOFF:
+            assert self.update_interval is not None
+            self.update_interval = min(self.update_interval * 2, MAX_UPDATE_INTERVAL)
+
     def _async_add_remove_devices(self, data: PlugwiseData, entry: ConfigEntry) -> None:
         """Add new Plugwise devices, remove non-existing devices."""
         # Check for new or removed devices
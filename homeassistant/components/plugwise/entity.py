@@ -27,7 +27,8 @@ class PlugwiseEntity(CoordinatorEntity[PlugwiseDataUpdateCoordinator]):
         device_id: str,
     ) -> None:
         """Initialise the gateway."""
-        super().__init__(coordinator)
+        # The coordinator only updates the entities of changed devices
+        super().__init__(coordinator, device_id)
         self._dev_id = device_id
 
         configuration_url: str | None = None
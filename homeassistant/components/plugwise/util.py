@@ -17,6 +17,7 @@ def plugwise_command[_PlugwiseEntityT: PlugwiseEntity, **_P, _R](
 
     A decorator that wraps the passed in function, catches Plugwise errors,
     and requests an coordinator update to update status of the devices asap.
+    The coordinator polls faster for a few updates after the command.
     """
 
     async def handler(
@@ -29,6 +30,7 @@ def plugwise_command[_PlugwiseEntityT: PlugwiseEntity, **_P, _R](
                 f"Error communicating with API: {error}"
             ) from error
         finally:
+            self.coordinator.async_command_sent()
             await self.coordinator.async_request_refresh()
 
     return handler
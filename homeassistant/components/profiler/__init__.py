@@ -17,13 +17,19 @@ from typing import Any, cast
 from lru import LRU
 import voluptuous as vol
 
-from homeassistant.components import persistent_notification
+from homeassistant.components import persistent_notification, websocket_api
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
 from homeassistant.core import HomeAssistant, ServiceCall, callback
 from homeassistant.exceptions import HomeAssistantError
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.event import async_track_time_interval
+from homeassistant.helpers.job_timing import (
+    async_disable_job_timing,
+    async_enable_job_timing,
+    async_get_job_timings,
+)
+from homeassistant.helpers.json import save_json
 from homeassistant.helpers.service import async_register_admin_service
 
 from .const import DOMAIN
@@ -40,9 +46,12 @@ SERVICE_LOG_THREAD_FRAMES = "log_thread_frames"
 SERVICE_LOG_EVENT_LOOP_SCHEDULED = "log_event_loop_scheduled"
 SERVICE_SET_ASYNCIO_DEBUG = "set_asyncio_debug"
 SERVICE_LOG_CURRENT_TASKS = "log_current_tasks"
+SERVICE_START_JOB_TIMING = "start_job_timing"
+SERVICE_STOP_JOB_TIMING = "stop_job_timing"
 
 _LRU_CACHE_WRAPPER_OBJECT = _lru_cache_wrapper.__name__
 _SQLALCHEMY_LRU_OBJECT = "LRUCache"
+_TEMPLATE_RENDER_CACHE_OBJECT = "TemplateRenderCache"
 
 _KNOWN_LRU_CLASSES = (
     "EventDataManager",
@@ -63,6 +72,8 @@ SERVICES = (
     SERVICE_LOG_EVENT_LOOP_SCHEDULED,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_LOG_CURRENT_TASKS,
+    SERVICE_START_JOB_TIMING,
+    SERVICE_STOP_JOB_TIMING,
 )
 
 DEFAULT_SCAN_INTERVAL = timedelta(seconds=30)
@@ -221,6 +232,14 @@ async def async_setup_entry(  # noqa: C901
                         "Cache data for sqlalchemy LRUCache %s: %s: %s", lru, key, value
                     )
 
+        for render_cache in objgraph.by_type(_TEMPLATE_RENDER_CACHE_OBJECT):
+            _LOGGER.critical(
+                "Cache stats for template render cache %s: hits=%s, misses=%s",
+                render_cache,
+                render_cache.hits,
+                render_cache.misses,
+            )
+
         persistent_notification.create(
             hass,
             (
@@ -273,6 +292,27 @@ async def async_setup_entry(  # noqa: C901
             base_logger.setLevel(logging.INFO)
         hass.loop.set_debug(enabled)
 
+    async def _async_start_job_timing(call: ServiceCall) -> None:
+        """Start timing the jobs run in the event loop."""
+        if async_get_job_timings(hass) is not None:
+            raise HomeAssistantError("Job timing already started")
+        async_enable_job_timing(hass)
+
+    async def _async_stop_job_timing(call: ServiceCall) -> None:
+        """Stop timing the jobs and write the report."""
+        if (timings := async_disable_job_timing(hass)) is None:
+            raise HomeAssistantError("Job timing not running")
+        report_path = hass.config.path(f"job_timings.{int(time.time() * 1000000)}.json")
+        await hass.async_add_executor_job(
+            save_json, report_path, timings.async_as_dict()
+        )
+        persistent_notification.async_create(
+            hass,
+            f"Wrote job timing report to {report_path}",
+            title="Job Timing Complete",
+            notification_id="profiler_job_timing",
+        )
+
     async_register_admin_service(
         hass,
         DOMAIN,
@@ -382,6 +422,22 @@ async def async_setup_entry(  # noqa: C901
         _async_dump_current_tasks,
     )
 
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_START_JOB_TIMING,
+        _async_start_job_timing,
+    )
+
+    async_register_admin_service(
+        hass,
+        DOMAIN,
+        SERVICE_STOP_JOB_TIMING,
+        _async_stop_job_timing,
+    )
+
+    websocket_api.async_register_command(hass, websocket_job_timings)
+
     return True
 
 
@@ -391,10 +447,33 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         hass.services.async_remove(domain=DOMAIN, service=service)
     if LOG_INTERVAL_SUB in hass.data[DOMAIN]:
         hass.data[DOMAIN][LOG_INTERVAL_SUB]()
+    async_disable_job_timing(hass)
     hass.data.pop(DOMAIN)
     return True
 
 
+@websocket_api.websocket_command(
+    {
+        vol.Required("type"): "profiler/job_timings",
+        vol.Optional("limit"): vol.All(vol.Coerce(int), vol.Range(min=1)),
+    }
+)
+@websocket_api.require_admin
+@callback
+def websocket_job_timings(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Return the job timings collected so far."""
+    if DOMAIN not in hass.data or (timings := async_get_job_timings(hass)) is None:
+        connection.send_error(
+            msg["id"], websocket_api.ERR_NOT_FOUND, "Job timing not running"
+        )
+        return
+    connection.send_result(msg["id"], timings.async_as_dict(msg.get("limit")))
+
+
 async def _async_generate_profile(hass: HomeAssistant, call: ServiceCall):
     # Imports deferred to avoid loading modules
     # in memory since usually only one part of this
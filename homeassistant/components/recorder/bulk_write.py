@@ -0,0 +1,335 @@
+"""Write chunks of events to the database with multi-row INSERTs."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import insert
+from sqlalchemy.orm.session import Session
+
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import Event, EventStateChangedData
+
+from .db_schema import (
+    EventData,
+    Events,
+    EventTypes,
+    StateAttributes,
+    States,
+    StatesMeta,
+)
+from .models import ulid_to_bytes_or_none, uuid_hex_to_bytes_or_none
+from .recent_states import RecentState
+
+if TYPE_CHECKING:
+    from .core import Recorder
+
+# The maximum number of events to drain from the queue
+# and write with a single multi-row INSERT per table
+BULK_WRITE_MAX_EVENTS = 1000
+
+type _PendingIds = list[tuple[dict[str, Any], str, Any]]
+
+
+def write_events_in_bulk(
+    instance: Recorder, session: Session, events: list[Event[Any]]
+) -> None:
+    """Write a chunk of events to the session with multi-row INSERTs.
+
+    The ids of the event types, event data, states meta and state attributes
+    are resolved for the whole chunk at once. Rows that do not exist yet are
+    added with the ORM and flushed once, after which the Events and States
+    rows are inserted with Core executemany statements.
+
+    This call is not thread-safe and must be called from the
+    recorder thread.
+    """
+    state_events: list[Event[EventStateChangedData]] = []
+    non_state_events: list[Event[Any]] = []
+    for event in events:
+        if event.event_type == EVENT_STATE_CHANGED:
+            state_events.append(event)
+        else:
+            non_state_events.append(event)
+
+    pending_ids: _PendingIds = []
+    event_rows = _event_rows(instance, session, non_state_events, pending_ids)
+    state_rows = _state_rows(instance, session, state_events, pending_ids)
+
+    # Flush the new event types, event data, states meta and state attributes
+    # (and anything left behind by the ORM path) so they have their ids
+    session.flush()
+    for row, key, db_obj in pending_ids:
+        row[key] = getattr(db_obj, key)
+
+    if event_rows:
+        session.execute(insert(Events), event_rows)
+    if state_rows:
+        _insert_states(instance, session, state_rows)
+
+
+def _event_rows(
+    instance: Recorder,
+    session: Session,
+    events: list[Event[Any]],
+    pending_ids: _PendingIds,
+) -> list[dict[str, Any]]:
+    """Build the Events rows for a chunk of events."""
+    if not events:
+        return []
+    event_type_manager = instance.event_type_manager
+    event_data_manager = instance.event_data_manager
+
+    event_type_ids = event_type_manager.get_many(
+        {event.event_type for event in events}, session, True
+    )
+    shared_data_by_event: dict[int, tuple[str, int]] = {}
+    for idx, event in enumerate(events):
+        if event.data and (
+            shared_data_bytes := event_data_manager.serialize_from_event(event)
+        ):
+            shared_data_by_event[idx] = (
+                shared_data_bytes.decode("utf-8"),
+                EventData.hash_shared_data_bytes(shared_data_bytes),
+            )
+    data_ids = event_data_manager.get_many(shared_data_by_event.values(), session)
+
+    rows: list[dict[str, Any]] = []
+    for idx, event in enumerate(events):
+        if event.data and idx not in shared_data_by_event:
+            # The event data could not be serialized
+            continue
+        context = event.context
+        row: dict[str, Any] = {
+            "event_type_id": None,
+            "data_id": None,
+            "origin_idx": event.origin.idx,
+            "time_fired_ts": event.time_fired_timestamp,
+            "context_id_bin": ulid_to_bytes_or_none(context.id),
+            "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+            "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+        }
+        event_type = event.event_type
+        if pending_event_type := event_type_manager.get_pending(event_type):
+            pending_ids.append((row, "event_type_id", pending_event_type))
+        elif event_type_id := event_type_ids[event_type]:
+            row["event_type_id"] = event_type_id
+        else:
+            db_event_type = EventTypes(event_type=event_type)
+            event_type_manager.add_pending(db_event_type)
+            session.add(db_event_type)
+            pending_ids.append((row, "event_type_id", db_event_type))
+
+        if idx in shared_data_by_event:
+            shared_data, data_hash = shared_data_by_event[idx]
+            if pending_event_data := event_data_manager.get_pending(shared_data):
+                pending_ids.append((row, "data_id", pending_event_data))
+            elif data_id := data_ids[shared_data]:
+                row["data_id"] = data_id
+            else:
+                db_event_data = EventData(shared_data=shared_data, hash=data_hash)
+                event_data_manager.add_pending(db_event_data)
+                session.add(db_event_data)
+                pending_ids.append((row, "data_id", db_event_data))
+
+        rows.append(row)
+
+    return rows
+
+
+def _state_rows(
+    instance: Recorder,
+    session: Session,
+    events: list[Event[EventStateChangedData]],
+    pending_ids: _PendingIds,
+) -> list[tuple[Event[EventStateChangedData], dict[str, Any] | None]]:
+    """Build the States rows for a chunk of state_changed events.
+
+    The old_state_id is linked when the rows are inserted since
+    it may refer to a row earlier in the same chunk. Events which
+    are not recorded have no row, but still unlink the previous
+    state of the entity like the ORM path does.
+    """
+    if not events:
+        return []
+    states_meta_manager = instance.states_meta_manager
+    state_attributes_manager = instance.state_attributes_manager
+
+    shared_attrs_by_event: dict[int, tuple[str, int]] = {}
+    for idx, event in enumerate(events):
+        if shared_attrs_bytes := state_attributes_manager.serialize_from_event(event):
+            shared_attrs_by_event[idx] = (
+                shared_attrs_bytes.decode("utf-8"),
+                StateAttributes.hash_shared_attrs_bytes(shared_attrs_bytes),
+            )
+    metadata_ids = states_meta_manager.get_many(
+        {event.data["entity_id"] for event in events}, session, True
+    )
+    attributes_ids = state_attributes_manager.get_many(
+        shared_attrs_by_event.values(), session
+    )
+
+    rows: list[tuple[Event[EventStateChangedData], dict[str, Any] | None]] = []
+    for idx, event in enumerate(events):
+        entity_id = event.data["entity_id"]
+        if idx not in shared_attrs_by_event:
+            rows.append((event, None))
+            continue
+        entity_removed = not event.data.get("new_state")
+        row = _state_row_from_event(event)
+        if not states_meta_manager.active:
+            row["entity_id"] = entity_id
+
+        # Map the entity_id to the StatesMeta table
+        if pending_states_meta := states_meta_manager.get_pending(entity_id):
+            pending_ids.append((row, "metadata_id", pending_states_meta))
+        elif metadata_id := metadata_ids[entity_id]:
+            row["metadata_id"] = metadata_id
+        elif states_meta_manager.active and entity_removed:
+            # If the entity was removed, we don't need to add it to the
+            # StatesMeta table if it does not have a metadata_id
+            # allocated to it as it either never existed or was just renamed.
+            rows.append((event, None))
+            continue
+        else:
+            db_states_meta = StatesMeta(entity_id=entity_id)
+            states_meta_manager.add_pending(db_states_meta)
+            session.add(db_states_meta)
+            pending_ids.append((row, "metadata_id", db_states_meta))
+
+        # Map the event data to the StateAttributes table
+        shared_attrs, attrs_hash = shared_attrs_by_event[idx]
+        if pending_attributes := state_attributes_manager.get_pending(shared_attrs):
+            pending_ids.append((row, "attributes_id", pending_attributes))
+        elif attributes_id := attributes_ids[shared_attrs]:
+            row["attributes_id"] = attributes_id
+        else:
+            db_state_attributes = StateAttributes(
+                shared_attrs=shared_attrs, hash=attrs_hash
+            )
+            state_attributes_manager.add_pending(db_state_attributes)
+            session.add(db_state_attributes)
+            pending_ids.append((row, "attributes_id", db_state_attributes))
+
+        rows.append((event, row))
+        instance.recent_states.add(
+            entity_id,
+            RecentState(
+                None,
+                row["state"],
+                row["last_updated_ts"],
+                row["last_changed_ts"],
+                row["last_reported_ts"],
+                shared_attrs,
+            ),
+        )
+
+    return rows
+
+
+def _state_row_from_event(event: Event[EventStateChangedData]) -> dict[str, Any]:
+    """Create a States row from a state_changed event.
+
+    Mirrors States.from_event.
+    """
+    state = event.data["new_state"]
+    # None state means the state was removed from the state machine
+    if state is None:
+        state_value = None
+        last_updated_ts = event.time_fired_timestamp
+        last_changed_ts = None
+        last_reported_ts = None
+    else:
+        state_value = state.state
+        last_updated_ts = state.last_updated_timestamp
+        if state.last_updated == state.last_changed:
+            last_changed_ts = None
+        else:
+            last_changed_ts = state.last_changed_timestamp
+        if state.last_updated == state.last_reported:
+            last_reported_ts = None
+        else:
+            last_reported_ts = state.last_reported_timestamp
+    context = event.context
+    return {
+        "state": state_value,
+        "entity_id": None,
+        "metadata_id": None,
+        "attributes_id": None,
+        "old_state_id": None,
+        "context_id_bin": ulid_to_bytes_or_none(context.id),
+        "context_user_id_bin": uuid_hex_to_bytes_or_none(context.user_id),
+        "context_parent_id_bin": ulid_to_bytes_or_none(context.parent_id),
+        "origin_idx": event.origin.idx,
+        "last_updated_ts": last_updated_ts,
+        "last_changed_ts": last_changed_ts,
+        "last_reported_ts": last_reported_ts,
+    }
+
+
+def _insert_states(
+    instance: Recorder,
+    session: Session,
+    rows: list[tuple[Event[EventStateChangedData], dict[str, Any] | None]],
+) -> None:
+    """Link the old states and insert the States rows.
+
+    The rows are inserted in runs where every entity_id appears at
+    most once, so the state_id of a row is known before the next
+    state of the same entity links to it.
+    """
+    states_manager = instance.states_manager
+    batch: list[dict[str, Any]] = []
+    batch_entity_ids: list[str | None] = []
+    seen: set[str] = set()
+    for event, row in rows:
+        entity_id = event.data["entity_id"]
+        if entity_id in seen:
+            _insert_states_batch(instance, session, batch, batch_entity_ids)
+            batch = []
+            batch_entity_ids = []
+            seen.clear()
+
+        old_state = event.data["old_state"]
+        old_state_id: int | None = None
+        if pending_state := states_manager.pop_pending(entity_id):
+            # Added by the ORM path and flushed before we got here
+            old_state_id = pending_state.state_id
+            if old_state:
+                pending_state.last_reported_ts = old_state.last_reported_timestamp
+        elif (old_state_id := states_manager.pop_pending_id(entity_id)) or (
+            old_state_id := states_manager.pop_committed(entity_id)
+        ):
+            if old_state:
+                states_manager.update_pending_last_reported(
+                    old_state_id, old_state.last_reported_timestamp
+                )
+        if row is None:
+            # Not recorded, the next state is not linked to the previous one
+            continue
+
+        seen.add(entity_id)
+        row["old_state_id"] = old_state_id
+        batch.append(row)
+        # A removed entity has no state to link the next state to
+        batch_entity_ids.append(None if row["state"] is None else entity_id)
+
+    if batch:
+        _insert_states_batch(instance, session, batch, batch_entity_ids)
+
+
+def _insert_states_batch(
+    instance: Recorder,
+    session: Session,
+    batch: list[dict[str, Any]],
+    batch_entity_ids: list[str | None],
+) -> None:
+    """Insert a batch of States rows and remember their state_ids."""
+    states_manager = instance.states_manager
+    state_ids = session.scalars(
+        insert(States).returning(States.state_id, sort_by_parameter_order=True),
+        batch,
+    )
+    for entity_id, state_id in zip(batch_entity_ids, state_ids, strict=True):
+        if entity_id is not None:
+            states_manager.add_pending_id(entity_id, state_id)
@@ -50,6 +50,7 @@ from homeassistant.util.enum import try_parse_enum
 from homeassistant.util.event_type import EventType
 
 from . import migration, statistics
+from .bulk_write import BULK_WRITE_MAX_EVENTS, write_events_in_bulk
 from .const import (
     DB_WORKER_PREFIX,
     DOMAIN,
@@ -87,7 +88,9 @@ from .migration import (
 )
 from .models import DatabaseEngine, StatisticData, StatisticMetaData, UnsupportedDialect
 from .pool import POOL_SIZE, MutexPool, RecorderPool
+from .purge import PurgeProgress
 from .queries import get_migration_changes
+from .recent_states import RecentState, RecentStatesBuffer
 from .table_managers.event_data import EventDataManager
 from .table_managers.event_types import EventTypeManager
 from .table_managers.recorder_runs import RecorderRunsManager
@@ -98,6 +101,7 @@ from .table_managers.statistics_meta import StatisticsMetaManager
 from .tasks import (
     AdjustLRUSizeTask,
     AdjustStatisticsTask,
+    BulkWriteEventsTask,
     ChangeStatisticsUnitTask,
     ClearStatisticsTask,
     CommitTask,
@@ -173,6 +177,7 @@ class Recorder(threading.Thread):
         db_retry_wait: int,
         entity_filter: Callable[[str], bool] | None,
         exclude_event_types: set[EventType[Any] | str],
+        bulk_write: bool = False,
     ) -> None:
         """Initialize the recorder."""
         threading.Thread.__init__(self, name="Recorder")
@@ -186,6 +191,7 @@ class Recorder(threading.Thread):
         self.is_running: bool = False
         self._hass_started: asyncio.Future[object] = hass.loop.create_future()
         self.commit_interval = commit_interval
+        self.bulk_write = bulk_write
         self._queue: queue.SimpleQueue[RecorderTask | Event] = queue.SimpleQueue()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -220,6 +226,11 @@ class Recorder(threading.Thread):
         self.states_meta_manager = StatesMetaManager(self)
         self.state_attributes_manager = StateAttributesManager(self)
         self.statistics_meta_manager = StatisticsMetaManager(self)
+        # States added to the event session which are not committed yet,
+        # these are merged into the history queries
+        self.recent_states = RecentStatesBuffer()
+        # Progress of the running or the last purge
+        self.purge_progress: PurgeProgress | None = None
 
         self.event_session: Session | None = None
         self._get_session: Callable[[], Session] | None = None
@@ -841,9 +852,60 @@ class Recorder(threading.Thread):
         del startup_task_or_events
 
         self.stop_requested = False
+        if self.bulk_write and self._bulk_write_supported():
+            self._run_bulk_event_loop()
+            return
         while not self.stop_requested:
             self._guarded_process_one_task_or_event_or_recover(queue_.get())
 
+    def _bulk_write_supported(self) -> bool:
+        """Return if the database supports the bulk write mode.
+
+        The bulk write mode needs the state_ids of a multi-row INSERT
+        in parameter order to link the old states.
+        """
+        assert self.engine is not None
+        if self.engine.dialect.insert_executemany_returning_sort_by_parameter_order:
+            return True
+        _LOGGER.warning(
+            "The database does not support returning ids from multi-row inserts, "
+            "bulk write mode is disabled"
+        )
+        return False
+
+    def _run_bulk_event_loop(self) -> None:
+        """Run the event loop for the recorder in bulk write mode.
+
+        Events are drained from the queue in chunks of up to
+        BULK_WRITE_MAX_EVENTS and written with multi-row INSERTs.
+        A task ends the chunk and is processed after it to keep
+        the order of the queue.
+        """
+        queue_ = self._queue
+        while not self.stop_requested:
+            task_or_event = queue_.get()
+            if type(task_or_event) is not Event:
+                self._guarded_process_one_task_or_event_or_recover(task_or_event)
+                continue
+            events: list[Event[Any]] = [task_or_event]
+            next_task: RecorderTask | None = None
+            while len(events) < BULK_WRITE_MAX_EVENTS:
+                try:
+                    task_or_event = queue_.get_nowait()
+                except queue.Empty:
+                    break
+                if type(task_or_event) is not Event:
+                    if TYPE_CHECKING:
+                        assert isinstance(task_or_event, RecorderTask)
+                    next_task = task_or_event
+                    break
+                events.append(task_or_event)
+            self._guarded_process_one_task_or_event_or_recover(
+                BulkWriteEventsTask(events)
+            )
+            if next_task is not None:
+                self._guarded_process_one_task_or_event_or_recover(next_task)
+
     def _pre_process_startup_events(
         self, startup_task_or_events: list[RecorderTask | Event[Any]]
     ) -> None:
@@ -1033,6 +1095,28 @@ class Recorder(threading.Thread):
         if not self.commit_interval:
             self._commit_event_session_or_retry()
 
+    def _process_events_in_bulk(self, events: list[Event[Any]]) -> None:
+        """Process a chunk of events into the session with multi-row INSERTs."""
+        if not self.enabled:
+            return
+        assert self.event_session is not None
+        self._event_session_has_pending_writes = True
+        try:
+            write_events_in_bulk(self, self.event_session, events)
+        except SQLAlchemyError:
+            # One bad event must not discard the whole chunk
+            _LOGGER.exception(
+                "Error writing %s events in bulk, writing them one at a time",
+                len(events),
+            )
+            self._reopen_event_session()
+            for event in events:
+                self._guarded_process_one_task_or_event_or_recover(event)
+            return
+        # Commit if the commit interval is zero
+        if not self.commit_interval:
+            self._commit_event_session_or_retry()
+
     def _process_non_state_changed_event_into_session(self, event: Event) -> None:
         """Process any event into the session except state changed."""
         session = self.event_session
@@ -1161,6 +1245,20 @@ class Recorder(threading.Thread):
             dbstate.state_attributes = dbstate_attributes
 
         self._add_to_session(session, dbstate)
+        if TYPE_CHECKING:
+            # Always set by States.from_event
+            assert dbstate.last_updated_ts is not None
+        self.recent_states.add(
+            entity_id,
+            RecentState(
+                None,
+                dbstate.state,
+                dbstate.last_updated_ts,
+                dbstate.last_changed_ts,
+                dbstate.last_reported_ts,
+                shared_attrs,
+            ),
+        )
 
     def _handle_database_error(self, err: Exception, *, setup_run: bool) -> bool:
         """Handle a database error that may result in moving away the corrupt db."""
@@ -1224,6 +1322,7 @@ class Recorder(threading.Thread):
                     ],
                 )
         session.commit()
+        self.recent_states.clear()
 
         self._event_session_has_pending_writes = False
         # We just committed the state attributes to the database
@@ -1257,6 +1356,7 @@ class Recorder(threading.Thread):
 
     def _close_event_session(self) -> None:
         """Close the event session."""
+        self.recent_states.clear()
         self.states_manager.reset()
         self.state_attributes_manager.reset()
         self.event_data_manager.reset()
@@ -37,6 +37,7 @@ from ..models import (
     process_timestamp,
     row_to_compressed_state,
 )
+from ..recent_states import RecentState
 from ..util import execute_stmt_lambda_element, session_scope
 from .const import (
     LAST_CHANGED_KEY,
@@ -232,12 +233,34 @@ def get_significant_states_with_session(
     entity_id_to_metadata_id: dict[str, int | None] | None = None
     metadata_ids_in_significant_domains: list[int] = []
     instance = get_instance(hass)
+    start_time_ts = dt_util.utc_to_timestamp(start_time)
+    end_time_ts = datetime_to_timestamp_or_none(end_time)
+    # The states that are not committed yet are read before the database
+    # so a commit in between can only cause duplicates, which are skipped
+    recent_states = _get_recent_states(
+        instance.recent_states.get_states(entity_ids),
+        start_time_ts,
+        end_time_ts,
+        significant_changes_only,
+        no_attributes,
+    )
     if not (
         entity_id_to_metadata_id := instance.states_meta_manager.get_many(
             entity_ids, session, False
         )
     ) or not (possible_metadata_ids := extract_metadata_ids(entity_id_to_metadata_id)):
-        return {}
+        if not recent_states:
+            return {}
+        return _sorted_states_to_dict(
+            (),
+            None,
+            entity_ids,
+            entity_id_to_metadata_id or {},
+            minimal_response,
+            compressed_state_format,
+            no_attributes=no_attributes,
+            recent_states=recent_states,
+        )
     metadata_ids = possible_metadata_ids
     if significant_changes_only:
         metadata_ids_in_significant_domains = [
@@ -251,8 +274,6 @@ def get_significant_states_with_session(
         run_start_ts := _get_run_start_ts_for_utc_point_in_time(hass, start_time)
     ):
         include_start_time_state = False
-    start_time_ts = dt_util.utc_to_timestamp(start_time)
-    end_time_ts = datetime_to_timestamp_or_none(end_time)
     single_metadata_id = metadata_ids[0] if len(metadata_ids) == 1 else None
     stmt = lambda_stmt(
         lambda: _significant_states_stmt(
@@ -283,9 +304,69 @@ def get_significant_states_with_session(
         minimal_response,
         compressed_state_format,
         no_attributes=no_attributes,
+        recent_states=recent_states,
     )
 
 
+def _get_recent_states(
+    buffered_states: dict[str, list[RecentState]],
+    start_time_ts: float,
+    end_time_ts: float | None,
+    significant_changes_only: bool,
+    no_attributes: bool,
+) -> dict[str, list[RecentState]]:
+    """Filter the states that are not committed yet like the database query."""
+    recent_states: dict[str, list[RecentState]] = {}
+    for entity_id, states in buffered_states.items():
+        significant_domain = split_entity_id(entity_id)[0] in SIGNIFICANT_DOMAINS
+        if rows := [
+            state._replace(
+                last_changed_ts=None
+                if significant_changes_only
+                else state.last_changed_ts,
+                last_reported_ts=None,
+                attributes=None if no_attributes else state.attributes,
+            )
+            for state in states
+            if state.last_updated_ts > start_time_ts
+            and (not end_time_ts or state.last_updated_ts < end_time_ts)
+            and (
+                not significant_changes_only
+                or significant_domain
+                or state.last_changed_ts is None
+            )
+        ]:
+            recent_states[entity_id] = rows
+    return recent_states
+
+
+def _merge_recent_states(
+    states_iter: Iterable[tuple[str, Iterator[Row]]],
+    recent_states: dict[str, list[RecentState]],
+) -> Iterator[tuple[str, Iterator[Row]]]:
+    """Append the states that are not committed yet to the database rows.
+
+    The recent states have the same fields as the rows. Recent states
+    that were committed while the database was queried are skipped.
+    """
+    last_updated_ts_idx = _FIELD_MAP["last_updated_ts"]
+    recent_states = dict(recent_states)
+    for entity_id, group in states_iter:
+        if (entity_recent_states := recent_states.pop(entity_id, None)) is None:
+            yield entity_id, group
+            continue
+        rows: list[Any] = list(group)
+        last_updated_ts = (rows[-1][last_updated_ts_idx] or 0) if rows else 0
+        rows.extend(
+            state
+            for state in entity_recent_states
+            if state.last_updated_ts > last_updated_ts
+        )
+        yield entity_id, iter(rows)
+    for entity_id, entity_recent_states in recent_states.items():
+        yield entity_id, iter(cast(list[Row], entity_recent_states))
+
+
 def get_full_significant_states_with_session(
     hass: HomeAssistant,
     session: Session,
@@ -680,6 +761,7 @@ def _sorted_states_to_dict(
     compressed_state_format: bool = False,
     descending: bool = False,
     no_attributes: bool = False,
+    recent_states: dict[str, list[RecentState]] | None = None,
 ) -> dict[str, list[State | dict[str, Any]]]:
     """Convert SQL results into JSON friendly data structure.
 
@@ -688,6 +770,9 @@ def _sorted_states_to_dict(
 
     States must be sorted by entity_id and last_updated
 
+    The recent states, which are not committed to the database yet,
+    are appended to the states of their entity.
+
     We also need to go back and create a synthetic zero data point for
     each list of states, otherwise our graphs won't start on the Y
     axis correctly.
@@ -715,22 +800,23 @@ def _sorted_states_to_dict(
         v: k for k, v in entity_id_to_metadata_id.items() if v is not None
     }
     # Get the states at the start time
+    states_iter: Iterable[tuple[str, Iterator[Row]]]
     if len(entity_ids) == 1:
-        metadata_id = entity_id_to_metadata_id[entity_ids[0]]
-        assert metadata_id is not None  # should not be possible if we got here
-        states_iter: Iterable[tuple[int, Iterator[Row]]] = (
-            (metadata_id, iter(states)),
-        )
+        states_iter = ((entity_ids[0], iter(states)),)
     else:
         key_func = itemgetter(field_map["metadata_id"])
-        states_iter = groupby(states, key_func)
+        states_iter = (
+            (metadata_id_to_entity_id[metadata_id], group)
+            for metadata_id, group in groupby(states, key_func)
+        )
+    if recent_states:
+        states_iter = _merge_recent_states(states_iter, recent_states)
 
     state_idx = field_map["state"]
     last_updated_ts_idx = field_map["last_updated_ts"]
 
     # Append all changes to it
-    for metadata_id, group in states_iter:
-        entity_id = metadata_id_to_entity_id[metadata_id]
+    for entity_id, group in states_iter:
         attr_cache: dict[str, dict[str, Any]] = {}
         ent_results = result[entity_id]
         if (
@@ -7,10 +7,11 @@ from datetime import datetime
 from itertools import zip_longest
 import logging
 import time
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any
 
 from sqlalchemy.orm.session import Session
 
+from homeassistant.util import dt as dt_util
 from homeassistant.util.collection import chunked_or_all
 
 from .db_schema import Events, States, StatesMeta
@@ -37,6 +38,7 @@ from .queries import (
     find_legacy_detached_states_and_attributes_to_purge,
     find_legacy_event_state_and_attributes_and_data_ids_to_purge,
     find_legacy_row,
+    find_oldest_state_ts,
     find_short_term_statistics_to_purge,
     find_states_to_purge,
     find_statistics_runs_to_purge,
@@ -53,6 +55,113 @@ _LOGGER = logging.getLogger(__name__)
 DEFAULT_STATES_BATCHES_PER_PURGE = 20  # We expect ~95% de-dupe rate
 DEFAULT_EVENTS_BATCHES_PER_PURGE = 15  # We expect ~92% de-dupe rate
 
+# The events queued while a purge task runs are only committed after it,
+# the batch sizes are adapted so a purge task takes about this long
+PURGE_TASK_TARGET_TIME = 1.0
+# Maximum factor the batch sizes grow by after a fast purge task
+PURGE_BATCH_MAX_GROWTH = 2.0
+
+
+class PurgeProgress:
+    """Progress of a purge that runs as multiple purge tasks.
+
+    The progress is updated in the recorder thread and read
+    from the event loop, it only holds simple values.
+    """
+
+    def __init__(self, purge_before: datetime) -> None:
+        """Initialize the progress."""
+        self.purge_before = purge_before
+        self.started = dt_util.utcnow()
+        self.finished: datetime | None = None
+        self._start_time = time.monotonic()
+        self._end_time: float | None = None
+        self.tasks = 0
+        self.states_deleted = 0
+        self.events_deleted = 0
+        self.states_batch_size = DEFAULT_STATES_BATCHES_PER_PURGE
+        self.events_batch_size = DEFAULT_EVENTS_BATCHES_PER_PURGE
+        self.last_task_duration: float | None = None
+        self._first_oldest_state_ts: float | None = None
+        self._oldest_state_ts: float | None = None
+
+    def record_oldest_state(self, oldest_state_ts: float | None) -> None:
+        """Record the timestamp of the oldest state that is left."""
+        if oldest_state_ts is None:
+            return
+        if self._first_oldest_state_ts is None:
+            self._first_oldest_state_ts = oldest_state_ts
+        self._oldest_state_ts = oldest_state_ts
+
+    def record_task(self, duration: float, finished: bool) -> None:
+        """Record a purge task and adapt the batch sizes to its duration."""
+        self.tasks += 1
+        self.last_task_duration = duration
+        if finished:
+            self.finished = dt_util.utcnow()
+            self._end_time = time.monotonic()
+            return
+        scale = min(
+            PURGE_TASK_TARGET_TIME / max(duration, 0.001), PURGE_BATCH_MAX_GROWTH
+        )
+        self.states_batch_size = max(
+            1,
+            min(
+                round(self.states_batch_size * scale),
+                DEFAULT_STATES_BATCHES_PER_PURGE,
+            ),
+        )
+        self.events_batch_size = max(
+            1,
+            min(
+                round(self.events_batch_size * scale),
+                DEFAULT_EVENTS_BATCHES_PER_PURGE,
+            ),
+        )
+
+    @property
+    def rate(self) -> float:
+        """Return the number of states and events deleted per second."""
+        end_time = self._end_time or time.monotonic()
+        if (elapsed := end_time - self._start_time) <= 0:
+            return 0.0
+        return (self.states_deleted + self.events_deleted) / elapsed
+
+    @property
+    def estimated_states_remaining(self) -> int | None:
+        """Return the estimated number of states that are left to purge.
+
+        The oldest rows are purged first, so the number of states
+        deleted per second of history is extrapolated to the history
+        that is left before purge_before.
+        """
+        if self.finished:
+            return 0
+        if (
+            (first := self._first_oldest_state_ts) is None
+            or (oldest := self._oldest_state_ts) is None
+            or oldest <= first
+        ):
+            return None
+        remaining = max(self.purge_before.timestamp() - oldest, 0.0)
+        return round(self.states_deleted * remaining / (oldest - first))
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the progress as a dict."""
+        return {
+            "purge_before": self.purge_before.isoformat(),
+            "started": self.started.isoformat(),
+            "finished": self.finished.isoformat() if self.finished else None,
+            "tasks": self.tasks,
+            "states_deleted": self.states_deleted,
+            "events_deleted": self.events_deleted,
+            "rate": self.rate,
+            "estimated_states_remaining": self.estimated_states_remaining,
+            "states_batch_size": self.states_batch_size,
+            "events_batch_size": self.events_batch_size,
+            "last_task_duration": self.last_task_duration,
+        }
+
 
 @retryable_database_job("purge")
 def purge_old_data(
@@ -62,6 +171,7 @@ def purge_old_data(
     apply_filter: bool = False,
     events_batch_size: int = DEFAULT_EVENTS_BATCHES_PER_PURGE,
     states_batch_size: int = DEFAULT_STATES_BATCHES_PER_PURGE,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge events and states older than purge_before.
 
@@ -72,6 +182,10 @@ def purge_old_data(
         purge_before.isoformat(sep=" ", timespec="seconds"),
     )
     with session_scope(session=instance.get_session()) as session:
+        if progress is not None:
+            progress.record_oldest_state(
+                session.execute(find_oldest_state_ts()).scalar()
+            )
         # Purge a max of max_bind_vars, based on the oldest states or events record
         has_more_to_purge = False
         if instance.use_legacy_events_index and _purging_legacy_format(session):
@@ -79,7 +193,9 @@ def purge_old_data(
                 "Purge running in legacy format as there are states with event_id"
                 " remaining"
             )
-            has_more_to_purge |= _purge_legacy_format(instance, session, purge_before)
+            has_more_to_purge |= _purge_legacy_format(
+                instance, session, purge_before, progress
+            )
         else:
             _LOGGER.debug(
                 "Purge running in new format as there are NO states with event_id"
@@ -87,10 +203,10 @@ def purge_old_data(
             )
             # Once we are done purging legacy rows, we use the new method
             has_more_to_purge |= _purge_states_and_attributes_ids(
-                instance, session, states_batch_size, purge_before
+                instance, session, states_batch_size, purge_before, progress
             )
             has_more_to_purge |= _purge_events_and_data_ids(
-                instance, session, events_batch_size, purge_before
+                instance, session, events_batch_size, purge_before, progress
             )
 
         statistics_runs = _select_statistics_runs_to_purge(
@@ -134,7 +250,10 @@ def _purging_legacy_format(session: Session) -> bool:
 
 
 def _purge_legacy_format(
-    instance: Recorder, session: Session, purge_before: datetime
+    instance: Recorder,
+    session: Session,
+    purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge rows that are still linked by the event_ids."""
     (
@@ -149,6 +268,9 @@ def _purge_legacy_format(
     _purge_unused_attributes_ids(instance, session, attributes_ids)
     _purge_event_ids(session, event_ids)
     _purge_unused_data_ids(instance, session, data_ids)
+    if progress is not None:
+        progress.states_deleted += len(state_ids)
+        progress.events_deleted += len(event_ids)
 
     # The database may still have some rows that have an event_id but are not
     # linked to any event. These rows are not linked to any event because the
@@ -163,6 +285,8 @@ def _purge_legacy_format(
     )
     _purge_state_ids(instance, session, detached_state_ids)
     _purge_unused_attributes_ids(instance, session, detached_attributes_ids)
+    if progress is not None:
+        progress.states_deleted += len(detached_state_ids)
     return bool(
         event_ids
         or state_ids
@@ -178,6 +302,7 @@ def _purge_states_and_attributes_ids(
     session: Session,
     states_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -201,6 +326,8 @@ def _purge_states_and_attributes_ids(
             break
         _purge_state_ids(instance, session, state_ids)
         attributes_ids_batch = attributes_ids_batch | attributes_ids
+        if progress is not None:
+            progress.states_deleted += len(state_ids)
 
     _purge_unused_attributes_ids(instance, session, attributes_ids_batch)
     _LOGGER.debug(
@@ -215,6 +342,7 @@ def _purge_events_and_data_ids(
     session: Session,
     events_batch_size: int,
     purge_before: datetime,
+    progress: PurgeProgress | None = None,
 ) -> bool:
     """Purge states and linked attributes id in a batch.
 
@@ -236,6 +364,8 @@ def _purge_events_and_data_ids(
             break
         _purge_event_ids(session, event_ids)
         data_ids_batch = data_ids_batch | data_ids
+        if progress is not None:
+            progress.events_deleted += len(event_ids)
 
     _purge_unused_data_ids(instance, session, data_ids_batch)
     _LOGGER.debug(
@@ -0,0 +1,94 @@
+"""Buffer the states that are not committed to the database yet."""
+
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterable
+import logging
+import threading
+from typing import NamedTuple
+
+# The maximum number of states to keep in the buffer
+RECENT_STATES_MAX_SIZE = 20000
+# States older than this are dropped even if they are not committed yet,
+# which only happens when the database is not reachable for a while
+RECENT_STATES_MAX_AGE = 600
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class RecentState(NamedTuple):
+    """A state that is not committed to the database yet.
+
+    The fields match the rows of the history queries.
+    """
+
+    metadata_id: int | None
+    state: str | None
+    last_updated_ts: float
+    last_changed_ts: float | None
+    last_reported_ts: float | None
+    attributes: str | None
+
+
+class RecentStatesBuffer:
+    """Time ordered buffer of the states that are not committed yet.
+
+    States are added by the recorder thread when they are added to the
+    event session and the buffer is cleared once the session is committed
+    or rolled back. The history queries read it from the database
+    executor threads.
+    """
+
+    def __init__(
+        self,
+        max_size: int = RECENT_STATES_MAX_SIZE,
+        max_age: float = RECENT_STATES_MAX_AGE,
+    ) -> None:
+        """Initialize the buffer."""
+        self._states: deque[tuple[str, RecentState]] = deque(maxlen=max_size)
+        self._max_size = max_size
+        self._max_age = max_age
+        self._lock = threading.Lock()
+        self._evicting = False
+
+    def __len__(self) -> int:
+        """Return the number of buffered states."""
+        return len(self._states)
+
+    def add(self, entity_id: str, state: RecentState) -> None:
+        """Add a state that was added to the event session."""
+        oldest_ts = state.last_updated_ts - self._max_age
+        with self._lock:
+            states = self._states
+            if len(states) == self._max_size and not self._evicting:
+                # Logged once until the session is committed or closed
+                self._evicting = True
+                _LOGGER.warning(
+                    "More than %s states are not committed to the database yet, "
+                    "the oldest ones are missing from the history until they "
+                    "are committed",
+                    self._max_size,
+                )
+            states.append((entity_id, state))
+            while states[0][1].last_updated_ts < oldest_ts:
+                states.popleft()
+
+    def clear(self) -> None:
+        """Clear the buffer after the event session was committed or closed."""
+        with self._lock:
+            self._states.clear()
+            self._evicting = False
+
+    def get_states(self, entity_ids: Iterable[str]) -> dict[str, list[RecentState]]:
+        """Return the buffered states of the entities in time order."""
+        wanted = set(entity_ids)
+        with self._lock:
+            if not self._states:
+                return {}
+            buffered = list(self._states)
+        states: dict[str, list[RecentState]] = {}
+        for entity_id, state in buffered:
+            if entity_id in wanted:
+                states.setdefault(entity_id, []).append(state)
+        return states
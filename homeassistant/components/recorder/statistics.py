@@ -7,6 +7,7 @@ from collections.abc import Callable, Iterable, Sequence
 import dataclasses
 from datetime import datetime, timedelta
 from functools import lru_cache, partial
+from importlib.util import find_spec
 from itertools import chain, groupby
 import logging
 from operator import itemgetter
@@ -80,7 +81,12 @@ from .util import (
     session_scope,
 )
 
+# NumPy is only imported when the statistics are reduced with it
+HAS_NUMPY = find_spec("numpy") is not None
+
 if TYPE_CHECKING:
+    import numpy as np
+
     from . import Recorder
 
 QUERY_STATISTICS = (
@@ -908,6 +914,19 @@ def _reduce_statistics(
     types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
 ) -> dict[str, list[StatisticsRow]]:
     """Reduce hourly statistics to daily or monthly statistics."""
+    if HAS_NUMPY:
+        return _reduce_statistics_numpy(stats, period_start_end, types)
+    return _reduce_statistics_loop(stats, same_period, period_start_end, period, types)
+
+
+def _reduce_statistics_loop(
+    stats: dict[str, list[StatisticsRow]],
+    same_period: Callable[[float, float], bool],
+    period_start_end: Callable[[float], tuple[float, float]],
+    period: timedelta,
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily or monthly statistics row by row."""
     result: dict[str, list[StatisticsRow]] = defaultdict(list)
     period_seconds = period.total_seconds()
     _want_mean = "mean" in types
@@ -959,6 +978,106 @@ def _reduce_statistics(
     return result
 
 
+def _reduce_statistics_numpy(
+    stats: dict[str, list[StatisticsRow]],
+    period_start_end: Callable[[float], tuple[float, float]],
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]],
+) -> dict[str, list[StatisticsRow]]:
+    """Reduce hourly statistics to daily or monthly statistics with NumPy.
+
+    The period boundaries are calculated once for all statistic ids and the
+    rows are bucketed with a binary search, the mean, min and max of each
+    period are calculated with ufunc reductions.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    result: dict[str, list[StatisticsRow]] = defaultdict(list)
+    if not (stats := {key: value for key, value in stats.items() if value}):
+        return result
+    _want_mean = "mean" in types
+    _want_min = "min" in types
+    _want_max = "max" in types
+    _want_last_reset = "last_reset" in types
+    _want_state = "state" in types
+    _want_sum = "sum" in types
+
+    # Precompute the boundaries of the periods covering all statistics
+    first_start = min(stat_list[0]["start"] for stat_list in stats.values())
+    last_start = max(stat_list[-1]["start"] for stat_list in stats.values())
+    periods = [period_start_end(first_start)]
+    while periods[-1][1] <= last_start:
+        periods.append(period_start_end(periods[-1][1]))
+    period_ends = np.array([end for _, end in periods])
+
+    for statistic_id, stat_list in stats.items():
+        num_rows = len(stat_list)
+        starts = np.array([statistic["start"] for statistic in stat_list], float)
+        # The index of the period of each row
+        period_idxs = np.searchsorted(period_ends, starts, side="right")
+        # The index of the first row of each period
+        first_idxs = np.flatnonzero(np.diff(period_idxs, prepend=-1))
+        last_idxs = np.append(first_idxs[1:] - 1, num_rows - 1).tolist()
+
+        means: list[float | None] | None = None
+        mins: list[float | None] | None = None
+        maxes: list[float | None] | None = None
+        if _want_mean:
+            means = _reduce_column_numpy(stat_list, "mean", first_idxs)
+        if _want_min:
+            mins = _reduce_column_numpy(stat_list, "min", first_idxs)
+        if _want_max:
+            maxes = _reduce_column_numpy(stat_list, "max", first_idxs)
+
+        rows = result[statistic_id]
+        for idx, period_idx in enumerate(period_idxs[first_idxs].tolist()):
+            start, end = periods[period_idx]
+            row: StatisticsRow = {"start": start, "end": end}
+            if means is not None:
+                row["mean"] = means[idx]
+            if mins is not None:
+                row["min"] = mins[idx]
+            if maxes is not None:
+                row["max"] = maxes[idx]
+            # The last statistic of the period
+            last_stat = stat_list[last_idxs[idx]]
+            if _want_last_reset:
+                row["last_reset"] = last_stat.get("last_reset")
+            if _want_state:
+                row["state"] = last_stat.get("state")
+            if _want_sum:
+                row["sum"] = last_stat["sum"]
+            rows.append(row)
+
+    return result
+
+
+def _reduce_column_numpy(
+    stat_list: list[StatisticsRow],
+    column: Literal["max", "mean", "min"],
+    first_idxs: np.ndarray,
+) -> list[float | None]:
+    """Reduce a column of the statistics per period.
+
+    Missing values are ignored, the result of a period without values is None.
+    """
+    import numpy as np  # pylint: disable=import-outside-toplevel
+
+    values = np.array([statistic.get(column) for statistic in stat_list], float)
+    present = ~np.isnan(values)
+    counts = np.add.reduceat(present, first_idxs, dtype=np.intp)
+    if column == "mean":
+        reduced = np.add.reduceat(np.where(present, values, 0), first_idxs)
+        reduced /= np.maximum(counts, 1)
+    elif column == "min":
+        reduced = np.fmin.reduceat(values, first_idxs)
+    else:
+        reduced = np.fmax.reduceat(values, first_idxs)
+    return [
+        value if count else None
+        for value, count in zip(reduced.tolist(), counts.tolist(), strict=True)
+    ]
+
+
 def reduce_day_ts_factory() -> (
     tuple[
         Callable[[float, float], bool],
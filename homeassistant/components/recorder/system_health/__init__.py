@@ -68,8 +68,15 @@ async def system_health_info(hass: HomeAssistant) -> dict[str, Any]:
         db_stats = await instance.async_add_executor_job(
             _get_db_stats, instance, database_name
         )
-        db_runs = {
+        db_runs: dict[str, Any] = {
             "oldest_recorder_run": recorder_runs_manager.first.start,
             "current_recorder_run": recorder_runs_manager.current.start,
         }
+        if (progress := instance.purge_progress) and not progress.finished:
+            db_runs["purge_deleted_rows"] = (
+                progress.states_deleted + progress.events_deleted
+            )
+            db_runs["purge_rate"] = f"{progress.rate:.0f} rows/s"
+            if (remaining := progress.estimated_states_remaining) is not None:
+                db_runs["purge_estimated_states_remaining"] = remaining
     return db_runs | db_stats | db_engine_info
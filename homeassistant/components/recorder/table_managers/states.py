@@ -11,6 +11,7 @@ class StatesManager:
     def __init__(self) -> None:
         """Initialize the states manager for linking old_state_id."""
         self._pending: dict[str, States] = {}
+        self._pending_ids: dict[str, int] = {}
         self._last_committed_id: dict[str, int] = {}
         self._last_reported: dict[int, float] = {}
 
@@ -35,6 +36,25 @@ class StatesManager:
         """
         return self._last_committed_id.pop(entity_id, None)
 
+    def pop_pending_id(self, entity_id: str) -> int | None:
+        """Pop the state_id of a pending state inserted in bulk.
+
+        Pending ids belong to states that were inserted without the ORM
+        and already have a state_id, but are not yet committed.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        return self._pending_ids.pop(entity_id, None)
+
+    def add_pending_id(self, entity_id: str, state_id: int) -> None:
+        """Add the state_id of a pending state inserted in bulk.
+
+        This call is not thread-safe and must be called from the
+        recorder thread.
+        """
+        self._pending_ids[entity_id] = state_id
+
     def add_pending(self, entity_id: str, state: States) -> None:
         """Add a pending state.
 
@@ -63,7 +83,9 @@ class StatesManager:
         """
         for entity_id, db_states in self._pending.items():
             self._last_committed_id[entity_id] = db_states.state_id
+        self._last_committed_id.update(self._pending_ids)
         self._pending.clear()
+        self._pending_ids.clear()
         self._last_reported.clear()
 
     def reset(self) -> None:
@@ -74,6 +96,7 @@ class StatesManager:
         """
         self._last_committed_id.clear()
         self._pending.clear()
+        self._pending_ids.clear()
 
     def evict_purged_state_ids(self, purged_state_ids: set[int]) -> None:
         """Evict purged states from the committed states.
@@ -9,8 +9,10 @@ from dataclasses import dataclass
 from datetime import datetime
 import logging
 import threading
+import time
 from typing import TYPE_CHECKING, Any
 
+from homeassistant.core import Event
 from homeassistant.helpers.typing import UndefinedType
 from homeassistant.util.event_type import EventType
 
@@ -116,10 +118,31 @@ class PurgeTask(RecorderTask):
     apply_filter: bool
 
     def run(self, instance: Recorder) -> None:
-        """Purge the database."""
-        if purge.purge_old_data(
-            instance, self.purge_before, self.repack, self.apply_filter
+        """Purge the database.
+
+        The batch sizes are adapted to the time the previous purge tasks
+        took, so the events queued in the meantime are committed between
+        them without stalling the recorder for long.
+        """
+        progress = instance.purge_progress
+        if (
+            progress is None
+            or progress.finished
+            or progress.purge_before != self.purge_before
         ):
+            progress = instance.purge_progress = purge.PurgeProgress(self.purge_before)
+        start = time.monotonic()
+        finished = purge.purge_old_data(
+            instance,
+            self.purge_before,
+            self.repack,
+            self.apply_filter,
+            events_batch_size=progress.events_batch_size,
+            states_batch_size=progress.states_batch_size,
+            progress=progress,
+        )
+        progress.record_task(time.monotonic() - start, finished)
+        if finished:
             with instance.get_session() as session:
                 instance.recorder_runs_manager.load_from_db(session)
             # We always need to do the db cleanups after a purge
@@ -275,6 +298,18 @@ class StopTask(RecorderTask):
         instance.stop_requested = True
 
 
+@dataclass(slots=True)
+class BulkWriteEventsTask(RecorderTask):
+    """Write a chunk of events drained from the queue in bulk."""
+
+    events: list[Event[Any]]
+    commit_before = False
+
+    def run(self, instance: Recorder) -> None:
+        """Handle the task."""
+        instance._process_events_in_bulk(self.events)  # noqa: SLF001
+
+
 @dataclass(slots=True)
 class KeepAliveTask(RecorderTask):
     """A keep alive to be sent."""
@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from collections import defaultdict
 from collections.abc import Iterable
-from enum import StrEnum
 import logging
 from typing import Any
 
@@ -25,35 +24,18 @@ from homeassistant.helpers.entity import (
 )
 from homeassistant.helpers.typing import ConfigType
 
-DOMAIN = "search"
+from .const import DOMAIN, ItemType
+from .graph import ReferenceGraph, async_get_reference_graph
+
 _LOGGER = logging.getLogger(__name__)
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
 
 
-# enum of item types
-class ItemType(StrEnum):
-    """Item types."""
-
-    AREA = "area"
-    AUTOMATION = "automation"
-    AUTOMATION_BLUEPRINT = "automation_blueprint"
-    CONFIG_ENTRY = "config_entry"
-    DEVICE = "device"
-    ENTITY = "entity"
-    FLOOR = "floor"
-    GROUP = "group"
-    INTEGRATION = "integration"
-    LABEL = "label"
-    PERSON = "person"
-    SCENE = "scene"
-    SCRIPT = "script"
-    SCRIPT_BLUEPRINT = "script_blueprint"
-
-
 async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     """Set up the Search component."""
     websocket_api.async_register_command(hass, websocket_search_related)
+    websocket_api.async_register_command(hass, websocket_search_graph_stats)
     return True
 
 
@@ -77,6 +59,18 @@ def websocket_search_related(
     )
 
 
+@websocket_api.websocket_command({vol.Required("type"): "search/graph_stats"})
+@websocket_api.require_admin
+@callback
+def websocket_search_graph_stats(
+    hass: HomeAssistant,
+    connection: websocket_api.ActiveConnection,
+    msg: dict[str, Any],
+) -> None:
+    """Handle the statistics of the reference graph."""
+    connection.send_result(msg["id"], async_get_reference_graph(hass).async_stats())
+
+
 class Searcher:
     """Find related things."""
 
@@ -86,9 +80,11 @@ class Searcher:
         self,
         hass: HomeAssistant,
         entity_sources: dict[str, EntityInfo],
+        graph: ReferenceGraph | None = None,
     ) -> None:
         """Search results."""
         self.hass = hass
+        self._graph = graph or async_get_reference_graph(hass)
         self._area_registry = ar.async_get(hass)
         self._device_registry = dr.async_get(hass)
         self._entity_registry = er.async_get(hass)
@@ -131,11 +127,17 @@ class Searcher:
 
         # Automations referencing this area
         self._add(
-            ItemType.AUTOMATION, automation.automations_with_area(self.hass, area_id)
+            ItemType.AUTOMATION,
+            self._graph.async_referenced_by(
+                ItemType.AUTOMATION, ItemType.AREA, area_id
+            ),
         )
 
         # Scripts referencing this area
-        self._add(ItemType.SCRIPT, script.scripts_with_area(self.hass, area_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._graph.async_referenced_by(ItemType.SCRIPT, ItemType.AREA, area_id),
+        )
 
         # Entity in this area, will extend this with the entities of the devices in this area
         entity_entries = er.async_entries_for_area(self._entity_registry, area_id)
@@ -151,11 +153,18 @@ class Searcher:
             # Automations referencing this device
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_device(self.hass, device.id),
+                self._graph.async_referenced_by(
+                    ItemType.AUTOMATION, ItemType.DEVICE, device.id
+                ),
             )
 
             # Scripts referencing this device
-            self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device.id))
+            self._add(
+                ItemType.SCRIPT,
+                self._graph.async_referenced_by(
+                    ItemType.SCRIPT, ItemType.DEVICE, device.id
+                ),
+            )
 
             # Entities of this device
             for entity_entry in er.async_entries_for_device(
@@ -177,31 +186,41 @@ class Searcher:
             # Automations referencing this entity
             self._add(
                 ItemType.AUTOMATION,
-                automation.automations_with_entity(self.hass, entity_entry.entity_id),
+                self._graph.async_referenced_by(
+                    ItemType.AUTOMATION, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Scripts referencing this entity
             self._add(
                 ItemType.SCRIPT,
-                script.scripts_with_entity(self.hass, entity_entry.entity_id),
+                self._graph.async_referenced_by(
+                    ItemType.SCRIPT, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Groups that have this entity as a member
             self._add(
                 ItemType.GROUP,
-                group.groups_with_entity(self.hass, entity_entry.entity_id),
+                self._graph.async_referenced_by(
+                    ItemType.GROUP, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Persons that use this entity
             self._add(
                 ItemType.PERSON,
-                person.persons_with_entity(self.hass, entity_entry.entity_id),
+                self._graph.async_referenced_by(
+                    ItemType.PERSON, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Scenes that reference this entity
             self._add(
                 ItemType.SCENE,
-                scene.scenes_with_entity(self.hass, entity_entry.entity_id),
+                self._graph.async_referenced_by(
+                    ItemType.SCENE, ItemType.ENTITY, entity_entry.entity_id
+                ),
             )
 
             # Config entries for entities in this area
@@ -273,7 +292,9 @@ class Searcher:
         """Find results for an automation blueprint."""
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_blueprint(self.hass, blueprint_path),
+            self._graph.async_referenced_by(
+                ItemType.AUTOMATION, ItemType.AUTOMATION_BLUEPRINT, blueprint_path
+            ),
         )
 
     @callback
@@ -304,11 +325,18 @@ class Searcher:
         # Automations referencing this device
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_device(self.hass, device_id),
+            self._graph.async_referenced_by(
+                ItemType.AUTOMATION, ItemType.DEVICE, device_id
+            ),
         )
 
         # Scripts referencing this device
-        self._add(ItemType.SCRIPT, script.scripts_with_device(self.hass, device_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._graph.async_referenced_by(
+                ItemType.SCRIPT, ItemType.DEVICE, device_id
+            ),
+        )
 
         # Entities of this device
         for entity_entry in er.async_entries_for_device(
@@ -331,20 +359,38 @@ class Searcher:
         # Automations referencing this entity
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, entity_id),
+            self._graph.async_referenced_by(
+                ItemType.AUTOMATION, ItemType.ENTITY, entity_id
+            ),
         )
 
         # Scripts referencing this entity
-        self._add(ItemType.SCRIPT, script.scripts_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._graph.async_referenced_by(
+                ItemType.SCRIPT, ItemType.ENTITY, entity_id
+            ),
+        )
 
         # Groups that have this entity as a member
-        self._add(ItemType.GROUP, group.groups_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.GROUP,
+            self._graph.async_referenced_by(ItemType.GROUP, ItemType.ENTITY, entity_id),
+        )
 
         # Persons referencing this entity
-        self._add(ItemType.PERSON, person.persons_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.PERSON,
+            self._graph.async_referenced_by(
+                ItemType.PERSON, ItemType.ENTITY, entity_id
+            ),
+        )
 
         # Scenes referencing this entity
-        self._add(ItemType.SCENE, scene.scenes_with_entity(self.hass, entity_id))
+        self._add(
+            ItemType.SCENE,
+            self._graph.async_referenced_by(ItemType.SCENE, ItemType.ENTITY, entity_id),
+        )
 
     @callback
     def _async_search_floor(self, floor_id: str) -> None:
@@ -352,11 +398,16 @@ class Searcher:
         # Automations referencing this floor
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_floor(self.hass, floor_id),
+            self._graph.async_referenced_by(
+                ItemType.AUTOMATION, ItemType.FLOOR, floor_id
+            ),
         )
 
         # Scripts referencing this floor
-        self._add(ItemType.SCRIPT, script.scripts_with_floor(self.hass, floor_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._graph.async_referenced_by(ItemType.SCRIPT, ItemType.FLOOR, floor_id),
+        )
 
         for area_entry in ar.async_entries_for_floor(self._area_registry, floor_id):
             self._add(ItemType.AREA, area_entry.id)
@@ -372,16 +423,26 @@ class Searcher:
         # Automations referencing this group
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, group_entity_id),
+            self._graph.async_referenced_by(
+                ItemType.AUTOMATION, ItemType.ENTITY, group_entity_id
+            ),
         )
 
         # Scripts referencing this group
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, group_entity_id)
+            ItemType.SCRIPT,
+            self._graph.async_referenced_by(
+                ItemType.SCRIPT, ItemType.ENTITY, group_entity_id
+            ),
         )
 
         # Scenes that reference this group
-        self._add(ItemType.SCENE, scene.scenes_with_entity(self.hass, group_entity_id))
+        self._add(
+            ItemType.SCENE,
+            self._graph.async_referenced_by(
+                ItemType.SCENE, ItemType.ENTITY, group_entity_id
+            ),
+        )
 
         # Entities in this group
         for entity_id in group.get_entity_ids(self.hass, group_entity_id):
@@ -412,11 +473,16 @@ class Searcher:
         # Automations referencing this label
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_label(self.hass, label_id),
+            self._graph.async_referenced_by(
+                ItemType.AUTOMATION, ItemType.LABEL, label_id
+            ),
         )
 
         # Scripts referencing this label
-        self._add(ItemType.SCRIPT, script.scripts_with_label(self.hass, label_id))
+        self._add(
+            ItemType.SCRIPT,
+            self._graph.async_referenced_by(ItemType.SCRIPT, ItemType.LABEL, label_id),
+        )
 
     @callback
     def _async_search_person(self, person_entity_id: str) -> None:
@@ -429,12 +495,17 @@ class Searcher:
         # Automations referencing this person
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, person_entity_id),
+            self._graph.async_referenced_by(
+                ItemType.AUTOMATION, ItemType.ENTITY, person_entity_id
+            ),
         )
 
         # Scripts referencing this person
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, person_entity_id)
+            ItemType.SCRIPT,
+            self._graph.async_referenced_by(
+                ItemType.SCRIPT, ItemType.ENTITY, person_entity_id
+            ),
         )
 
         # Add all member entities of this person
@@ -453,12 +524,17 @@ class Searcher:
         # Automations referencing this scene
         self._add(
             ItemType.AUTOMATION,
-            automation.automations_with_entity(self.hass, scene_entity_id),
+            self._graph.async_referenced_by(
+                ItemType.AUTOMATION, ItemType.ENTITY, scene_entity_id
+            ),
         )
 
         # Scripts referencing this scene
         self._add(
-            ItemType.SCRIPT, script.scripts_with_entity(self.hass, scene_entity_id)
+            ItemType.SCRIPT,
+            self._graph.async_referenced_by(
+                ItemType.SCRIPT, ItemType.ENTITY, scene_entity_id
+            ),
         )
 
         # Add all entities in this scene
@@ -530,7 +606,10 @@ class Searcher:
     def _async_search_script_blueprint(self, blueprint_path: str) -> None:
         """Find results for a script blueprint."""
         self._add(
-            ItemType.SCRIPT, script.scripts_with_blueprint(self.hass, blueprint_path)
+            ItemType.SCRIPT,
+            self._graph.async_referenced_by(
+                ItemType.SCRIPT, ItemType.SCRIPT_BLUEPRINT, blueprint_path
+            ),
         )
 
     @callback
@@ -0,0 +1,25 @@
+"""Constants for the Search integration."""
+
+from enum import StrEnum
+
+DOMAIN = "search"
+
+
+# enum of item types
+class ItemType(StrEnum):
+    """Item types."""
+
+    AREA = "area"
+    AUTOMATION = "automation"
+    AUTOMATION_BLUEPRINT = "automation_blueprint"
+    CONFIG_ENTRY = "config_entry"
+    DEVICE = "device"
+    ENTITY = "entity"
+    FLOOR = "floor"
+    GROUP = "group"
+    INTEGRATION = "integration"
+    LABEL = "label"
+    PERSON = "person"
+    SCENE = "scene"
+    SCRIPT = "script"
+    SCRIPT_BLUEPRINT = "script_blueprint"
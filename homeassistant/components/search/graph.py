@@ -0,0 +1,177 @@
+"""Reverse reference graph of the search integration."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+from collections.abc import Callable, Iterable
+from typing import Any
+
+from homeassistant.components import automation, group, person, script
+from homeassistant.components.homeassistant import scene
+from homeassistant.core import Event, EventStateChangedData, HomeAssistant, callback
+from homeassistant.helpers.event import TrackStates, async_track_state_change_filtered
+from homeassistant.util.hass_dict import HassKey
+
+from .const import ItemType
+
+DATA_REFERENCE_GRAPH: HassKey[ReferenceGraph] = HassKey("search_reference_graph")
+
+type _References = dict[ItemType, list[str]]
+
+
+def _blueprint(
+    blueprint_in: Callable[[HomeAssistant, str], str | None],
+) -> Callable[[HomeAssistant, str], list[str]]:
+    """Wrap a blueprint lookup to return a list like the other lookups."""
+
+    def _blueprints_in(hass: HomeAssistant, entity_id: str) -> list[str]:
+        """Return the blueprint of the entity as a list."""
+        if (blueprint_path := blueprint_in(hass, entity_id)) is None:
+            return []
+        return [blueprint_path]
+
+    return _blueprints_in
+
+
+# The items every kind of entity references and how to look them up
+REFERENCES: dict[
+    ItemType, dict[ItemType, Callable[[HomeAssistant, str], Iterable[str]]]
+] = {
+    ItemType.AUTOMATION: {
+        ItemType.AREA: automation.areas_in_automation,
+        ItemType.AUTOMATION_BLUEPRINT: _blueprint(automation.blueprint_in_automation),
+        ItemType.DEVICE: automation.devices_in_automation,
+        ItemType.ENTITY: automation.entities_in_automation,
+        ItemType.FLOOR: automation.floors_in_automation,
+        ItemType.LABEL: automation.labels_in_automation,
+    },
+    ItemType.GROUP: {ItemType.ENTITY: group.get_entity_ids},
+    ItemType.PERSON: {ItemType.ENTITY: person.entities_in_person},
+    ItemType.SCENE: {ItemType.ENTITY: scene.entities_in_scene},
+    ItemType.SCRIPT: {
+        ItemType.AREA: script.areas_in_script,
+        ItemType.DEVICE: script.devices_in_script,
+        ItemType.ENTITY: script.entities_in_script,
+        ItemType.FLOOR: script.floors_in_script,
+        ItemType.LABEL: script.labels_in_script,
+        ItemType.SCRIPT_BLUEPRINT: _blueprint(script.blueprint_in_script),
+    },
+}
+
+
+class ReferenceGraph:
+    """Graph of the items referenced by automations, scripts, scenes, groups and persons.
+
+    The references of an entity are looked up when its state is added,
+    removed or its attributes change, which covers the reloads of the
+    configuration, so finding what references an item is a lookup instead
+    of a walk over all the entities. Relations between entities, devices,
+    areas and the other registry items are looked up in the registries,
+    which are indexed already.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the graph."""
+        self.hass = hass
+        self._references: dict[ItemType, dict[str, _References]] = {
+            item_type: {} for item_type in REFERENCES
+        }
+        self._referenced_by: dict[
+            tuple[ItemType, ItemType], defaultdict[str, set[str]]
+        ] = {
+            (item_type, referenced_type): defaultdict(set)
+            for item_type, lookups in REFERENCES.items()
+            for referenced_type in lookups
+        }
+        self.updates = 0
+
+    @callback
+    def async_setup(self) -> None:
+        """Build the graph and keep it up to date."""
+        for state in self.hass.states.async_all(REFERENCES):
+            self._async_update(state.entity_id)
+        async_track_state_change_filtered(
+            self.hass, TrackStates(False, set(), set(REFERENCES)), self._async_changed
+        )
+
+    @callback
+    def _async_changed(self, event: Event[EventStateChangedData]) -> None:
+        """Update the references of an entity when its state changed."""
+        old_state = event.data["old_state"]
+        new_state = event.data["new_state"]
+        # Attributes are shared between the states if they did not change
+        if (
+            old_state is not None
+            and new_state is not None
+            and old_state.attributes is new_state.attributes
+        ):
+            return
+        self._async_update(event.data["entity_id"], new_state is not None)
+
+    @callback
+    def _async_update(self, entity_id: str, exists: bool = True) -> None:
+        """Update the references of an entity."""
+        item_type = ItemType(entity_id.partition(".")[0])
+        entity_references = self._references[item_type]
+        old_references = entity_references.pop(entity_id, {})
+        new_references: _References = {}
+        if exists:
+            for referenced_type, lookup in REFERENCES[item_type].items():
+                if referenced_ids := list(lookup(self.hass, entity_id)):
+                    new_references[referenced_type] = referenced_ids
+            if new_references:
+                entity_references[entity_id] = new_references
+        if not old_references and not new_references:
+            return
+        self.updates += 1
+        for referenced_type, referenced_ids in old_references.items():
+            referenced_by = self._referenced_by[item_type, referenced_type]
+            for referenced_id in referenced_ids:
+                referrers = referenced_by[referenced_id]
+                referrers.discard(entity_id)
+                if not referrers:
+                    del referenced_by[referenced_id]
+        for referenced_type, referenced_ids in new_references.items():
+            referenced_by = self._referenced_by[item_type, referenced_type]
+            for referenced_id in referenced_ids:
+                referenced_by[referenced_id].add(entity_id)
+
+    @callback
+    def async_referenced_by(
+        self, item_type: ItemType, referenced_type: ItemType, referenced_id: str
+    ) -> set[str]:
+        """Return the entities of a type that reference an item."""
+        referenced_by = self._referenced_by.get((item_type, referenced_type))
+        if (
+            referenced_by is None
+            or (referrers := referenced_by.get(referenced_id)) is None
+        ):
+            return set()
+        return referrers
+
+    @callback
+    def async_stats(self) -> dict[str, Any]:
+        """Return statistics of the graph."""
+        referenced: dict[ItemType, dict[ItemType, int]] = defaultdict(dict)
+        edges = 0
+        for (item_type, referenced_type), referenced_by in self._referenced_by.items():
+            referenced[item_type][referenced_type] = len(referenced_by)
+            edges += sum(len(referrers) for referrers in referenced_by.values())
+        return {
+            "entities": {
+                item_type: len(entity_references)
+                for item_type, entity_references in self._references.items()
+            },
+            "referenced": referenced,
+            "edges": edges,
+            "updates": self.updates,
+        }
+
+
+@callback
+def async_get_reference_graph(hass: HomeAssistant) -> ReferenceGraph:
+    """Return the reference graph, building it on first use."""
+    if (graph := hass.data.get(DATA_REFERENCE_GRAPH)) is None:
+        graph = hass.data[DATA_REFERENCE_GRAPH] = ReferenceGraph(hass)
+        graph.async_setup()
+    return graph
@@ -2,13 +2,13 @@
 
 from __future__ import annotations
 
+from bisect import bisect_left, insort
 from collections import deque
 from collections.abc import Callable, Mapping
 import contextlib
 from datetime import datetime, timedelta
 import logging
 import math
-import statistics
 from typing import Any, cast
 
 import voluptuous as vol
@@ -182,6 +182,31 @@ STATS_BINARY_PERCENTAGE = {
     STAT_MEAN,
 }
 
+# Statistics of a numeric source calculated from running moments
+STATS_NUMERIC_RUNNING_MOMENTS = {
+    STAT_AVERAGE_TIMELESS,
+    STAT_DISTANCE_95P,
+    STAT_DISTANCE_99P,
+    STAT_MEAN,
+    STAT_STANDARD_DEVIATION,
+    STAT_SUM,
+    STAT_TOTAL,
+    STAT_VARIANCE,
+}
+
+# Statistics of a numeric source calculated from the sorted samples
+STATS_NUMERIC_SORTED = {
+    STAT_MEDIAN,
+    STAT_PERCENTILE,
+}
+
+# Statistics of a numeric source calculated from the sliding extremes
+STATS_NUMERIC_EXTREMES = {
+    STAT_DISTANCE_ABSOLUTE,
+    STAT_VALUE_MAX,
+    STAT_VALUE_MIN,
+}
+
 CONF_STATE_CHARACTERISTIC = "state_characteristic"
 CONF_SAMPLES_MAX_BUFFER_SIZE = "sampling_size"
 CONF_MAX_AGE = "max_age"
@@ -322,6 +347,174 @@ async def async_setup_entry(
     )
 
 
+def _finite_float(state: str) -> float:
+    """Convert a state to a float, NaN and infinity are rejected.
+
+    They would corrupt the aggregates of the window of samples.
+    """
+    if not math.isfinite(value := float(state)):
+        raise ValueError(f"Non-finite value: {state}")
+    return value
+
+
+class RunningMoments:
+    """Running sum, mean and variance of a window of samples.
+
+    Samples are added and removed with Welford's algorithm, the sum is
+    kept with Neumaier compensation. To bound the floating point drift
+    caused by removals, everything is recomputed from the window after
+    as many removals as there are samples in it, which keeps the cost
+    amortized O(1) per sample.
+    """
+
+    __slots__ = ("_compensation", "_m2", "_removals", "_samples", "_sum", "mean")
+
+    def __init__(self, samples: deque[float | bool]) -> None:
+        """Initialize the running moments of a window of samples."""
+        self._samples = samples
+        self._sum = 0.0
+        self._compensation = 0.0
+        self._m2 = 0.0
+        self._removals = 0
+        self.mean = 0.0
+
+    @property
+    def sum(self) -> float:
+        """Return the sum of the samples."""
+        return self._sum + self._compensation
+
+    @property
+    def variance(self) -> float:
+        """Return the sample variance, requires at least two samples."""
+        return max(self._m2, 0.0) / (len(self._samples) - 1)
+
+    def _add_to_sum(self, value: float) -> None:
+        """Add a value to the compensated sum."""
+        total = self._sum + value
+        if abs(self._sum) >= abs(value):
+            self._compensation += (self._sum - total) + value
+        else:
+            self._compensation += (value - total) + self._sum
+        self._sum = total
+
+    def added(self, value: float) -> None:
+        """Update the moments after a sample was appended to the window."""
+        self._add_to_sum(value)
+        delta = value - self.mean
+        self.mean += delta / len(self._samples)
+        self._m2 += delta * (value - self.mean)
+
+    def removed(self, value: float) -> None:
+        """Update the moments after a sample was removed from the window."""
+        self._removals += 1
+        if (count := len(self._samples)) == 0 or self._removals >= count:
+            self.rebuild()
+            return
+        self._add_to_sum(-value)
+        delta = value - self.mean
+        self.mean -= delta / count
+        self._m2 -= delta * (value - self.mean)
+
+    def rebuild(self) -> None:
+        """Recompute the moments from the samples in the window."""
+        samples = self._samples
+        self._removals = 0
+        self._compensation = 0.0
+        if not samples:
+            self._sum = self._m2 = self.mean = 0.0
+            return
+        self._sum = math.fsum(samples)
+        self.mean = self._sum / len(samples)
+        self._m2 = math.fsum((value - self.mean) ** 2 for value in samples)
+
+
+class SortedSamples:
+    """Samples of a window kept in sorted order for order statistics.
+
+    Finding the position of a sample is O(log n), the list insert or
+    delete itself is a single memmove.
+    """
+
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        """Initialize the sorted samples."""
+        self.values: list[float] = []
+
+    def added(self, value: float) -> None:
+        """Insert a sample that was appended to the window."""
+        insort(self.values, value)
+
+    def removed(self, value: float) -> None:
+        """Remove a sample that was removed from the window."""
+        del self.values[bisect_left(self.values, value)]
+
+    def median(self) -> float:
+        """Return the median of the samples, like statistics.median."""
+        values = self.values
+        count = len(values)
+        if count % 2 == 1:
+            return values[count // 2]
+        idx = count // 2
+        return (values[idx - 1] + values[idx]) / 2
+
+    def percentile(self, percentile: int) -> float:
+        """Return a percentile of at least two samples.
+
+        Matches statistics.quantiles(n=100, method="exclusive").
+        """
+        values = self.values
+        count = len(values)
+        m = count + 1
+        j = min(max(percentile * m // 100, 1), count - 1)
+        delta = percentile * m - j * 100
+        return (values[j - 1] * (100 - delta) + values[j] * delta) / 100
+
+
+class SlidingExtremes:
+    """Minimum and maximum of a window of samples.
+
+    Samples leave the window in the order they were added, so monotonic
+    deques give the extremes with amortized O(1) updates. Equal samples
+    are all kept so the removal of the oldest one is matched exactly.
+    """
+
+    __slots__ = ("_maxima", "_minima")
+
+    def __init__(self) -> None:
+        """Initialize the sliding extremes."""
+        self._maxima: deque[float] = deque()
+        self._minima: deque[float] = deque()
+
+    @property
+    def max(self) -> float:
+        """Return the maximum of the samples."""
+        return self._maxima[0]
+
+    @property
+    def min(self) -> float:
+        """Return the minimum of the samples."""
+        return self._minima[0]
+
+    def added(self, value: float) -> None:
+        """Update the extremes after a sample was appended to the window."""
+        maxima = self._maxima
+        while maxima and maxima[-1] < value:
+            maxima.pop()
+        maxima.append(value)
+        minima = self._minima
+        while minima and minima[-1] > value:
+            minima.pop()
+        minima.append(value)
+
+    def removed(self, value: float) -> None:
+        """Update the extremes after the oldest sample was removed."""
+        if self._maxima[0] == value:
+            self._maxima.popleft()
+        if self._minima[0] == value:
+            self._minima.popleft()
+
+
 class StatisticsSensor(SensorEntity):
     """Representation of a Statistics sensor."""
 
@@ -365,6 +558,16 @@ class StatisticsSensor(SensorEntity):
         self.states: deque[float | bool] = deque(maxlen=self._samples_max_buffer_size)
         self.ages: deque[datetime] = deque(maxlen=self._samples_max_buffer_size)
         self.attributes: dict[str, StateType] = {}
+        self._running_moments: RunningMoments | None = None
+        self._sorted_states: SortedSamples | None = None
+        self._extremes: SlidingExtremes | None = None
+        if not self.is_binary:
+            if state_characteristic in STATS_NUMERIC_RUNNING_MOMENTS:
+                self._running_moments = RunningMoments(self.states)
+            elif state_characteristic in STATS_NUMERIC_SORTED:
+                self._sorted_states = SortedSamples()
+            elif state_characteristic in STATS_NUMERIC_EXTREMES:
+                self._extremes = SlidingExtremes()
 
         self._state_characteristic_fn: Callable[[], StateType | datetime] = (
             self._callable_characteristic_fn(self._state_characteristic)
@@ -444,12 +647,13 @@ class StatisticsSensor(SensorEntity):
             return
 
         try:
+            value: float | bool
             if self.is_binary:
                 assert new_state.state in ("on", "off")
-                self.states.append(new_state.state == "on")
+                value = new_state.state == "on"
             else:
-                self.states.append(float(new_state.state))
-            self.ages.append(new_state.last_updated)
+                value = _finite_float(new_state.state)
+            self._append_sample(value, new_state.last_updated)
             self.attributes[STAT_SOURCE_VALUE_VALID] = True
         except ValueError:
             self.attributes[STAT_SOURCE_VALUE_VALID] = False
@@ -462,6 +666,30 @@ class StatisticsSensor(SensorEntity):
 
         self._unit_of_measurement = self._derive_unit_of_measurement(new_state)
 
+    def _append_sample(self, value: float | bool, age: datetime) -> None:
+        """Append a sample, dropping the oldest one if the buffer is full."""
+        if self.states and len(self.states) == self.states.maxlen:
+            self._popleft_sample()
+        self.states.append(value)
+        self.ages.append(age)
+        if self._running_moments is not None:
+            self._running_moments.added(value)
+        if self._sorted_states is not None:
+            self._sorted_states.added(value)
+        if self._extremes is not None:
+            self._extremes.added(value)
+
+    def _popleft_sample(self) -> None:
+        """Remove the oldest sample."""
+        self.ages.popleft()
+        value = self.states.popleft()
+        if self._running_moments is not None:
+            self._running_moments.removed(value)
+        if self._sorted_states is not None:
+            self._sorted_states.removed(value)
+        if self._extremes is not None:
+            self._extremes.removed(value)
+
     def _derive_unit_of_measurement(self, new_state: State) -> str | None:
         base_unit: str | None = new_state.attributes.get(ATTR_UNIT_OF_MEASUREMENT)
         unit: str | None
@@ -573,8 +801,7 @@ class StatisticsSensor(SensorEntity):
                 dt_util.as_local(self.ages[0]),
                 (now - self.ages[0]),
             )
-            self.ages.popleft()
-            self.states.popleft()
+            self._popleft_sample()
 
     @callback
     def _async_next_to_purge_timestamp(self) -> datetime | None:
@@ -814,12 +1041,14 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_distance_absolute(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states) - min(self.states)
+            assert self._extremes is not None
+            return self._extremes.max - self._extremes.min
         return None
 
     def _stat_mean(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.mean(self.states)
+            assert self._running_moments is not None
+            return self._running_moments.sum / len(self.states)
         return None
 
     def _stat_mean_circular(self) -> StateType:
@@ -831,7 +1060,8 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_median(self) -> StateType:
         if len(self.states) > 0:
-            return statistics.median(self.states)
+            assert self._sorted_states is not None
+            return self._sorted_states.median()
         return None
 
     def _stat_noisiness(self) -> StateType:
@@ -841,18 +1071,20 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_percentile(self) -> StateType:
         if len(self.states) >= 2:
-            percentiles = statistics.quantiles(self.states, n=100, method="exclusive")
-            return percentiles[self._percentile - 1]
+            assert self._sorted_states is not None
+            return self._sorted_states.percentile(self._percentile)
         return None
 
     def _stat_standard_deviation(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.stdev(self.states)
+            assert self._running_moments is not None
+            return math.sqrt(self._running_moments.variance)
         return None
 
     def _stat_sum(self) -> StateType:
         if len(self.states) > 0:
-            return sum(self.states)
+            assert self._running_moments is not None
+            return self._running_moments.sum
         return None
 
     def _stat_sum_differences(self) -> StateType:
@@ -876,17 +1108,20 @@ class StatisticsSensor(SensorEntity):
 
     def _stat_value_max(self) -> StateType:
         if len(self.states) > 0:
-            return max(self.states)
+            assert self._extremes is not None
+            return self._extremes.max
         return None
 
     def _stat_value_min(self) -> StateType:
         if len(self.states) > 0:
-            return min(self.states)
+            assert self._extremes is not None
+            return self._extremes.min
         return None
 
     def _stat_variance(self) -> StateType:
         if len(self.states) >= 2:
-            return statistics.variance(self.states)
+            assert self._running_moments is not None
+            return self._running_moments.variance
         return None
 
     # Statistics for binary sensor
@@ -82,6 +82,7 @@ def async_register_commands(
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_fire_event)
     async_reg(hass, handle_get_config)
+    async_reg(hass, handle_get_connection_stats)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
     async_reg(hass, handle_manifest_get)
@@ -915,6 +916,23 @@ def handle_supported_features(
     connection.send_result(msg["id"])
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "get_connection_stats"})
+def handle_get_connection_stats(
+    hass: HomeAssistant, connection: ActiveConnection, msg: dict[str, Any]
+) -> None:
+    """Handle get connection stats command."""
+    connection.send_result(
+        msg["id"],
+        {
+            "compression": connection.compression,
+            "compression_threshold": connection.compression_threshold,
+            "bytes_before_compression": connection.bytes_before_compression,
+            "bytes_after_compression": connection.bytes_after_compression,
+        },
+    )
+
+
 @decorators.require_admin
 @decorators.websocket_command({"type": "integration/descriptions"})
 @decorators.async_response
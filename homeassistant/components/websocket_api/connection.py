@@ -42,6 +42,11 @@ class ActiveConnection:
         "subscriptions",
         "last_id",
         "can_coalesce",
+        "compression",
+        "compression_threshold",
+        "count_bytes",
+        "bytes_before_compression",
+        "bytes_after_compression",
         "supported_features",
         "handlers",
         "binary_handlers",
@@ -64,6 +69,12 @@ class ActiveConnection:
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
         self.can_coalesce = False
+        # Set by the handler when permessage-deflate was negotiated
+        self.compression = False
+        self.compression_threshold = const.DEFAULT_COMPRESSION_THRESHOLD
+        self.count_bytes = False
+        self.bytes_before_compression = 0
+        self.bytes_after_compression = 0
         self.supported_features: dict[str, float] = {}
         self.handlers: dict[str, tuple[MessageHandler, vol.Schema | Literal[False]]] = (
             self.hass.data[const.DOMAIN]
@@ -79,6 +90,13 @@ class ActiveConnection:
         """Set supported features."""
         self.supported_features = features
         self.can_coalesce = const.FEATURE_COALESCE_MESSAGES in features
+        self.count_bytes = const.FEATURE_CONNECTION_STATS in features
+        self.compression_threshold = int(
+            features.get(
+                const.FEATURE_COMPRESSION_THRESHOLD,
+                const.DEFAULT_COMPRESSION_THRESHOLD,
+            )
+        )
 
     def get_description(self, request: web.Request | None) -> str:
         """Return a description of the connection."""
@@ -34,6 +34,10 @@ MAX_PENDING_MSG: Final = 4096
 # resolve the ready future.
 PENDING_MSG_MAX_FORCE_READY: Final = 256
 
+# Amount of buffered data before the writers wait for the transport to drain
+# after the auth phase
+WRITER_LIMIT: Final = 2**20
+
 ERR_ID_REUSE: Final = "id_reuse"
 ERR_INVALID_FORMAT: Final = "invalid_format"
 ERR_NOT_ALLOWED: Final = "not_allowed"
@@ -58,3 +62,9 @@ SIGNAL_WEBSOCKET_DISCONNECTED: Final = "websocket_disconnected"
 DATA_CONNECTIONS: Final = f"{DOMAIN}.connections"
 
 FEATURE_COALESCE_MESSAGES = "coalesce_messages"
+FEATURE_COMPRESSION_THRESHOLD = "compression_threshold"
+FEATURE_CONNECTION_STATS = "connection_stats"
+
+# Messages smaller than this are sent uncompressed when permessage-deflate
+# is negotiated, compressing them costs more CPU time than it saves bandwidth
+DEFAULT_COMPRESSION_THRESHOLD = 512
@@ -9,8 +9,10 @@ import datetime as dt
 from functools import partial
 import logging
 from typing import TYPE_CHECKING, Any, Final
+import zlib
 
 from aiohttp import WSMsgType, web
+from aiohttp.compression_utils import ZLibCompressor
 from aiohttp.http_websocket import WebSocketWriter
 
 from homeassistant.components.http import KEY_HASS, HomeAssistantView
@@ -31,6 +33,7 @@ from .const import (
     SIGNAL_WEBSOCKET_CONNECTED,
     SIGNAL_WEBSOCKET_DISCONNECTED,
     URL,
+    WRITER_LIMIT,
 )
 from .error import Disconnect
 from .messages import message_to_json_bytes
@@ -41,6 +44,8 @@ if TYPE_CHECKING:
 
 
 _WS_LOGGER: Final = logging.getLogger(f"{__name__}.connection")
+# The end of a flushed deflate block, which is not sent in permessage-deflate
+_DEFLATE_TRAILER: Final = b"\x00\x00\xff\xff"
 
 
 class WebsocketAPIView(HomeAssistantView):
@@ -82,6 +87,9 @@ class WebSocketHandler:
         "_message_queue",
         "_ready_future",
         "_release_ready_queue_size",
+        "_compress",
+        "_notakeover",
+        "_compressed_size_estimator",
     )
 
     def __init__(self, hass: HomeAssistant, request: web.Request) -> None:
@@ -97,6 +105,10 @@ class WebSocketHandler:
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub: Callable[[], None] | None = None
         self._connection: ActiveConnection | None = None
+        # The permessage-deflate window bits, 0 if not negotiated
+        self._compress = 0
+        self._notakeover = False
+        self._compressed_size_estimator: ZLibCompressor | None = None
 
         # The WebSocketHandler has a single consumer and path
         # to where messages are queued. This allows the implementation
@@ -137,6 +149,7 @@ class WebSocketHandler:
         loop = self._loop
         is_debug_log_enabled = partial(logger.isEnabledFor, logging.DEBUG)
         debug = logger.debug
+        send = self._async_make_sender(connection, send_bytes_text)
         can_coalesce = connection.can_coalesce
         ready_message_count = len(message_queue)
         # Exceptions if Socket disconnected or cancelled by connection handler
@@ -157,14 +170,18 @@ class WebSocketHandler:
                     message = message_queue.popleft()
                     if is_debug_log_enabled():
                         debug("%s: Sending %s", self.description, message)
-                    await send_bytes_text(message)
+                    if connection.count_bytes:
+                        await self._async_count_sent_bytes(connection, message)
+                    await send(message)
                     continue
 
                 coalesced_messages = b"".join((b"[", b",".join(message_queue), b"]"))
                 message_queue.clear()
                 if is_debug_log_enabled():
                     debug("%s: Sending %s", self.description, coalesced_messages)
-                await send_bytes_text(coalesced_messages)
+                if connection.count_bytes:
+                    await self._async_count_sent_bytes(connection, coalesced_messages)
+                await send(coalesced_messages)
         except asyncio.CancelledError:
             debug("%s: Writer cancelled", self.description)
             raise
@@ -175,6 +192,75 @@ class WebSocketHandler:
             # Clean up the peak checker when we shut down the writer
             self._cancel_peak_checker()
 
+    @callback
+    def _async_make_sender(
+        self,
+        connection: ActiveConnection,
+        send_bytes_text: Callable[[bytes], Coroutine[Any, Any, None]],
+    ) -> Callable[[bytes], Coroutine[Any, Any, None]]:
+        """Return a function to send a message.
+
+        When permessage-deflate is negotiated, messages below the compression
+        threshold of the connection are sent uncompressed by a second writer
+        on the same transport. Frames without the compressed bit are valid
+        with permessage-deflate and leave the compression context of the
+        writer, which is kept for the whole connection, alone.
+        """
+        writer = self._wsock._writer  # noqa: SLF001
+        if TYPE_CHECKING:
+            assert writer is not None
+        if not writer.compress:
+            return send_bytes_text
+
+        connection.compression = True
+        self._compress = writer.compress
+        self._notakeover = writer.notakeover
+        uncompressed_writer = WebSocketWriter(
+            writer.protocol, writer.transport, limit=WRITER_LIMIT
+        )
+        # aiohttp 3.11.0 changed the method name from _send_frame to send_frame
+        if hasattr(uncompressed_writer, "send_frame"):
+            send_frame = uncompressed_writer.send_frame  # pragma: no cover
+        else:
+            send_frame = uncompressed_writer._send_frame  # noqa: SLF001
+        send_bytes_text_uncompressed = partial(send_frame, opcode=WSMsgType.TEXT)
+
+        async def _send(message: bytes) -> None:
+            """Send a message with compression if it is large enough."""
+            if len(message) < connection.compression_threshold:
+                await send_bytes_text_uncompressed(message)
+            else:
+                await send_bytes_text(message)
+
+        return _send
+
+    async def _async_count_sent_bytes(
+        self, connection: ActiveConnection, message: bytes
+    ) -> None:
+        """Count the bytes of a message before and after compression.
+
+        The compressed size is estimated in the executor by a second
+        compressor, which is fed the same messages as the compressor of the
+        writer from the moment the client enabled the connection stats
+        feature, so it builds up the same context.
+        """
+        size = len(message)
+        connection.bytes_before_compression += size
+        if not self._compress or size < connection.compression_threshold:
+            connection.bytes_after_compression += size
+            return
+        if (estimator := self._compressed_size_estimator) is None:
+            estimator = self._compressed_size_estimator = ZLibCompressor(
+                level=zlib.Z_BEST_SPEED, wbits=-self._compress, max_sync_chunk_size=0
+            )
+        compressed = await estimator.compress(message)
+        compressed += estimator.flush(
+            zlib.Z_FULL_FLUSH if self._notakeover else zlib.Z_SYNC_FLUSH
+        )
+        if compressed.endswith(_DEFLATE_TRAILER):
+            compressed = compressed[: -len(_DEFLATE_TRAILER)]
+        connection.bytes_after_compression += len(compressed)
+
     @callback
     def _cancel_peak_checker(self) -> None:
         """Cancel the peak checker."""
@@ -451,7 +537,7 @@ class WebSocketHandler:
         # added a way to set the limit, but there is no way to actually
         # reach the code to set the limit, so we have to set it directly.
         #
-        writer._limit = 2**20  # noqa: SLF001
+        writer._limit = WRITER_LIMIT  # noqa: SLF001
 
     async def _async_websocket_command_phase(
         self,
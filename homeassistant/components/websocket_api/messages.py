@@ -120,7 +120,7 @@ def cached_event_message(message_id_as_bytes: bytes, event: Event) -> bytes:
     """
     return b"".join(
         (
-            _partial_cached_event_message(event)[:-1],
+            _partial_cached_event_message(event),
             b',"id":',
             message_id_as_bytes,
             b"}",
@@ -132,13 +132,14 @@ def cached_event_message(message_id_as_bytes: bytes, event: Event) -> bytes:
 def _partial_cached_event_message(event: Event) -> bytes:
     """Cache and serialize the event to json.
 
-    The message is constructed without the id which appended
-    in cached_event_message.
+    The message is constructed without the id and the closing
+    brace which are appended in cached_event_message so the
+    serialized event is only copied once per connection.
     """
     return (
         _message_to_json_bytes_or_none({"type": "event", "event": event.json_fragment})
         or INVALID_JSON_PARTIAL_MESSAGE
-    )
+    )[:-1]
 
 
 def cached_state_diff_message(
@@ -154,7 +155,7 @@ def cached_state_diff_message(
     """
     return b"".join(
         (
-            _partial_cached_state_diff_message(event)[:-1],
+            _partial_cached_state_diff_message(event),
             b',"id":',
             message_id_as_bytes,
             b"}",
@@ -166,15 +167,15 @@ def cached_state_diff_message(
 def _partial_cached_state_diff_message(event: Event[EventStateChangedData]) -> bytes:
     """Cache and serialize the event to json.
 
-    The message is constructed without the id which
-    will be appended in cached_state_diff_message
+    The message is constructed without the id and the closing
+    brace which will be appended in cached_state_diff_message
     """
     return (
         _message_to_json_bytes_or_none(
             {"type": "event", "event": _state_diff_event(event)}
         )
         or INVALID_JSON_PARTIAL_MESSAGE
-    )
+    )[:-1]
 
 
 def _state_diff_event(
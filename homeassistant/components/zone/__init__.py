@@ -47,9 +47,11 @@ from homeassistant.helpers import (
 )
 from homeassistant.helpers.typing import ConfigType, VolDictType
 from homeassistant.loader import bind_hass
+from homeassistant.util.hass_dict import HassKey
 from homeassistant.util.location import distance
 
 from .const import ATTR_PASSIVE, ATTR_RADIUS, CONF_PASSIVE, DOMAIN, HOME_ZONE
+from .spatial_index import ZoneIndex
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -107,6 +109,7 @@ STORAGE_VERSION = 1
 ENTITY_ID_SORTER = attrgetter("entity_id")
 
 ZONE_ENTITY_IDS = "zone_entity_ids"
+DATA_ZONE_INDEX: HassKey[ZoneIndex] = HassKey("zone_index")
 
 
 @bind_hass
@@ -122,7 +125,12 @@ def async_active_zone(
     closest: State | None = None
 
     # This can be called before async_setup by device tracker
-    zone_entity_ids: Iterable[str] = hass.data.get(ZONE_ENTITY_IDS, ())
+    zone_entity_ids: Iterable[str] | None = None
+    if (zone_index := hass.data.get(DATA_ZONE_INDEX)) is not None:
+        # Only the zones near the location, in the same order
+        zone_entity_ids = zone_index.async_candidates(latitude, longitude, radius)
+    if zone_entity_ids is None:
+        zone_entity_ids = hass.data.get(ZONE_ENTITY_IDS, ())
 
     for entity_id in zone_entity_ids:
         if (
@@ -189,6 +197,19 @@ def async_setup_track_zone_entity_ids(hass: HomeAssistant) -> None:
     event.async_track_state_added_domain(hass, DOMAIN, _async_add_zone_entity_id)
     event.async_track_state_removed_domain(hass, DOMAIN, _async_remove_zone_entity_id)
 
+    zone_index = hass.data[DATA_ZONE_INDEX] = ZoneIndex()
+    for zone_entity_id in zone_entity_ids:
+        zone_index.async_update(zone_entity_id, hass.states.get(zone_entity_id))
+
+    @callback
+    def _async_update_zone_index(event_: Event[EventStateChangedData]) -> None:
+        """Update the zone in the index."""
+        zone_index.async_update(event_.data["entity_id"], event_.data["new_state"])
+
+    event.async_track_state_change_filtered(
+        hass, event.TrackStates(False, set(), {DOMAIN}), _async_update_zone_index
+    )
+
 
 def in_zone(zone: State, latitude: float, longitude: float, radius: float = 0) -> bool:
     """Test if given latitude, longitude is in given zone.
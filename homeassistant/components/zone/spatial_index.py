@@ -0,0 +1,143 @@
+"""Grid index to find the zones that may contain a location."""
+
+from __future__ import annotations
+
+from collections import defaultdict
+import math
+
+from homeassistant.const import ATTR_LATITUDE, ATTR_LONGITUDE
+from homeassistant.core import State, callback
+
+from .const import ATTR_RADIUS
+
+# Size of the grid cells in degrees, about 11 km at the equator
+CELL_SIZE = 0.1
+# Circles that span more cells are not indexed, they are always candidates
+MAX_CELLS = 1024
+# Lower bounds of the length of a degree on the WGS 84 ellipsoid, the one
+# of longitude is multiplied by the cosine of the latitude. Distances are
+# enlarged by the margin so the bounding boxes are never too small.
+METERS_PER_DEGREE_LATITUDE = 110_000
+METERS_PER_DEGREE_LONGITUDE = 111_000
+MARGIN = 1.1
+
+_COLUMNS = round(360 / CELL_SIZE)
+
+type _Cell = tuple[int, int]
+
+
+def _cells(latitude: float, longitude: float, radius: float) -> list[_Cell] | None:
+    """Return the cells the bounding box of a circle overlaps.
+
+    Returns None if the box is too large to index or reaches a pole.
+    """
+    if not (
+        math.isfinite(latitude) and math.isfinite(longitude) and math.isfinite(radius)
+    ):
+        return None
+    radius = max(radius, 0) * MARGIN
+    delta_latitude = radius / METERS_PER_DEGREE_LATITUDE
+    # The shortest path may pass closer to the pole than the circle
+    max_latitude = abs(latitude) + 2 * delta_latitude
+    if max_latitude >= 90:
+        return None
+    delta_longitude = radius / (
+        METERS_PER_DEGREE_LONGITUDE * math.cos(math.radians(max_latitude))
+    )
+    if delta_longitude >= 180:
+        return None
+    rows = range(
+        math.floor((latitude - delta_latitude) / CELL_SIZE),
+        math.floor((latitude + delta_latitude) / CELL_SIZE) + 1,
+    )
+    columns = range(
+        math.floor((longitude - delta_longitude) / CELL_SIZE),
+        math.floor((longitude + delta_longitude) / CELL_SIZE) + 1,
+    )
+    if len(rows) * len(columns) > MAX_CELLS:
+        return None
+    # Wrap around the antimeridian
+    return [(row, column % _COLUMNS) for row in rows for column in columns]
+
+
+class ZoneIndex:
+    """Grid index of the circles of the zones.
+
+    A zone is stored in every cell its bounding box overlaps, so the
+    zones that may contain a location are the ones in the cells of the
+    bounding box of the location and its accuracy. Zones that can't be
+    indexed, because they are too large or have invalid attributes, are
+    always returned. The candidates still have to be checked.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the index."""
+        self._grid: defaultdict[_Cell, set[str]] = defaultdict(set)
+        self._zones: dict[str, tuple[tuple[float, float, float], list[_Cell]]] = {}
+        self._unindexed: set[str] = set()
+
+    @callback
+    def async_update(self, entity_id: str, state: State | None) -> None:
+        """Update the index with the state of a zone."""
+        if state is not None:
+            attributes = state.attributes
+            try:
+                circle = (
+                    float(attributes[ATTR_LATITUDE]),
+                    float(attributes[ATTR_LONGITUDE]),
+                    float(attributes[ATTR_RADIUS]),
+                )
+            except (KeyError, TypeError, ValueError):
+                circle = None
+            # The state is the number of persons in the zone
+            # and changes more often than the zone itself
+            if circle is not None and (
+                (indexed := self._zones.get(entity_id)) is not None
+                and indexed[0] == circle
+            ):
+                return
+        self._async_remove(entity_id)
+        if state is None:
+            return
+        if circle is None or (cells := _cells(*circle)) is None:
+            self._unindexed.add(entity_id)
+            return
+        self._zones[entity_id] = (circle, cells)
+        grid = self._grid
+        for cell in cells:
+            grid[cell].add(entity_id)
+
+    @callback
+    def _async_remove(self, entity_id: str) -> None:
+        """Remove a zone from the index."""
+        self._unindexed.discard(entity_id)
+        if (indexed := self._zones.pop(entity_id, None)) is None:
+            return
+        grid = self._grid
+        for cell in indexed[1]:
+            zones = grid[cell]
+            zones.discard(entity_id)
+            if not zones:
+                del grid[cell]
+
+    @callback
+    def async_candidates(
+        self, latitude: float, longitude: float, radius: float
+    ) -> list[str] | None:
+        """Return the sorted entity ids of the zones that may contain a location.
+
+        Returns None if the accuracy of the location is too large to use
+        the index and all zones have to be checked.
+        """
+        try:
+            cells = _cells(latitude, longitude, radius)
+        except TypeError:
+            cells = None
+        if cells is None:
+            return None
+        candidates = self._unindexed.copy()
+        grid = self._grid
+        for cell in cells:
+            if (zones := grid.get(cell)) is not None:
+                candidates.update(zones)
+        return sorted(candidates)
@@ -51,10 +51,12 @@ import yarl
 
 from . import util
 from .const import (
+    ATTR_DEVICE_CLASS,
     ATTR_DOMAIN,
     ATTR_FRIENDLY_NAME,
     ATTR_SERVICE,
     ATTR_SERVICE_DATA,
+    ATTR_UNIT_OF_MEASUREMENT,
     BASE_PLATFORMS,
     COMPRESSED_STATE_ATTRIBUTES,
     COMPRESSED_STATE_CONTEXT,
@@ -455,6 +457,8 @@ class HomeAssistant:
             max_workers=1, thread_name_prefix="ImportExecutor"
         )
         self.loop_thread_id = getattr(self.loop, "_thread_id")
+        # Called with every job run in the event loop and its wall time
+        self._job_timer: Callable[[HassJob[..., Any], float], None] | None = None
 
     def verify_event_loop_thread(self, what: str) -> None:
         """Report and raise if we are not running in the event loop thread."""
@@ -930,6 +934,11 @@ class HomeAssistant:
         hassjob: HassJob
         args: parameters for method to call.
         """
+        if self._job_timer is not None:
+            return self._async_run_timed_hass_job(
+                self._job_timer, hassjob, *args, background=background
+            )
+
         # This code path is performance sensitive and uses
         # if TYPE_CHECKING to avoid the overhead of constructing
         # the type used for the cast. For history see:
@@ -942,6 +951,39 @@ class HomeAssistant:
 
         return self._async_add_hass_job(hassjob, *args, background=background)
 
+    @callback
+    def _async_run_timed_hass_job[_R](
+        self,
+        job_timer: Callable[[HassJob[..., Any], float], None],
+        hassjob: HassJob[..., Coroutine[Any, Any, _R] | _R],
+        *args: Any,
+        background: bool = False,
+    ) -> asyncio.Future[_R] | None:
+        """Run a HassJob from within the event loop and record its wall time."""
+        start = time.perf_counter()
+        try:
+            if hassjob.job_type is HassJobType.Callback:
+                if TYPE_CHECKING:
+                    hassjob = cast(HassJob[..., _R], hassjob)
+                hassjob.target(*args)
+                return None
+            return self._async_add_hass_job(hassjob, *args, background=background)
+        finally:
+            job_timer(hassjob, time.perf_counter() - start)
+
+    @callback
+    def async_set_job_timer(
+        self, job_timer: Callable[[HassJob[..., Any], float], None] | None
+    ) -> None:
+        """Set the callback that records the wall time of the jobs.
+
+        The job timer is called with every job run by async_run_hass_job
+        and its wall time. Pass None to stop timing the jobs.
+
+        This method must be run in the event loop.
+        """
+        self._job_timer = job_timer
+
     @overload
     @callback
     def async_run_job[_R, *_Ts](
@@ -1421,6 +1463,11 @@ _FilterableJobType = tuple[
     Callable[[_DataT], bool] | None,  # event_filter
 ]
 
+# Listener jobs indexed by data key and data value
+_KeyedJobsType = dict[
+    str, dict[Any, list[HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None]]]
+]
+
 
 @dataclass(slots=True)
 class _OneTimeListener(Generic[_DataT]):
@@ -1460,13 +1507,20 @@ def _verify_event_type_length_or_raise(event_type: EventType[_DataT] | str) -> N
 class EventBus:
     """Allow the firing of and listening for events."""
 
-    __slots__ = ("_debug", "_hass", "_listeners", "_match_all_listeners")
+    __slots__ = (
+        "_debug",
+        "_hass",
+        "_keyed_listeners",
+        "_listeners",
+        "_match_all_listeners",
+    )
 
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: defaultdict[
             EventType[Any] | str, list[_FilterableJobType[Any]]
         ] = defaultdict(list)
+        self._keyed_listeners: dict[EventType[Any] | str, _KeyedJobsType[Any]] = {}
         self._match_all_listeners: list[_FilterableJobType[Any]] = []
         self._listeners[MATCH_ALL] = self._match_all_listeners
         self._hass = hass
@@ -1484,7 +1538,17 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(listeners) for key, listeners in self._listeners.items()}
+        listeners = {key: len(listeners) for key, listeners in self._listeners.items()}
+        for event_type, keyed_jobs in self._keyed_listeners.items():
+            # A job listening for multiple values is counted once
+            jobs = {
+                id(job)
+                for jobs_by_value in keyed_jobs.values()
+                for value_jobs in jobs_by_value.values()
+                for job in value_jobs
+            }
+            listeners[event_type] = listeners.get(event_type, 0) + len(jobs)
+        return listeners
 
     @property
     def listeners(self) -> dict[EventType[Any] | str, int]:
@@ -1555,6 +1619,22 @@ class EventBus:
         else:
             match_all_listeners = EMPTY_LIST
 
+        # The keyed jobs are looked up before any listener runs, like the
+        # other listeners are copied, so listeners added while the event
+        # is dispatched do not receive it. They run after the other
+        # listeners, see async_listen_keyed.
+        keyed_jobs_to_run: list[HassJob[[Event[_DataT]], Any]] = []
+        if event_data is not None and (
+            keyed_jobs := self._keyed_listeners.get(event_type)
+        ):
+            for data_key, jobs_by_value in keyed_jobs.items():
+                try:
+                    if jobs := jobs_by_value.get(event_data.get(data_key)):
+                        keyed_jobs_to_run.extend(jobs)
+                except TypeError:
+                    # The value is not hashable so no listener can match it
+                    continue
+
         event: Event[_DataT] | None = None
         for job, event_filter in listeners + match_all_listeners:
             if event_filter is not None:
@@ -1579,6 +1659,24 @@ class EventBus:
             except Exception:
                 _LOGGER.exception("Error running job: %s", job)
 
+        if not keyed_jobs_to_run:
+            return
+
+        if not event:
+            event = Event(
+                event_type,
+                event_data,
+                origin,
+                time_fired,
+                context,
+            )
+
+        for job in keyed_jobs_to_run:
+            try:
+                self._hass.async_run_hass_job(job, event)
+            except Exception:
+                _LOGGER.exception("Error running job: %s", job)
+
     def listen(
         self,
         event_type: EventType[_DataT] | str,
@@ -1654,6 +1752,79 @@ class EventBus:
             self._async_remove_listener, event_type, filterable_job
         )
 
+    @callback
+    def async_listen_keyed(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        data_values: Iterable[Any],
+        listener: Callable[[Event[_DataT]], Coroutine[Any, Any, None] | None]
+        | HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type by a value of their data.
+
+        The listener runs for events where the value of data_key in the event
+        data is one of data_values. The listeners are indexed by the value so
+        firing an event only looks at the matching listeners, while every
+        event_filter of the event type is called for every event.
+
+        The keyed listeners of an event run after its other listeners,
+        including the listeners of all events, in the order they were
+        registered among themselves.
+
+        MATCH_ALL is not supported as event_type.
+
+        This method must be run in the event loop.
+        """
+        if event_type == MATCH_ALL:
+            raise HomeAssistantError("Keyed listeners cannot listen to all events")
+        if isinstance(listener, HassJob):
+            job = listener
+        else:
+            job = HassJob(listener, f"listen {event_type} by {data_key}")
+        data_values = tuple(data_values)
+        jobs_by_value = self._keyed_listeners.setdefault(event_type, {}).setdefault(
+            data_key, {}
+        )
+        for data_value in data_values:
+            if (jobs := jobs_by_value.get(data_value)) is None:
+                jobs_by_value[data_value] = [job]
+            else:
+                jobs.append(job)
+        return functools.partial(
+            self._async_remove_keyed_listener, event_type, data_key, data_values, job
+        )
+
+    @callback
+    def _async_remove_keyed_listener(
+        self,
+        event_type: EventType[_DataT] | str,
+        data_key: str,
+        data_values: tuple[Any, ...],
+        job: HassJob[[Event[_DataT]], Coroutine[Any, Any, None] | None],
+    ) -> None:
+        """Remove a keyed listener of a specific event_type.
+
+        This method must be run in the event loop.
+        """
+        try:
+            keyed_jobs = self._keyed_listeners[event_type]
+            jobs_by_value = keyed_jobs[data_key]
+            for data_value in data_values:
+                jobs = jobs_by_value[data_value]
+                jobs.remove(job)
+                if not jobs:
+                    del jobs_by_value[data_value]
+        except (KeyError, ValueError):
+            # KeyError if no listener was indexed by the value
+            # ValueError if the job was not listening for the value
+            _LOGGER.exception("Unable to remove unknown keyed job listener %s", job)
+            return
+        if not jobs_by_value:
+            del keyed_jobs[data_key]
+            if not keyed_jobs:
+                del self._keyed_listeners[event_type]
+
     def listen_once(
         self,
         event_type: EventType[_DataT] | str,
@@ -2022,17 +2193,41 @@ class State:
         )
 
 
+_EMPTY_STATES: ValuesView[State] = {}.values()
+
+# Attributes which are indexed once they are looked up, as indexes are
+# kept up to date on every state change
+INDEXED_ATTRIBUTES: Final = frozenset(
+    {ATTR_DEVICE_CLASS, "state_class", ATTR_UNIT_OF_MEASUREMENT}
+)
+
+
+def _attribute_index_key(value: Any) -> tuple[type, Any]:
+    """Return the index key of an attribute value.
+
+    The type is part of the key so 1, 1.0 and True are different values.
+    Subclasses of str, like StrEnum members, are the same value as the str.
+    """
+    return (str if isinstance(value, str) else type(value), value)
+
+
 class States(UserDict[str, State]):
     """Container for states, maps entity_id -> State.
 
     Maintains an additional index:
     - domain -> dict[str, State]
+
+    And indexes for the attributes in INDEXED_ATTRIBUTES once looked up:
+    - attribute -> attribute value -> dict[str, State]
     """
 
     def __init__(self) -> None:
         """Initialize the container."""
         super().__init__()
         self._domain_index: defaultdict[str, dict[str, State]] = defaultdict(dict)
+        self._attribute_index: dict[
+            str, defaultdict[tuple[type, Any], dict[str, State]]
+        ] = {}
 
     def values(self) -> ValuesView[State]:
         """Return the underlying values to avoid __iter__ overhead."""
@@ -2040,6 +2235,8 @@ class States(UserDict[str, State]):
 
     def __setitem__(self, key: str, entry: State) -> None:
         """Add an item."""
+        if self._attribute_index:
+            self._reindex_attributes(key, self.data.get(key), entry)
         self.data[key] = entry
         self._domain_index[entry.domain][entry.entity_id] = entry
 
@@ -2047,8 +2244,69 @@ class States(UserDict[str, State]):
         """Remove an item."""
         entry = self[key]
         del self._domain_index[entry.domain][entry.entity_id]
+        if self._attribute_index:
+            self._reindex_attributes(key, entry, None)
         super().__delitem__(key)
 
+    def _reindex_attributes(
+        self, key: str, old_entry: State | None, new_entry: State | None
+    ) -> None:
+        """Move an entity to the buckets of its new attribute values."""
+        for attribute, index in self._attribute_index.items():
+            if (
+                old_entry is not None
+                and (old_value := old_entry.attributes.get(attribute)) is not None
+            ):
+                old_key = _attribute_index_key(old_value)
+                with suppress(TypeError):
+                    if (bucket := index.get(old_key)) is not None:
+                        bucket.pop(key, None)
+                        if not bucket:
+                            del index[old_key]
+            if (
+                new_entry is not None
+                and (value := new_entry.attributes.get(attribute)) is not None
+            ):
+                # Unhashable values can't be looked up and are not indexed
+                with suppress(TypeError):
+                    index[_attribute_index_key(value)][key] = new_entry
+
+    def attribute_states(self, attribute: str, value: Any) -> Iterable[State]:
+        """Get all states that have an attribute with the value.
+
+        The attributes in INDEXED_ATTRIBUTES are indexed the first time they
+        are looked up and the index is kept up to date from then on. Other
+        attributes and unhashable values are looked up in all states.
+        """
+        key = _attribute_index_key(value)
+        if attribute not in INDEXED_ATTRIBUTES:
+            return self._scan_attribute_states(attribute, key)
+        if (index := self._attribute_index.get(attribute)) is None:
+            index = self._attribute_index[attribute] = defaultdict(dict)
+            for entity_id, entry in self.data.items():
+                if (entry_value := entry.attributes.get(attribute)) is not None:
+                    with suppress(TypeError):
+                        index[_attribute_index_key(entry_value)][entity_id] = entry
+        try:
+            # Avoid polluting the index with values no state has
+            bucket = index.get(key)
+        except TypeError:
+            return self._scan_attribute_states(attribute, key)
+        if bucket is None:
+            return _EMPTY_STATES
+        return bucket.values()
+
+    def _scan_attribute_states(
+        self, attribute: str, key: tuple[type, Any]
+    ) -> list[State]:
+        """Get all states that have an attribute with the value of the key."""
+        return [
+            entry
+            for entry in self.data.values()
+            if (entry_value := entry.attributes.get(attribute)) is not None
+            and _attribute_index_key(entry_value) == key
+        ]
+
     def domain_entity_ids(self, key: str) -> KeysView[str] | tuple[()]:
         """Get all entity_ids for a domain."""
         # Avoid polluting _domain_index with non-existing domains
@@ -2148,6 +2406,30 @@ class StateMachine:
             states.extend(self._states.domain_states(domain))
         return states
 
+    @callback
+    def async_all_with_attribute(
+        self,
+        attribute: str,
+        value: Any,
+        domain_filter: str | Iterable[str] | None = None,
+    ) -> list[State]:
+        """Create a list of the states that have an attribute with the value.
+
+        The attributes in INDEXED_ATTRIBUTES are indexed the first time they
+        are queried so this only touches the matching states.
+
+        This method must be run in the event loop.
+        """
+        if value is None:
+            raise ValueError("Can't query states with an attribute value of None")
+        states = self._states.attribute_states(attribute, value)
+        if domain_filter is None:
+            return list(states)
+        if isinstance(domain_filter, str):
+            domain_filter = (domain_filter.lower(),)
+        domains = set(domain_filter)
+        return [state for state in states if state.domain in domains]
+
     def get(self, entity_id: str) -> State | None:
         """Retrieve state of entity_id or None if not found.
 
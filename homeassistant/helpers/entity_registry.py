@@ -11,7 +11,7 @@ timer.
 from __future__ import annotations
 
 from collections import defaultdict
-from collections.abc import Callable, Container, Hashable, KeysView, Mapping
+from collections.abc import Callable, Container, Hashable, Iterator, Mapping, ValuesView
 from datetime import datetime, timedelta
 from enum import StrEnum
 import logging
@@ -546,6 +546,46 @@ class EntityRegistryStore(storage.Store[dict[str, list[dict[str, Any]]]]):
         return data
 
 
+def _entry_from_storage(entity: dict[str, Any]) -> RegistryEntry:
+    """Create a RegistryEntry from its storage data."""
+    return RegistryEntry(
+        aliases=set(entity["aliases"]),
+        area_id=entity["area_id"],
+        categories=entity["categories"],
+        capabilities=entity["capabilities"],
+        config_entry_id=entity["config_entry_id"],
+        created_at=datetime.fromisoformat(entity["created_at"]),
+        device_class=entity["device_class"],
+        device_id=entity["device_id"],
+        disabled_by=RegistryEntryDisabler(entity["disabled_by"])
+        if entity["disabled_by"]
+        else None,
+        entity_category=EntityCategory(entity["entity_category"])
+        if entity["entity_category"]
+        else None,
+        entity_id=entity["entity_id"],
+        hidden_by=RegistryEntryHider(entity["hidden_by"])
+        if entity["hidden_by"]
+        else None,
+        icon=entity["icon"],
+        id=entity["id"],
+        has_entity_name=entity["has_entity_name"],
+        labels=set(entity["labels"]),
+        modified_at=datetime.fromisoformat(entity["modified_at"]),
+        name=entity["name"],
+        options=entity["options"],
+        original_device_class=entity["original_device_class"],
+        original_icon=entity["original_icon"],
+        original_name=entity["original_name"],
+        platform=entity["platform"],
+        supported_features=entity["supported_features"],
+        translation_key=entity["translation_key"],
+        unique_id=entity["unique_id"],
+        previous_unique_id=entity["previous_unique_id"],
+        unit_of_measurement=entity["unit_of_measurement"],
+    )
+
+
 class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     """Container for entity registry items, maps entity_id -> entry.
 
@@ -556,6 +596,12 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
     - device_id -> dict[key, True]
     - area_id -> dict[key, True]
     - label -> dict[key, True]
+
+    Entries loaded from storage are kept as their storage data until they
+    are accessed. Looking up a single entry only creates that entry and
+    looking up the entries of a config entry, device, area or label only
+    creates those entries. Everything else, like iterating over the
+    container, creates all pending entries first.
     """
 
     def __init__(self) -> None:
@@ -567,6 +613,146 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self._device_id_index: RegistryIndexType = defaultdict(dict)
         self._area_id_index: RegistryIndexType = defaultdict(dict)
         self._labels_index: RegistryIndexType = defaultdict(dict)
+        self._pending: dict[str, dict[str, Any]] = {}
+        self._pending_ids: dict[str, str] = {}
+        self._pending_index: dict[tuple[str, str, str], str] = {}
+        self._pending_config_entry_id_index: RegistryIndexType = defaultdict(dict)
+        self._pending_device_id_index: RegistryIndexType = defaultdict(dict)
+        self._pending_area_id_index: RegistryIndexType = defaultdict(dict)
+        self._pending_labels_index: RegistryIndexType = defaultdict(dict)
+
+    def add_pending(self, entity: dict[str, Any]) -> None:
+        """Add an entry from its storage data without creating it yet."""
+        entity_id: str = entity["entity_id"]
+        if entity_id in self.data:
+            del self[entity_id]
+        elif entity_id in self._pending:
+            self._pop_pending(entity_id)
+        self._pending[entity_id] = entity
+        self._pending_ids[entity["id"]] = entity_id
+        domain = split_entity_id(entity_id)[0]
+        self._pending_index[(domain, entity["platform"], entity["unique_id"])] = (
+            entity_id
+        )
+        if (config_entry_id := entity["config_entry_id"]) is not None:
+            self._pending_config_entry_id_index[config_entry_id][entity_id] = True
+        if (device_id := entity["device_id"]) is not None:
+            self._pending_device_id_index[device_id][entity_id] = True
+        if (area_id := entity["area_id"]) is not None:
+            self._pending_area_id_index[area_id][entity_id] = True
+        for label in entity["labels"]:
+            self._pending_labels_index[label][entity_id] = True
+
+    def _pop_pending(self, entity_id: str) -> dict[str, Any]:
+        """Remove a pending entry and return its storage data."""
+        entity = self._pending.pop(entity_id)
+        # Stored entries may share an id or a unique_id, the
+        # indexes then point to the entry that was added last
+        if self._pending_ids.get(entity["id"]) == entity_id:
+            del self._pending_ids[entity["id"]]
+        domain = split_entity_id(entity_id)[0]
+        key = (domain, entity["platform"], entity["unique_id"])
+        if self._pending_index.get(key) == entity_id:
+            del self._pending_index[key]
+        if (config_entry_id := entity["config_entry_id"]) is not None:
+            self._unindex_entry_value(
+                entity_id, config_entry_id, self._pending_config_entry_id_index
+            )
+        if (device_id := entity["device_id"]) is not None:
+            self._unindex_entry_value(
+                entity_id, device_id, self._pending_device_id_index
+            )
+        if (area_id := entity["area_id"]) is not None:
+            self._unindex_entry_value(entity_id, area_id, self._pending_area_id_index)
+        for label in entity["labels"]:
+            self._unindex_entry_value(entity_id, label, self._pending_labels_index)
+        return entity
+
+    def materialize(self, entity_id: str) -> RegistryEntry | None:
+        """Create a pending entry and return it.
+
+        Returns None if there is no pending entry for the entity_id.
+        """
+        if entity_id not in self._pending:
+            return None
+        entry = _entry_from_storage(self._pop_pending(entity_id))
+        self.data[entity_id] = entry
+        self._index_entry(entity_id, entry)
+        return entry
+
+    def materialize_all(self) -> None:
+        """Create all pending entries."""
+        for entity_id in list(self._pending):
+            self.materialize(entity_id)
+
+    def materialize_enabled(self) -> None:
+        """Create all pending entries which are not disabled."""
+        for entity_id, entity in list(self._pending.items()):
+            if not entity["disabled_by"]:
+                self.materialize(entity_id)
+
+    def storage_data(self) -> list[RegistryEntry | dict[str, Any]]:
+        """Return the entries and the storage data of the pending entries.
+
+        This is called from the executor while entries may be created on the
+        event loop. The pending entries are copied before the created entries,
+        so an entry created in between is in both copies and is only returned
+        once.
+        """
+        pending = list(self._pending.values())
+        entries = list(self.data.values())
+        if pending:
+            entity_ids = {entry.entity_id for entry in entries}
+            pending = [
+                entity for entity in pending if entity["entity_id"] not in entity_ids
+            ]
+        return [*entries, *pending]
+
+    def get_enabled_entries(self) -> list[RegistryEntry]:
+        """Return the entries which are not disabled.
+
+        Disabled entries which are pending are not created.
+        """
+        self.materialize_enabled()
+        return [entry for entry in self.data.values() if not entry.disabled_by]
+
+    def __contains__(self, key: object) -> bool:
+        """Return if the entity_id is registered."""
+        return key in self.data or key in self._pending
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self.data) + len(self._pending)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the entity_ids."""
+        if self._pending:
+            self.materialize_all()
+        return iter(self.data)
+
+    def __getitem__(self, key: str) -> RegistryEntry:
+        """Get an entry."""
+        if key in self._pending:
+            self.materialize(key)
+        return self.data[key]
+
+    def __setitem__(self, key: str, entry: RegistryEntry) -> None:
+        """Add an item."""
+        if key in self._pending:
+            self.materialize(key)
+        super().__setitem__(key, entry)
+
+    def __delitem__(self, key: str) -> None:
+        """Remove an item."""
+        if key in self._pending:
+            self.materialize(key)
+        super().__delitem__(key)
+
+    def values(self) -> ValuesView[RegistryEntry]:
+        """Return the entries."""
+        if self._pending:
+            self.materialize_all()
+        return self.data.values()
 
     def _index_entry(self, key: str, entry: RegistryEntry) -> None:
         """Index an entry."""
@@ -600,22 +786,27 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
             for label in labels:
                 self._unindex_entry_value(key, label, self._labels_index)
 
-    def get_device_ids(self) -> KeysView[str]:
+    def get_device_ids(self) -> set[str]:
         """Return device ids."""
-        return self._device_id_index.keys()
+        return self._device_id_index.keys() | self._pending_device_id_index.keys()
 
     def get_entity_id(self, key: tuple[str, str, str]) -> str | None:
         """Get entity_id from (domain, platform, unique_id)."""
-        return self._index.get(key)
+        return self._index.get(key) or self._pending_index.get(key)
 
     def get_entry(self, key: str) -> RegistryEntry | None:
         """Get entry from id."""
-        return self._entry_ids.get(key)
+        if (entry := self._entry_ids.get(key)) is None and key in self._pending_ids:
+            return self.materialize(self._pending_ids[key])
+        return entry
 
     def get_entries_for_device_id(
         self, device_id: str, include_disabled_entities: bool = False
     ) -> list[RegistryEntry]:
         """Get entries for device."""
+        if device_id in self._pending_device_id_index:
+            for entity_id in list(self._pending_device_id_index[device_id]):
+                self.materialize(entity_id)
         data = self.data
         return [
             entry
@@ -627,6 +818,9 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
         self, config_entry_id: str
     ) -> list[RegistryEntry]:
         """Get entries for config entry."""
+        if config_entry_id in self._pending_config_entry_id_index:
+            for entity_id in list(self._pending_config_entry_id_index[config_entry_id]):
+                self.materialize(entity_id)
         data = self.data
         return [
             data[key] for key in self._config_entry_id_index.get(config_entry_id, ())
@@ -634,11 +828,17 @@ class EntityRegistryItems(BaseRegistryItems[RegistryEntry]):
 
     def get_entries_for_area_id(self, area_id: str) -> list[RegistryEntry]:
         """Get entries for area."""
+        if area_id in self._pending_area_id_index:
+            for entity_id in list(self._pending_area_id_index[area_id]):
+                self.materialize(entity_id)
         data = self.data
         return [data[key] for key in self._area_id_index.get(area_id, ())]
 
     def get_entries_for_label(self, label: str) -> list[RegistryEntry]:
         """Get entries for label."""
+        if label in self._pending_labels_index:
+            for entity_id in list(self._pending_labels_index[label]):
+                self.materialize(entity_id)
         data = self.data
         return [data[key] for key in self._labels_index.get(label, ())]
 
@@ -713,6 +913,7 @@ class EntityRegistry(BaseRegistry):
             STORAGE_KEY,
             atomic_writes=True,
             minor_version=STORAGE_VERSION_MINOR,
+            binary_snapshot=True,
         )
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED,
@@ -731,8 +932,10 @@ class EntityRegistry(BaseRegistry):
         We retrieve the RegistryEntry from the underlying dict to avoid
         the overhead of the UserDict __getitem__.
         """
-        return self._entities_data.get(entity_id_or_uuid) or self.entities.get_entry(
-            entity_id_or_uuid
+        return (
+            self._entities_data.get(entity_id_or_uuid)
+            or self.entities.get_entry(entity_id_or_uuid)
+            or self.entities.materialize(entity_id_or_uuid)
         )
 
     @callback
@@ -1289,42 +1492,7 @@ class EntityRegistry(BaseRegistry):
                     )
                     continue
 
-                entities[entity["entity_id"]] = RegistryEntry(
-                    aliases=set(entity["aliases"]),
-                    area_id=entity["area_id"],
-                    categories=entity["categories"],
-                    capabilities=entity["capabilities"],
-                    config_entry_id=entity["config_entry_id"],
-                    created_at=datetime.fromisoformat(entity["created_at"]),
-                    device_class=entity["device_class"],
-                    device_id=entity["device_id"],
-                    disabled_by=RegistryEntryDisabler(entity["disabled_by"])
-                    if entity["disabled_by"]
-                    else None,
-                    entity_category=EntityCategory(entity["entity_category"])
-                    if entity["entity_category"]
-                    else None,
-                    entity_id=entity["entity_id"],
-                    hidden_by=RegistryEntryHider(entity["hidden_by"])
-                    if entity["hidden_by"]
-                    else None,
-                    icon=entity["icon"],
-                    id=entity["id"],
-                    has_entity_name=entity["has_entity_name"],
-                    labels=set(entity["labels"]),
-                    modified_at=datetime.fromisoformat(entity["modified_at"]),
-                    name=entity["name"],
-                    options=entity["options"],
-                    original_device_class=entity["original_device_class"],
-                    original_icon=entity["original_icon"],
-                    original_name=entity["original_name"],
-                    platform=entity["platform"],
-                    supported_features=entity["supported_features"],
-                    translation_key=entity["translation_key"],
-                    unique_id=entity["unique_id"],
-                    previous_unique_id=entity["previous_unique_id"],
-                    unit_of_measurement=entity["unit_of_measurement"],
-                )
+                entities.add_pending(entity)
             for entity in data["deleted_entities"]:
                 try:
                     domain = split_entity_id(entity["entity_id"])[0]
@@ -1361,7 +1529,10 @@ class EntityRegistry(BaseRegistry):
     def _data_to_save(self) -> dict[str, Any]:
         """Return data of entity registry to store in a file."""
         return {
-            "entities": [entry.as_storage_fragment for entry in self.entities.values()],
+            "entities": [
+                entry.as_storage_fragment if isinstance(entry, RegistryEntry) else entry
+                for entry in self.entities.storage_data()
+            ],
             "deleted_entities": [
                 entry.as_storage_fragment for entry in self.deleted_entities.values()
             ],
@@ -1607,7 +1778,9 @@ def _async_setup_entity_restore(hass: HomeAssistant, registry: EntityRegistry) -
         """Make sure state machine contains entry for each registered entity."""
         existing = set(hass.states.async_entity_ids())
 
-        for entry in registry.entities.values():
+        # Disabled entries are skipped, so they can stay pending
+        registry.entities.materialize_enabled()
+        for entry in registry.entities.data.values():
             if entry.entity_id in existing or entry.disabled:
                 continue
 
@@ -6,14 +6,16 @@ import asyncio
 from collections import defaultdict
 from collections.abc import Callable, Coroutine, Iterable, Mapping, Sequence
 import copy
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 import logging
 from random import randint
 import time
 from typing import TYPE_CHECKING, Any, Concatenate, Generic, TypeVar
 
+from jinja2 import Environment, TemplateSyntaxError, meta
+
 from homeassistant.const import (
     EVENT_CORE_CONFIG_UPDATE,
     EVENT_STATE_CHANGED,
@@ -75,6 +77,7 @@ _TRACK_ENTITY_REGISTRY_UPDATED_DATA: HassKey[
 _TRACK_DEVICE_REGISTRY_UPDATED_DATA: HassKey[
     _KeyedEventData[EventDeviceRegistryUpdatedData]
 ] = HassKey("track_device_registry_updated_data")
+_TEMPLATE_RENDER_CACHE: HassKey[TemplateRenderCache] = HassKey("template_render_cache")
 
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
@@ -107,22 +110,30 @@ class _KeyedEventTracker(Generic[_TypedDictT]):
         ],
         None,
     ]
-    filter_callable: Callable[
-        [
-            HomeAssistant,
-            dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
-            _TypedDictT,
-        ],
-        bool,
-    ]
+    filter_callable: (
+        Callable[
+            [
+                HomeAssistant,
+                dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
+                _TypedDictT,
+            ],
+            bool,
+        ]
+        | None
+    ) = None
+    # The event data key to index the dispatcher by on the event bus,
+    # used instead of the filter_callable when the key is a plain value
+    data_key: str | None = None
 
 
 @dataclass(slots=True, frozen=True)
 class _KeyedEventData(Generic[_TypedDictT]):
     """Class to track data for events by key."""
 
-    listener: CALLBACK_TYPE
+    listener: CALLBACK_TYPE | None
     callbacks: defaultdict[str, list[HassJob[[Event[_TypedDictT]], Any]]]
+    dispatcher_job: HassJob[[Event[_TypedDictT]], Any] | None = None
+    key_listeners: dict[str, CALLBACK_TYPE] = field(default_factory=dict)
 
 
 @dataclass(slots=True)
@@ -358,21 +369,11 @@ def _async_dispatch_entity_id_event(
             )
 
 
-@callback
-def _async_state_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[_StateEventDataT]], Any]]],
-    event_data: _StateEventDataT,
-) -> bool:
-    """Filter state changes by entity_id."""
-    return event_data["entity_id"] in callbacks
-
-
 _KEYED_TRACK_STATE_CHANGE = _KeyedEventTracker(
     key=_TRACK_STATE_CHANGE_DATA,
     event_type=EVENT_STATE_CHANGED,
     dispatcher_callable=_async_dispatch_entity_id_event_soon,
-    filter_callable=_async_state_filter,
+    data_key="entity_id",
 )
 
 
@@ -393,7 +394,7 @@ _KEYED_TRACK_STATE_REPORT = _KeyedEventTracker(
     key=_TRACK_STATE_REPORT_DATA,
     event_type=EVENT_STATE_REPORTED,
     dispatcher_callable=_async_dispatch_entity_id_event,
-    filter_callable=_async_state_filter,
+    data_key="entity_id",
 )
 
 
@@ -423,13 +424,21 @@ def _remove_listener(
     callbacks: dict[str, list[HassJob[[Event[_TypedDictT]], Any]]],
 ) -> None:
     """Remove listener."""
+    event_data = hass.data[tracker.key]
+    key_listeners = event_data.key_listeners
     for key in keys:
         callbacks[key].remove(job)
         if not callbacks[key]:
             del callbacks[key]
+            if key in key_listeners:
+                key_listeners.pop(key)()
 
-    if not callbacks:
-        hass.data.pop(tracker.key).listener()
+    # The data of a keyed tracker is kept once its last listener is removed
+    # because the dispatches that are queued refer to its callbacks. A
+    # listener that is added again before they run must still receive them.
+    if not callbacks and (listener := event_data.listener):
+        del hass.data[tracker.key]
+        listener()
 
 
 # tracker, not hass is intentionally the first argument here since its
@@ -455,12 +464,23 @@ def _async_track_event(
         callbacks = event_data.callbacks
     else:
         callbacks = defaultdict(list)
-        listener = hass.bus.async_listen(
-            tracker.event_type,
-            partial(tracker.dispatcher_callable, hass, callbacks),
-            event_filter=partial(tracker.filter_callable, hass, callbacks),
-        )
-        event_data = _KeyedEventData(listener, callbacks)
+        dispatcher = partial(tracker.dispatcher_callable, hass, callbacks)
+        if tracker.data_key:
+            # The dispatcher is added to the keyed listeners
+            # of the event bus for every key that is tracked
+            event_data = _KeyedEventData(
+                None,
+                callbacks,
+                HassJob(dispatcher, f"dispatch {tracker.event_type} events"),
+            )
+        else:
+            assert tracker.filter_callable is not None
+            listener = hass.bus.async_listen(
+                tracker.event_type,
+                dispatcher,
+                event_filter=partial(tracker.filter_callable, hass, callbacks),
+            )
+            event_data = _KeyedEventData(listener, callbacks)
         hass_data[tracker_key] = event_data
 
     job = HassJob(action, f"track {tracker.event_type} event {keys}", job_type=job_type)
@@ -477,6 +497,18 @@ def _async_track_event(
         for key in keys:
             callbacks[key].append(job)
 
+    if dispatcher_job := event_data.dispatcher_job:
+        assert tracker.data_key is not None
+        key_listeners = event_data.key_listeners
+        for key in keys:
+            if key not in key_listeners:
+                key_listeners[key] = hass.bus.async_listen_keyed(
+                    tracker.event_type,
+                    tracker.data_key,
+                    (key,),
+                    dispatcher_job,
+                )
+
     return partial(_remove_listener, hass, tracker, keys, job, callbacks)
 
 
@@ -541,16 +573,6 @@ def async_track_entity_registry_updated_event(
     )
 
 
-@callback
-def _async_device_registry_updated_filter(
-    hass: HomeAssistant,
-    callbacks: dict[str, list[HassJob[[Event[EventDeviceRegistryUpdatedData]], Any]]],
-    event_data: EventDeviceRegistryUpdatedData,
-) -> bool:
-    """Filter device registry updates by device_id."""
-    return event_data["device_id"] in callbacks
-
-
 @callback
 def _async_dispatch_device_id_event(
     hass: HomeAssistant,
@@ -575,7 +597,7 @@ _KEYED_TRACK_DEVICE_REGISTRY_UPDATED = _KeyedEventTracker(
     key=_TRACK_DEVICE_REGISTRY_UPDATED_DATA,
     event_type=EVENT_DEVICE_REGISTRY_UPDATED,
     dispatcher_callable=_async_dispatch_device_id_event,
-    filter_callable=_async_device_registry_updated_filter,
+    data_key="device_id",
 )
 
 
@@ -962,6 +984,102 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+# Only used to find the variables a template references
+_VARIABLE_NAMES_ENV = Environment(extensions=["jinja2.ext.loopcontrols"])
+
+
+@lru_cache(maxsize=4096)
+def _template_variable_names(source: str) -> frozenset[str] | None:
+    """Return the names of the undeclared variables of a template source."""
+    try:
+        return frozenset(
+            meta.find_undeclared_variables(_VARIABLE_NAMES_ENV.parse(source))
+        )
+    except TemplateSyntaxError:
+        return None
+
+
+class TemplateRenderCache:
+    """Share the renders of identical templates for a state change.
+
+    Trackers of templates with the same source, which do not reference
+    any of their variables, render them once per state_changed event. A
+    render is only shared for the event it was rendered for and while the
+    states of the entities it references are unchanged. Renders that depend
+    on domains, all states or the time are not shared.
+    """
+
+    __slots__ = ("_event", "_renders", "hits", "misses")
+
+    def __init__(self) -> None:
+        """Initialize the render cache."""
+        self._event: Event[EventStateChangedData] | None = None
+        self._renders: dict[
+            tuple[Any, ...], tuple[RenderInfo, list[tuple[str, State | None]]]
+        ] = {}
+        self.hits = 0
+        self.misses = 0
+
+    @callback
+    def async_render_to_info(
+        self,
+        hass: HomeAssistant,
+        track_template_: TrackTemplate,
+        event: Event[EventStateChangedData],
+    ) -> RenderInfo:
+        """Render a template or return the render shared for the event."""
+        template = track_template_.template
+        variables = track_template_.variables
+        if event is not self._event:
+            self._event = event
+            self._renders.clear()
+
+        if variables and (
+            (names := _template_variable_names(template.template)) is None
+            or not names.isdisjoint(variables)
+        ):
+            self.misses += 1
+            return template.async_render_to_info(variables)
+
+        key = (
+            template.template,
+            template._limited,  # noqa: SLF001
+            template._strict,  # noqa: SLF001
+            template._log_fn,  # noqa: SLF001
+        )
+        states = hass.states
+        if (shared := self._renders.get(key)) is not None:
+            info, entity_states = shared
+            if all(
+                states.get(entity_id) is state for entity_id, state in entity_states
+            ):
+                self.hits += 1
+                return info
+
+        self.misses += 1
+        info = template.async_render_to_info(variables)
+        if not (
+            info.all_states
+            or info.all_states_lifecycle
+            or info.domains
+            or info.domains_lifecycle
+            or info.has_time
+        ):
+            self._renders[key] = (
+                info,
+                [(entity_id, states.get(entity_id)) for entity_id in info.entities],
+            )
+        return info
+
+
+@callback
+def async_get_template_render_cache(hass: HomeAssistant) -> TemplateRenderCache:
+    """Return the template render cache shared by template trackers."""
+    if (render_cache := hass.data.get(_TEMPLATE_RENDER_CACHE)) is None:
+        render_cache = hass.data[_TEMPLATE_RENDER_CACHE] = TemplateRenderCache()
+    return render_cache
+
+
 class TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -998,6 +1116,7 @@ class TrackTemplateResultInfo:
             track_template_.template.hass = hass
 
         self._rate_limit = KeyedRateLimit(hass)
+        self._render_cache = async_get_template_render_cache(hass)
         self._info: dict[Template, RenderInfo] = {}
         self._track_state_changes: _TrackStateChangeFiltered | None = None
         self._time_listeners: dict[Template, Callable[[], None]] = {}
@@ -1126,6 +1245,7 @@ class TrackTemplateResultInfo:
         track_template_: TrackTemplate,
         now: float,
         event: Event[EventStateChangedData] | None,
+        replayed: bool | None = False,
     ) -> bool | TrackTemplateResult:
         """Re-render the template if conditions match.
 
@@ -1165,9 +1285,13 @@ class TrackTemplateResultInfo:
             )
 
         self._rate_limit.async_triggered(template, now)
-        self._info[template] = info = template.async_render_to_info(
-            track_template_.variables
-        )
+        if event and not replayed:
+            info = self._render_cache.async_render_to_info(
+                self.hass, track_template_, event
+            )
+        else:
+            info = template.async_render_to_info(track_template_.variables)
+        self._info[template] = info
 
         try:
             result: str | TemplateError = info.result()
@@ -1241,7 +1365,9 @@ class TrackTemplateResultInfo:
 
         # Update the super template first
         if super_template is not None:
-            update = self._render_template_if_ready(super_template, now, event)
+            update = self._render_template_if_ready(
+                super_template, now, event, replayed
+            )
             info_changed |= self._apply_update(updates, update, super_template.template)
 
             if isinstance(update, TrackTemplateResult):
@@ -1272,7 +1398,9 @@ class TrackTemplateResultInfo:
                 if track_template_ == super_template:
                     continue
 
-                update = self._render_template_if_ready(track_template_, now, event)
+                update = self._render_template_if_ready(
+                    track_template_, now, event, replayed
+                )
                 info_changed |= self._apply_update(
                     updates, update, track_template_.template
                 )
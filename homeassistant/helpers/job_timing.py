@@ -0,0 +1,153 @@
+"""Opt-in timing of the jobs run in the event loop.
+
+When enabled, every HassJob run with HomeAssistant.async_run_hass_job,
+which includes all event listeners, is timed and the wall time is
+aggregated per job and per integration. The timings are recorded by the
+job timer of Home Assistant, which is removed when the timing is disabled.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_right
+from collections.abc import Callable
+from dataclasses import dataclass, field
+import functools
+import time
+from typing import Any
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.util import dt as dt_util
+from homeassistant.util.hass_dict import HassKey
+
+DATA_JOB_TIMINGS: HassKey[JobTimings] = HassKey("job_timings")
+
+# Upper bounds in seconds of the slow job histogram buckets,
+# the last bucket counts all the jobs that are slower
+SLOW_JOB_BUCKETS = (0.001, 0.01, 0.1, 1.0)
+SLOW_JOB_BUCKET_NAMES = ("<1ms", "<10ms", "<100ms", "<1s", ">=1s")
+
+INTEGRATION_CORE = "core"
+
+
+@dataclass(slots=True)
+class JobTiming:
+    """Aggregated timing of a job or an integration."""
+
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    histogram: list[int] = field(
+        default_factory=lambda: [0] * len(SLOW_JOB_BUCKET_NAMES)
+    )
+
+    def record(self, duration: float) -> None:
+        """Record a run of the job."""
+        self.calls += 1
+        self.total += duration
+        self.max = max(self.max, duration)
+        self.histogram[bisect_right(SLOW_JOB_BUCKETS, duration)] += 1
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the timing as a dict."""
+        return {
+            "calls": self.calls,
+            "total": self.total,
+            "mean": self.total / self.calls if self.calls else 0.0,
+            "max": self.max,
+            "histogram": dict(zip(SLOW_JOB_BUCKET_NAMES, self.histogram, strict=True)),
+        }
+
+
+def _job_name(target: Callable[..., Any]) -> tuple[str, str]:
+    """Return the name and the integration of the target of a job."""
+    while isinstance(target, functools.partial):
+        target = target.func
+    module: str = getattr(target, "__module__", None) or ""
+    qualname: str = getattr(target, "__qualname__", None) or type(target).__qualname__
+    parts = module.split(".")
+    if module.startswith("homeassistant.components.") and len(parts) > 2:
+        integration = parts[2]
+    elif module.startswith("custom_components.") and len(parts) > 1:
+        integration = parts[1]
+    else:
+        integration = INTEGRATION_CORE
+    return f"{module}.{qualname}", integration
+
+
+class JobTimings:
+    """Aggregate the wall time of the jobs run in the event loop.
+
+    The time of a job includes the time of the jobs it runs itself and
+    for coroutine functions only the time to create the task is included.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the timings."""
+        self.started = dt_util.utcnow()
+        self._start_time = time.monotonic()
+        self._jobs: dict[str, JobTiming] = {}
+        self._integrations: dict[str, JobTiming] = {}
+        self._job_integration: dict[str, str] = {}
+
+    @callback
+    def async_record(self, hassjob: HassJob[..., Any], duration: float) -> None:
+        """Record a run of a job."""
+        name, integration = _job_name(hassjob.target)
+        if (job_timing := self._jobs.get(name)) is None:
+            job_timing = self._jobs[name] = JobTiming()
+            self._job_integration[name] = integration
+            if integration not in self._integrations:
+                self._integrations[integration] = JobTiming()
+        job_timing.record(duration)
+        self._integrations[integration].record(duration)
+
+    @callback
+    def async_as_dict(self, limit: int | None = None) -> dict[str, Any]:
+        """Return a report of the timings with the slowest jobs first."""
+        jobs = sorted(self._jobs.items(), key=lambda item: item[1].total, reverse=True)
+        if limit is not None:
+            jobs = jobs[:limit]
+        return {
+            "started": self.started.isoformat(),
+            "duration": time.monotonic() - self._start_time,
+            "integrations": {
+                integration: timing.as_dict()
+                for integration, timing in sorted(
+                    self._integrations.items(),
+                    key=lambda item: item[1].total,
+                    reverse=True,
+                )
+            },
+            "jobs": [
+                {
+                    "name": name,
+                    "integration": self._job_integration[name],
+                    **timing.as_dict(),
+                }
+                for name, timing in jobs
+            ],
+        }
+
+
+@callback
+def async_enable_job_timing(hass: HomeAssistant) -> JobTimings:
+    """Start timing the jobs run in the event loop."""
+    if (timings := hass.data.get(DATA_JOB_TIMINGS)) is not None:
+        return timings
+    timings = hass.data[DATA_JOB_TIMINGS] = JobTimings()
+    hass.async_set_job_timer(timings.async_record)
+    return timings
+
+
+@callback
+def async_disable_job_timing(hass: HomeAssistant) -> JobTimings | None:
+    """Stop timing the jobs and return the collected timings."""
+    if (timings := hass.data.pop(DATA_JOB_TIMINGS, None)) is not None:
+        hass.async_set_job_timer(None)
+    return timings
+
+
+@callback
+def async_get_job_timings(hass: HomeAssistant) -> JobTimings | None:
+    """Return the timings collected so far or None if timing is not enabled."""
+    return hass.data.get(DATA_JOB_TIMINGS)
@@ -0,0 +1,288 @@
+"""Plan the integration imports at startup from the profile of the last start.
+
+While the integrations are set up, a timeline of every integration is
+recorded: when it was resolved, how long it took to import and how long
+it took to set up. The timeline is stored so the next start can import
+the integrations in the order that unblocks the setups the soonest.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import logging
+import sys
+import time
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.requirements import async_requirements_installed
+from homeassistant.util.hass_dict import HassKey
+
+from .storage import Store
+
+if TYPE_CHECKING:
+    from homeassistant.loader import Integration
+
+DATA_STARTUP_PROFILE: HassKey[StartupProfile] = HassKey("startup_profile")
+
+_LOGGER = logging.getLogger(__name__)
+
+STORAGE_KEY = "core.startup_profile"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+# The import executor has a single worker, keep only a few imports queued
+# so the imports the setups wait for are not stuck behind the whole plan
+PREIMPORT_MAX_PENDING = 2
+
+
+@dataclass(slots=True)
+class IntegrationTimeline:
+    """Timeline of an integration during startup.
+
+    resolved is the time since the start of the setup of the integrations
+    until the manifest of the integration was resolved, the others are
+    durations.
+    """
+
+    resolved: float | None = None
+    import_: float | None = None
+    setup: float | None = None
+
+    @classmethod
+    def from_dict(cls, data: Mapping[str, Any]) -> IntegrationTimeline:
+        """Create a timeline from its stored form."""
+        return cls(data.get("resolved"), data.get("import"), data.get("setup"))
+
+    def as_dict(self) -> dict[str, float]:
+        """Return the stored form of the timeline."""
+        return {
+            key: value
+            for key, value in (
+                ("resolved", self.resolved),
+                ("import", self.import_),
+                ("setup", self.setup),
+            )
+            if value is not None
+        }
+
+    @property
+    def cost(self) -> float:
+        """Return the time the integration took to become available."""
+        return (self.import_ or 0.0) + (self.setup or 0.0)
+
+
+class StartupProfile:
+    """Timeline of the integrations of the current and the last start."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the profile."""
+        self.hass = hass
+        self.previous: dict[str, IntegrationTimeline] = {}
+        self.current: dict[str, IntegrationTimeline] = {}
+        self._store = Store[dict[str, dict[str, dict[str, float]]]](
+            hass, STORAGE_VERSION, STORAGE_KEY
+        )
+        self._started = time.monotonic()
+
+    async def async_load(self) -> None:
+        """Load the profile of the last start."""
+        if not (data := await self._store.async_load()):
+            return
+        self.previous = {
+            domain: IntegrationTimeline.from_dict(timeline)
+            for domain, timeline in data["integrations"].items()
+        }
+
+    def _timeline(self, domain: str) -> IntegrationTimeline:
+        """Return the timeline of an integration in the current start."""
+        if (timeline := self.current.get(domain)) is None:
+            timeline = self.current[domain] = IntegrationTimeline()
+        return timeline
+
+    @callback
+    def async_resolved(self, domains: Iterable[str]) -> None:
+        """Record that the manifests of the integrations are resolved."""
+        resolved = time.monotonic() - self._started
+        for domain in domains:
+            timeline = self._timeline(domain)
+            if timeline.resolved is None:
+                timeline.resolved = resolved
+
+    @callback
+    def async_imported(self, domain: str, duration: float) -> None:
+        """Record the import time of an integration."""
+        self._timeline(domain).import_ = duration
+
+    @callback
+    def async_set_up(self, setup_times: Mapping[str, float]) -> None:
+        """Record the setup times of the integrations and save the profile."""
+        for domain, duration in setup_times.items():
+            self._timeline(domain).setup = duration
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, dict[str, float]]]:
+        """Return the data to store.
+
+        Import times of integrations that were already imported when
+        they were planned are kept from the previous start.
+        """
+        integrations: dict[str, dict[str, float]] = {}
+        for domain, timeline in self.current.items():
+            data = integrations[domain] = timeline.as_dict()
+            if (
+                timeline.import_ is None
+                and (previous := self.previous.get(domain)) is not None
+                and previous.import_ is not None
+            ):
+                data["import"] = previous.import_
+        return {"integrations": integrations}
+
+    @callback
+    def async_plan_imports(
+        self,
+        integrations: Mapping[str, Integration],
+        first: Iterable[str] = (),
+    ) -> list[Integration]:
+        """Return the order to import the integrations in.
+
+        The dependency graph is built from the manifests and every
+        integration is imported after its dependencies, since its setup
+        has to wait for them anyway. Integrations in first and their
+        dependencies come before the others and integrations that took
+        the longest to import and set up during the last start come first
+        among their peers.
+        """
+        depths: dict[str, int] = {}
+
+        def _depth(domain: str, visiting: set[str]) -> int:
+            """Return the length of the longest chain of dependencies."""
+            if (depth := depths.get(domain)) is not None:
+                return depth
+            depth = 0
+            if (integration := integrations.get(domain)) is not None:
+                visiting.add(domain)
+                for dep in integration.dependencies:
+                    if dep not in visiting:
+                        depth = max(depth, _depth(dep, visiting) + 1)
+                visiting.discard(domain)
+            depths[domain] = depth
+            return depth
+
+        first_domains: set[str] = set()
+        pending = list(first)
+        while pending:
+            if (domain := pending.pop()) in first_domains:
+                continue
+            first_domains.add(domain)
+            if (integration := integrations.get(domain)) is not None:
+                pending.extend(integration.dependencies)
+
+        previous = self.previous
+        no_cost = IntegrationTimeline()
+        return [
+            integrations[domain]
+            for domain in sorted(
+                integrations,
+                key=lambda domain: (
+                    domain not in first_domains,
+                    _depth(domain, set()),
+                    -previous.get(domain, no_cost).cost,
+                    domain,
+                ),
+            )
+        ]
+
+    def _requirements_installed(
+        self, integration: Integration, integrations: Mapping[str, Integration]
+    ) -> bool:
+        """Return if the requirements for an integration are installed.
+
+        The requirements of its dependencies have to be installed too. An
+        integration imported before its requirements are installed could
+        import an outdated version of a library that would stay imported
+        after its setup installed the new version.
+        """
+        hass = self.hass
+        try:
+            dependencies = integration.all_dependencies
+        except RuntimeError:
+            return False
+        for domain in (integration.domain, *dependencies):
+            if (
+                dependency := integrations.get(domain)
+            ) is None or not async_requirements_installed(
+                hass, dependency.requirements
+            ):
+                return False
+        return True
+
+    async def async_preimport(self, integrations: Iterable[Integration]) -> None:
+        """Import the integrations in order in the import executor.
+
+        Only integrations whose requirements are already installed are
+        imported, the others are imported when they are set up, after
+        their requirements were processed. Errors are ignored since the
+        setup of the integration will import it again and report them.
+        """
+        integrations = list(integrations)
+        by_domain = {integration.domain: integration for integration in integrations}
+        semaphore = asyncio.Semaphore(PREIMPORT_MAX_PENDING)
+
+        async def _async_import(integration: Integration) -> None:
+            """Import an integration and record the time it took."""
+            try:
+                duration = await self.hass.async_add_import_executor_job(
+                    _import_integration, integration
+                )
+            except Exception:  # noqa: BLE001
+                _LOGGER.debug(
+                    "Pre-import of %s failed", integration.domain, exc_info=True
+                )
+            else:
+                self.async_imported(integration.domain, duration)
+            finally:
+                semaphore.release()
+
+        tasks: list[asyncio.Task[None]] = []
+        for integration in integrations:
+            # Integrations that are not imported in the executor would block
+            # the event loop, they are imported when they are set up instead
+            if (
+                not integration.import_executor
+                or integration.pkg_path in sys.modules
+                or not self._requirements_installed(integration, by_domain)
+            ):
+                continue
+            await semaphore.acquire()
+            tasks.append(
+                self.hass.async_create_background_task(
+                    _async_import(integration),
+                    f"pre-import {integration.domain}",
+                    eager_start=True,
+                )
+            )
+        if tasks:
+            await asyncio.wait(tasks)
+
+
+def _import_integration(integration: Integration) -> float:
+    """Import an integration and return the time it took.
+
+    The time is measured in the import executor so the time the import
+    waited in the queue of the executor is not included.
+    """
+    start = time.perf_counter()
+    integration.get_component(preload_platforms=True)
+    return time.perf_counter() - start
+
+
+@callback
+def async_get_startup_profile(hass: HomeAssistant) -> StartupProfile:
+    """Return the startup profile."""
+    if (profile := hass.data.get(DATA_STARTUP_PROFILE)) is None:
+        profile = hass.data[DATA_STARTUP_PROFILE] = StartupProfile(hass)
+    return profile
@@ -6,12 +6,17 @@ import asyncio
 from collections.abc import Callable, Iterable, Mapping, Sequence
 from contextlib import suppress
 from copy import deepcopy
+from dataclasses import dataclass
 import inspect
 from json import JSONDecodeError, JSONEncoder
 import logging
+import marshal
+import mmap
 import os
 from pathlib import Path
+import struct
 from typing import Any
+import zlib
 
 from propcache import cached_property
 
@@ -32,7 +37,7 @@ from homeassistant.exceptions import HomeAssistantError
 from homeassistant.loader import bind_hass
 from homeassistant.util import json as json_util
 import homeassistant.util.dt as dt_util
-from homeassistant.util.file import WriteError
+from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_files_atomic
 from homeassistant.util.hass_dict import HassKey
 
 from . import json as json_helper
@@ -49,6 +54,20 @@ STORAGE_MANAGER: HassKey[_StoreManager] = HassKey("storage_manager")
 
 MANAGER_CLEANUP_DELAY = 60
 
+# Delayed writes that are due within this many seconds of a delayed write
+# that is due now are written together with it in one executor job
+WRITE_BATCH_WINDOW = 1.0
+
+# Binary snapshots are written next to the JSON file of stores that
+# enable them. The header has the size and mtime of the JSON file the
+# snapshot was made from and the CRC32 of the marshal payload. Files
+# are replaced when they are written, so checking them only takes a
+# stat of the JSON file.
+SNAPSHOT_SUFFIX = ".snapshot"
+_SNAPSHOT_MAGIC = b"HASS"
+_SNAPSHOT_VERSION = 3
+_SNAPSHOT_HEADER = struct.Struct("<4sBxxxQqI")
+
 
 @bind_hass
 async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
@@ -90,6 +109,85 @@ async def async_migrator[_T: Mapping[str, Any] | Sequence[Any]](
     return config
 
 
+@callback
+def async_get_write_stats(hass: HomeAssistant) -> dict[str, dict[str, int]]:
+    """Return the number of writes and bytes written per storage key."""
+    return get_internal_store_manager(hass).async_get_write_stats()
+
+
+def _read_snapshot_stat_key(path: str) -> tuple[int, int] | None:
+    """Return the size and mtime of the JSON file a snapshot was made from."""
+    try:
+        with open(f"{path}{SNAPSHOT_SUFFIX}", "rb") as fp:
+            magic, version, size, mtime_ns, _ = _SNAPSHOT_HEADER.unpack(
+                fp.read(_SNAPSHOT_HEADER.size)
+            )
+    except (OSError, struct.error):
+        return None
+    if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+        return None
+    return size, mtime_ns
+
+
+def _load_snapshot(path: str) -> json_util.JsonValueType | None:
+    """Load the binary snapshot of a storage file.
+
+    Returns None if there is no snapshot or if it was not made from the
+    current content of the file.
+    """
+    try:
+        if (stat_key := _read_snapshot_stat_key(path)) is None:
+            return None
+        stat_result = os.stat(path)
+        if (stat_result.st_size, stat_result.st_mtime_ns) != stat_key:
+            _LOGGER.debug("Snapshot of %s is outdated", path)
+            return None
+        with (
+            open(f"{path}{SNAPSHOT_SUFFIX}", "rb") as fp,
+            mmap.mmap(fp.fileno(), 0, access=mmap.ACCESS_READ) as mapped,
+        ):
+            crc = _SNAPSHOT_HEADER.unpack_from(mapped)[4]
+            with (
+                memoryview(mapped) as view,
+                view[_SNAPSHOT_HEADER.size :] as payload,
+            ):
+                if zlib.crc32(payload) != crc:
+                    _LOGGER.debug("Snapshot of %s is corrupt", path)
+                    return None
+                data: json_util.JsonValueType = marshal.loads(payload)
+    except FileNotFoundError:
+        return None
+    except (OSError, ValueError, EOFError, TypeError, struct.error) as err:
+        _LOGGER.debug("Error loading snapshot of %s: %s", path, err)
+        return None
+    return data
+
+
+def _load_storage_file(path: str, snapshot: bool) -> json_util.JsonValueType:
+    """Load a storage file from its snapshot if it has one or from JSON."""
+    if snapshot and (data := _load_snapshot(path)) is not None:
+        return data
+    return json_util.load_json(path)
+
+
+def _make_snapshot(path: str) -> bytes | None:
+    """Return the binary snapshot of a storage file.
+
+    Returns None if the current snapshot was made from the same file.
+    """
+    with open(path, "rb") as fp:
+        stat_result = os.fstat(fp.fileno())
+        stat_key = (stat_result.st_size, stat_result.st_mtime_ns)
+        if _read_snapshot_stat_key(path) == stat_key:
+            return None
+        json_data = fp.read()
+    payload = marshal.dumps(json_util.json_loads(json_data))
+    header = _SNAPSHOT_HEADER.pack(
+        _SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, *stat_key, zlib.crc32(payload)
+    )
+    return header + payload
+
+
 def get_internal_store_manager(hass: HomeAssistant) -> _StoreManager:
     """Get the store manager.
 
@@ -103,10 +201,33 @@ def get_internal_store_manager(hass: HomeAssistant) -> _StoreManager:
     return hass.data[STORAGE_MANAGER]
 
 
+@dataclass(slots=True)
+class _StoreWriteStats:
+    """Write statistics of a storage key."""
+
+    writes: int = 0
+    bytes: int = 0
+    errors: int = 0
+
+
+@dataclass(slots=True)
+class _PendingWrite:
+    """A write that is waiting for the next write batch."""
+
+    store: Store
+    path: str
+    data: dict
+    future: asyncio.Future[None]
+
+
 class _StoreManager:
     """Class to help storing data.
 
     The store manager is used to cache and manage storage files.
+
+    It also writes the data of the stores. The writes that are requested
+    in the same event loop iteration are done in a single executor job
+    and the atomic writes among them share their fsyncs.
     """
 
     def __init__(self, hass: HomeAssistant) -> None:
@@ -117,6 +238,12 @@ class _StoreManager:
         self._data_preload: dict[str, json_util.JsonValueType] = {}
         self._storage_path: Path = Path(hass.config.config_dir).joinpath(STORAGE_DIR)
         self._cancel_cleanup: asyncio.TimerHandle | None = None
+        self._delayed_writes: dict[Store, tuple[float, CALLBACK_TYPE]] = {}
+        self._pending_writes: list[_PendingWrite] = []
+        self._write_handle: asyncio.Handle | None = None
+        self._write_stats: dict[str, _StoreWriteStats] = {}
+        self._snapshot_stores: dict[str, Store] = {}
+        self._unsub_snapshot_listener: CALLBACK_TYPE | None = None
 
     async def async_initialize(self) -> None:
         """Initialize the storage manager."""
@@ -213,11 +340,14 @@ class _StoreManager:
         """Cache the keys."""
         storage_path = self._storage_path
         data_preload = self._data_preload
+        files = self._files or set()
         for key in keys:
             storage_file: Path = storage_path.joinpath(key)
             try:
                 if storage_file.is_file():
-                    data_preload[key] = json_util.load_json(storage_file)
+                    data_preload[key] = _load_storage_file(
+                        str(storage_file), f"{key}{SNAPSHOT_SUFFIX}" in files
+                    )
             except Exception as ex:  # noqa: BLE001
                 _LOGGER.debug("Error loading %s: %s", key, ex)
 
@@ -226,6 +356,172 @@ class _StoreManager:
         if self._storage_path.exists():
             self._files = set(os.listdir(self._storage_path))
 
+    @callback
+    def async_add_delayed_write(
+        self, store: Store, when: float, write_callback: CALLBACK_TYPE
+    ) -> None:
+        """Track the deadline of the delayed write of a store."""
+        self._delayed_writes[store] = (when, write_callback)
+
+    @callback
+    def async_remove_delayed_write(self, store: Store) -> None:
+        """Stop tracking the delayed write of a store."""
+        self._delayed_writes.pop(store, None)
+
+    @callback
+    def async_run_delayed_writes(self, store: Store) -> None:
+        """Run the delayed write of a store and those that are due soon after it.
+
+        The delayed writes that are due within WRITE_BATCH_WINDOW are
+        brought forward so they end up in the same write batch. A delayed
+        write is never run after its deadline.
+        """
+        due = self._hass.loop.time() + WRITE_BATCH_WINDOW
+        delayed_writes = self._delayed_writes
+        run = [
+            other
+            for other, (when, _) in delayed_writes.items()
+            if other is store or when <= due
+        ]
+        for other in run:
+            if (delayed_write := delayed_writes.pop(other, None)) is not None:
+                delayed_write[1]()
+
+    async def async_write_data(self, store: Store, path: str, data: dict) -> None:
+        """Write the data of a store in the next write batch."""
+        future: asyncio.Future[None] = self._hass.loop.create_future()
+        self._pending_writes.append(_PendingWrite(store, path, data, future))
+        if self._write_handle is None:
+            self._write_handle = self._hass.loop.call_soon(self._async_write_batch)
+        await future
+
+    @callback
+    def _async_write_batch(self) -> None:
+        """Start writing the pending writes."""
+        self._write_handle = None
+        writes = self._pending_writes
+        self._pending_writes = []
+        self._hass.async_create_task_internal(
+            self._async_write_pending(writes), "storage write batch", eager_start=True
+        )
+
+    async def _async_write_pending(self, writes: list[_PendingWrite]) -> None:
+        """Write a batch of pending writes in the executor."""
+        try:
+            results = await self._hass.async_add_executor_job(
+                self._write_pending, writes
+            )
+        except BaseException:
+            for write in writes:
+                write.future.cancel()
+            raise
+        write_stats = self._write_stats
+        for write, (error, written) in zip(writes, results, strict=True):
+            if (stats := write_stats.get(write.store.key)) is None:
+                stats = write_stats[write.store.key] = _StoreWriteStats()
+            if error is None:
+                stats.writes += 1
+                stats.bytes += written
+            else:
+                stats.errors += 1
+            if write.future.done():
+                # The caller was cancelled
+                continue
+            if error is None:
+                write.future.set_result(None)
+            else:
+                write.future.set_exception(error)
+
+    def _write_pending(
+        self, writes: list[_PendingWrite]
+    ) -> list[tuple[Exception | None, int]]:
+        """Write a batch of pending writes.
+
+        Returns the error and the number of bytes written of each write.
+        """
+        _LOGGER.debug("Writing a batch of %s stores", len(writes))
+        results: list[tuple[Exception | None, int]] = []
+        atomic_files: list[tuple[str, bytes | str, bool, str]] = []
+        atomic_indexes: list[int] = []
+        for idx, write in enumerate(writes):
+            store = write.store
+            try:
+                json_data, mode = store.prepare_write_data(write.path, write.data)
+                written = len(
+                    json_data.encode() if isinstance(json_data, str) else json_data
+                )
+                if store.atomic_writes:
+                    atomic_files.append((write.path, json_data, store.private, mode))
+                    atomic_indexes.append(idx)
+                else:
+                    write_utf8_file(write.path, json_data, store.private, mode=mode)
+            except Exception as err:  # noqa: BLE001
+                results.append((err, 0))
+            else:
+                results.append((None, written))
+
+        if atomic_files:
+            errors = write_utf8_files_atomic(atomic_files)
+            for idx, error in zip(atomic_indexes, errors, strict=True):
+                if error is not None:
+                    results[idx] = (error, 0)
+
+        return results
+
+    @callback
+    def async_add_snapshot_store(self, store: Store) -> None:
+        """Write the binary snapshot of a store when Home Assistant stops."""
+        self._snapshot_stores[store.key] = store
+        if self._unsub_snapshot_listener is None:
+            self._unsub_snapshot_listener = self._hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_FINAL_WRITE, self._async_write_snapshots
+            )
+
+    @callback
+    def async_remove_snapshot_store(self, store: Store) -> None:
+        """Stop writing the binary snapshot of a store."""
+        self._snapshot_stores.pop(store.key, None)
+
+    async def _async_write_snapshots(self, _event: Event) -> None:
+        """Write the binary snapshots once the stores have written their data."""
+        self._unsub_snapshot_listener = None
+        stores = list(self._snapshot_stores.values())
+        self._snapshot_stores.clear()
+        await asyncio.gather(*(store.async_write_pending() for store in stores))
+        await self._hass.async_add_executor_job(
+            self._write_snapshots, [(store.path, store.private) for store in stores]
+        )
+
+    def _write_snapshots(self, stores: list[tuple[str, bool]]) -> None:
+        """Write the binary snapshots that are outdated."""
+        files: list[tuple[str, bytes | str, bool, str]] = []
+        for path, private in stores:
+            try:
+                snapshot = _make_snapshot(path)
+            except FileNotFoundError:
+                continue
+            except Exception:
+                _LOGGER.exception("Error making snapshot of %s", path)
+                continue
+            if snapshot is not None:
+                files.append((f"{path}{SNAPSHOT_SUFFIX}", snapshot, private, "wb"))
+        if not files:
+            return
+        _LOGGER.debug("Writing %s snapshots", len(files))
+        for (path, *_), error in zip(
+            files, write_utf8_files_atomic(files), strict=True
+        ):
+            if error is not None:
+                _LOGGER.error("Error writing snapshot %s: %s", path, error)
+
+    @callback
+    def async_get_write_stats(self) -> dict[str, dict[str, int]]:
+        """Return the number of writes and bytes written per storage key."""
+        return {
+            key: {"writes": stats.writes, "bytes": stats.bytes, "errors": stats.errors}
+            for key, stats in self._write_stats.items()
+        }
+
 
 @bind_hass
 class Store[_T: Mapping[str, Any] | Sequence[Any]]:
@@ -242,8 +538,14 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         encoder: type[JSONEncoder] | None = None,
         minor_version: int = 1,
         read_only: bool = False,
+        binary_snapshot: bool = False,
     ) -> None:
-        """Initialize storage class."""
+        """Initialize storage class.
+
+        If binary_snapshot is True, a binary snapshot is written next to
+        the JSON file when Home Assistant stops. It is loaded instead of
+        the JSON file as long as it was made from the same content.
+        """
         self.version = version
         self.minor_version = minor_version
         self.key = key
@@ -257,6 +559,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._encoder = encoder
         self._atomic_writes = atomic_writes
         self._read_only = read_only
+        self._binary_snapshot = binary_snapshot
         self._next_write_time = 0.0
         self._manager = get_internal_store_manager(hass)
 
@@ -311,6 +614,8 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
     async def _async_load_data(self):
         """Load the data."""
+        if self._binary_snapshot:
+            self._manager.async_add_snapshot_store(self)
         # Check if we have a pending write
         if self._data is not None:
             data = self._data
@@ -329,7 +634,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         else:
             try:
                 data = await self.hass.async_add_executor_job(
-                    json_util.load_json, self.path
+                    _load_storage_file, self.path, self._binary_snapshot
                 )
             except HomeAssistantError as err:
                 if isinstance(err.__cause__, JSONDecodeError):
@@ -453,6 +758,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         next_when = self.hass.loop.time() + delay
         if self._delay_handle and self._delay_handle.when() < next_when:
             self._next_write_time = next_when
+            self._manager.async_add_delayed_write(
+                self, next_when, self._async_run_delayed_write
+            )
             return
 
         self._async_cleanup_delay_listener()
@@ -470,6 +778,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         self._delay_handle = self.hass.loop.call_at(
             when, self._async_schedule_callback_delayed_write
         )
+        self._manager.async_add_delayed_write(self, when, self._async_run_delayed_write)
 
     @callback
     def _async_schedule_callback_delayed_write(self) -> None:
@@ -480,6 +789,11 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             # wrote. Reschedule the timer to the next write time.
             self._async_reschedule_delayed_write(self._next_write_time)
             return
+        self._manager.async_run_delayed_writes(self)
+
+    @callback
+    def _async_run_delayed_write(self) -> None:
+        """Run the delayed write in a task."""
         self.hass.async_create_task_internal(
             self._async_callback_delayed_write(), eager_start=True
         )
@@ -506,6 +820,7 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
         if self._delay_handle is not None:
             self._delay_handle.cancel()
             self._delay_handle = None
+            self._manager.async_remove_delayed_write(self)
 
     async def _async_callback_delayed_write(self) -> None:
         """Handle a delayed write callback."""
@@ -537,29 +852,48 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
             if self._read_only:
                 return
 
+            if self._binary_snapshot:
+                self._manager.async_add_snapshot_store(self)
+
             try:
                 await self._async_write_data(self.path, data)
             except (json_util.SerializationError, WriteError) as err:
                 _LOGGER.error("Error writing config for %s: %s", self.key, err)
 
+    async def async_write_pending(self) -> None:
+        """Write the pending data now."""
+        await self._async_handle_write_data()
+
     async def _async_write_data(self, path: str, data: dict) -> None:
-        await self.hass.async_add_executor_job(self._write_data, self.path, data)
+        await self._manager.async_write_data(self, self.path, data)
+
+    @property
+    def atomic_writes(self) -> bool:
+        """Return if the data is written with atomic writes."""
+        return self._atomic_writes
+
+    @property
+    def private(self) -> bool:
+        """Return if the data is private."""
+        return self._private
 
-    def _write_data(self, path: str, data: dict) -> None:
-        """Write the data."""
+    @property
+    def binary_snapshot(self) -> bool:
+        """Return if a binary snapshot is written when Home Assistant stops."""
+        return self._binary_snapshot
+
+    def prepare_write_data(self, path: str, data: dict) -> tuple[str | bytes, str]:
+        """Serialize the data and return it with the file mode.
+
+        This method is run in the executor by the store manager.
+        """
         os.makedirs(os.path.dirname(path), exist_ok=True)
 
         if "data_func" in data:
             data["data"] = data.pop("data_func")()
 
         _LOGGER.debug("Writing data for %s to %s", self.key, path)
-        json_helper.save_json(
-            path,
-            data,
-            self._private,
-            encoder=self._encoder,
-            atomic_writes=self._atomic_writes,
-        )
+        return json_helper.prepare_save_json(path, data, encoder=self._encoder)
 
     async def _async_migrate_func(self, old_major_version, old_minor_version, old_data):
         """Migrate to the new version."""
@@ -573,3 +907,9 @@ class Store[_T: Mapping[str, Any] | Sequence[Any]]:
 
         with suppress(FileNotFoundError):
             await self.hass.async_add_executor_job(os.unlink, self.path)
+        if self._binary_snapshot:
+            self._manager.async_remove_snapshot_store(self)
+            with suppress(FileNotFoundError):
+                await self.hass.async_add_executor_job(
+                    os.unlink, f"{self.path}{SNAPSHOT_SUFFIX}"
+                )
@@ -102,6 +102,9 @@ _ENVIRONMENT_STRICT: HassKey[TemplateEnvironment] = HassKey(
     "template.environment_strict"
 )
 _HASS_LOADER = "template.hass_loader"
+_COMPILED_TEMPLATES: HassKey[LRU[tuple[str, str], CodeType]] = HassKey(
+    "template.compiled_templates"
+)
 
 # Match "simple" ints and floats. -1.0, 1, +5, 5.0
 _IS_NUMERIC = re.compile(r"^[+-]?(?!0\d)\d*(?:\.\d*)?$")
@@ -153,6 +156,7 @@ CACHED_TEMPLATE_STATES = 512
 EVAL_CACHE_SIZE = 512
 
 MAX_CUSTOM_TEMPLATE_SIZE = 5 * 1024 * 1024
+COMPILED_TEMPLATES_CACHE_SIZE = 4096
 MAX_TEMPLATE_OUTPUT = 256 * 1024  # 256KiB
 
 CACHED_TEMPLATE_LRU: LRU[State, TemplateState] = LRU(CACHED_TEMPLATE_STATES)
@@ -184,6 +188,7 @@ def _template_state(hass: HomeAssistant, state: State) -> TemplateState:
 
 def async_setup(hass: HomeAssistant) -> bool:
     """Set up tracking the template LRUs."""
+    hass.data[_COMPILED_TEMPLATES] = LRU(COMPILED_TEMPLATES_CACHE_SIZE)
 
     @callback
     def _async_adjust_lru_sizes(_: Any) -> None:
@@ -1332,6 +1337,24 @@ def expand(hass: HomeAssistant, *args: Any) -> Iterable[State]:
     return list(found.values())
 
 
+def attribute_entities(
+    hass: HomeAssistant,
+    attribute: str,
+    value: Any,
+    domain: str | Iterable[str] | None = None,
+) -> Iterable[str]:
+    """Get entity ids of the states that have an attribute with the value."""
+    # Any state change can add or remove a matching entity
+    if (render_info := _render_info.get()) is not None:
+        render_info.all_states = True
+    if value is None:
+        return []
+    return [
+        state.entity_id
+        for state in hass.states.async_all_with_attribute(attribute, value, domain)
+    ]
+
+
 def device_entities(hass: HomeAssistant, _device_id: str) -> Iterable[str]:
     """Get entity ids for entities tied to a device."""
     entity_reg = entity_registry.async_get(hass)
@@ -2854,6 +2877,13 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=make_logging_undefined(strict, log_fn))
         self.hass = hass
+        # The environments compile filters that pass the context differently
+        if limited:
+            self.compiled_kind = "limited"
+        elif strict:
+            self.compiled_kind = "strict"
+        else:
+            self.compiled_kind = "full"
         self.template_cache: weakref.WeakValueDictionary[
             str | jinja2.nodes.Template, CodeType | None
         ] = weakref.WeakValueDictionary()
@@ -3060,6 +3090,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 return warn_unsupported
 
             hass_globals = [
+                "attribute_entities",
                 "closest",
                 "distance",
                 "expand",
@@ -3087,6 +3118,7 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 "label_name",
             ]
             hass_filters = [
+                "attribute_entities",
                 "closest",
                 "expand",
                 "device_id",
@@ -3112,6 +3144,8 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 self.filters[test] = unsupported(test)
             return
 
+        self.globals["attribute_entities"] = hassfunction(attribute_entities)
+        self.filters["attribute_entities"] = self.globals["attribute_entities"]
         self.globals["expand"] = hassfunction(expand)
         self.filters["expand"] = self.globals["expand"]
         self.globals["closest"] = hassfunction(closest)
@@ -3209,7 +3243,22 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
                 defer_init,
             )
 
-        compiled = super().compile(source)
+        # The compiled code of a source is kept after all templates
+        # using it are gone, so it is reused when they are created again.
+        # It is only kept in memory, code loaded from disk would run
+        # without going through the sandboxed compiler.
+        compiled_templates = (
+            self.hass.data.get(_COMPILED_TEMPLATES) if self.hass else None
+        )
+        if compiled_templates is None or not isinstance(source, str):
+            compiled = super().compile(source)
+        elif (
+            cached := compiled_templates.get((self.compiled_kind, source))
+        ) is not None:
+            compiled = cached
+        else:
+            compiled = super().compile(source)
+            compiled_templates[(self.compiled_kind, source)] = compiled
         self.template_cache[source] = compiled
         return compiled
 
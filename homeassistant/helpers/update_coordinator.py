@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from abc import abstractmethod
 import asyncio
-from collections.abc import Awaitable, Callable, Coroutine, Generator
+from collections.abc import Awaitable, Callable, Coroutine, Generator, Iterable
 from datetime import datetime, timedelta
 import logging
 from random import randint
@@ -63,6 +63,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
     Setting :attr:`always_update` to ``False`` will cause coordinator to only
     callback listeners when data has changed. This requires that the data
     implements ``__eq__`` or uses a python object that already does.
+
+    Coordinators whose listener contexts are keys into the data can call
+    :meth:`async_set_changed_contexts` with the keys that changed, so only
+    the listeners of those keys are called back.
     """
 
     def __init__(
@@ -109,6 +113,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         )
 
         self._listeners: dict[CALLBACK_TYPE, tuple[CALLBACK_TYPE, object | None]] = {}
+        self._changed_contexts: set[Any] | None = None
         self._unsub_refresh: CALLBACK_TYPE | None = None
         self._unsub_shutdown: CALLBACK_TYPE | None = None
         self._request_refresh_task: asyncio.TimerHandle | None = None
@@ -169,11 +174,29 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         return remove_listener
 
+    @callback
+    def async_set_changed_contexts(self, contexts: Iterable[Any]) -> None:
+        """Set the listener contexts changed by the next update.
+
+        The next time the listeners are updated, only the listeners
+        registered with one of these contexts, and the listeners without
+        a context, are called back. All listeners are called back if the
+        availability of the coordinator changes.
+        """
+        self._changed_contexts = set(contexts)
+
     @callback
     def async_update_listeners(self) -> None:
         """Update all registered listeners."""
-        for update_callback, _ in list(self._listeners.values()):
-            update_callback()
+        changed_contexts, self._changed_contexts = self._changed_contexts, None
+        if changed_contexts is None:
+            for update_callback, _ in list(self._listeners.values()):
+                update_callback()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in changed_contexts:
+                update_callback()
 
     async def async_shutdown(self) -> None:
         """Cancel any scheduled call, and ignore new runs."""
@@ -377,6 +400,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         auth_failed = False
         previous_update_success = self.last_update_success
         previous_data = self.data
+        self._changed_contexts = None
 
         try:
             self.data = await self._async_update_data()
@@ -470,6 +494,10 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
 
         self._async_refresh_finished()
 
+        if self.last_update_success != previous_update_success:
+            # All listeners have to update their availability
+            self._changed_contexts = None
+
         if not self.last_update_success and not previous_update_success:
             return
 
@@ -479,6 +507,8 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
             or previous_data != self.data
         ):
             self.async_update_listeners()
+        else:
+            self._changed_contexts = None
 
     @callback
     def _async_refresh_finished(self) -> None:
@@ -496,6 +526,7 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         if self.last_update_success:
             self.logger.error("Error requesting %s data: %s", self.name, err)
             self.last_update_success = False
+            self._changed_contexts = None
             self.async_update_listeners()
 
     @callback
@@ -505,6 +536,9 @@ class DataUpdateCoordinator(BaseDataUpdateCoordinatorProtocol, Generic[_DataT]):
         self._debounced_refresh.async_cancel()
 
         self.data = data
+        if not self.last_update_success:
+            # All listeners have to update their availability
+            self._changed_contexts = None
         self.last_update_success = True
         self.logger.debug(
             "Manually updated %s data",
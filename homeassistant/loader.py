@@ -132,6 +132,10 @@ DATA_CUSTOM_COMPONENTS: HassKey[
     dict[str, Integration] | asyncio.Future[dict[str, Integration]]
 ] = HassKey("custom_components")
 DATA_PRELOAD_PLATFORMS: HassKey[list[str]] = HassKey("preload_platforms")
+DATA_MANIFEST_CACHE: HassKey[ManifestCache] = HassKey("manifest_cache")
+MANIFEST_CACHE_STORAGE_KEY = "core.manifest_cache"
+MANIFEST_CACHE_STORAGE_VERSION = 1
+MANIFEST_CACHE_SAVE_DELAY = 30
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -272,6 +276,132 @@ def async_setup(hass: HomeAssistant) -> None:
     hass.data[DATA_PRELOAD_PLATFORMS] = BASE_PRELOAD_PLATFORMS.copy()
 
 
+class ManifestCacheEntry(TypedDict):
+    """A cached manifest and the files of an integration."""
+
+    manifest_mtime: int
+    manifest_size: int
+    dir_mtime: int
+    manifest: Manifest
+    files: list[str] | None
+
+
+class ManifestCache:
+    """Persistent cache of the manifests of the integrations.
+
+    Entries are keyed by the directory of the integration and are valid as
+    long as the manifest and the directory have not been modified since they
+    were cached, so resolving an integration only needs a stat of both
+    instead of reading and parsing the manifest and listing the directory.
+
+    The cache is used from the executor threads that resolve the
+    integrations and saved from the event loop. Only the entries used
+    since the start are saved, so the entries of integrations that were
+    removed are dropped the next time the cache is saved.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the cache."""
+        # pylint: disable-next=import-outside-toplevel
+        from .helpers.storage import Store
+
+        self._store = Store[dict[str, dict[str, ManifestCacheEntry]]](
+            hass, MANIFEST_CACHE_STORAGE_VERSION, MANIFEST_CACHE_STORAGE_KEY
+        )
+        self._entries: dict[str, ManifestCacheEntry] = {}
+        # Keys of the entries that were used since the start
+        self._used: set[str] = set()
+        # Keys of the entries that are in the store
+        self._saved: set[str] = set()
+        self._changed = False
+
+    async def async_load(self) -> None:
+        """Load the cache."""
+        if data := await self._store.async_load():
+            self._entries = data["entries"]
+            self._saved = set(self._entries)
+
+    def get(self, file_path: pathlib.Path) -> tuple[Manifest, set[str] | None] | None:
+        """Return the manifest and the files of an integration if still valid."""
+        key = str(file_path)
+        if (entry := self._entries.get(key)) is None:
+            return None
+        try:
+            manifest_stat = os.stat(file_path / "manifest.json")
+            dir_stat = os.stat(file_path)
+        except OSError:
+            return None
+        if (
+            manifest_stat.st_mtime_ns != entry["manifest_mtime"]
+            or manifest_stat.st_size != entry["manifest_size"]
+            or dir_stat.st_mtime_ns != entry["dir_mtime"]
+        ):
+            return None
+        self._used.add(key)
+        files = entry["files"]
+        return entry["manifest"].copy(), None if files is None else set(files)
+
+    def set(
+        self,
+        file_path: pathlib.Path,
+        manifest_stat: os.stat_result,
+        dir_stat: os.stat_result,
+        manifest: Manifest,
+        files: set[str] | None,
+    ) -> None:
+        """Cache the manifest and the files of an integration."""
+        key = str(file_path)
+        self._entries[key] = {
+            "manifest_mtime": manifest_stat.st_mtime_ns,
+            "manifest_size": manifest_stat.st_size,
+            "dir_mtime": dir_stat.st_mtime_ns,
+            "manifest": manifest.copy(),
+            "files": None if files is None else sorted(files),
+        }
+        self._used.add(key)
+        self._changed = True
+
+    @callback
+    def async_save_if_changed(self) -> None:
+        """Schedule saving the cache if entries were added.
+
+        Entries that were not used are not a reason to save the cache, they
+        are dropped when it is saved for another reason.
+        """
+        # Copying a set is atomic so this is safe while the
+        # executor threads add keys
+        if self._changed or self._used.copy() - self._saved:
+            self._changed = False
+            self._store.async_delay_save(self._data_to_save, MANIFEST_CACHE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, dict[str, ManifestCacheEntry]]:
+        """Return the data to store."""
+        # Copying a dict or a set is atomic so this is safe while the
+        # executor threads add entries. Keys are added to used after
+        # their entry, so all the used keys are in the copy of entries.
+        used = self._used.copy()
+        entries = self._entries.copy()
+        self._saved = used
+        return {"entries": {key: entries[key] for key in used}}
+
+
+async def async_load_manifest_cache(hass: HomeAssistant) -> None:
+    """Load the persistent manifest cache and use it to resolve integrations."""
+    if DATA_MANIFEST_CACHE in hass.data:
+        return
+    manifest_cache = ManifestCache(hass)
+    await manifest_cache.async_load()
+    hass.data[DATA_MANIFEST_CACHE] = manifest_cache
+
+
+@callback
+def _async_save_manifest_cache(hass: HomeAssistant) -> None:
+    """Save the manifest cache if it has changed."""
+    if (manifest_cache := hass.data.get(DATA_MANIFEST_CACHE)) is not None:
+        manifest_cache.async_save_if_changed()
+
+
 def manifest_from_legacy_module(domain: str, module: ModuleType) -> Manifest:
     """Generate a manifest from a legacy module."""
     return {
@@ -322,6 +452,7 @@ async def async_get_custom_components(
         future = hass.data[DATA_CUSTOM_COMPONENTS] = hass.loop.create_future()
 
         comps = await hass.async_add_executor_job(_get_custom_components, hass)
+        _async_save_manifest_cache(hass)
 
         hass.data[DATA_CUSTOM_COMPONENTS] = comps
         future.set_result(comps)
@@ -652,30 +783,46 @@ class Integration:
         cls, hass: HomeAssistant, root_module: ModuleType, domain: str
     ) -> Integration | None:
         """Resolve an integration from a root module."""
+        manifest_cache = hass.data.get(DATA_MANIFEST_CACHE)
         for base in root_module.__path__:
-            manifest_path = pathlib.Path(base) / domain / "manifest.json"
-
-            if not manifest_path.is_file():
-                continue
+            file_path = pathlib.Path(base) / domain
+            manifest_path = file_path / "manifest.json"
 
-            try:
-                manifest = cast(Manifest, json_loads(manifest_path.read_text()))
-            except JSON_DECODE_EXCEPTIONS as err:
-                _LOGGER.error(
-                    "Error parsing manifest.json file at %s: %s", manifest_path, err
+            if manifest_cache is not None and (cached := manifest_cache.get(file_path)):
+                manifest, top_level_files = cached
+            else:
+                if not manifest_path.is_file():
+                    continue
+
+                # Stat before reading so a change while
+                # reading invalidates the cached entry
+                stats = (
+                    (os.stat(manifest_path), os.stat(file_path))
+                    if manifest_cache is not None
+                    else None
                 )
-                continue
 
-            file_path = manifest_path.parent
-            # Avoid the listdir for virtual integrations
-            # as they cannot have any platforms
-            is_virtual = manifest.get("integration_type") == "virtual"
+                try:
+                    manifest = cast(Manifest, json_loads(manifest_path.read_text()))
+                except JSON_DECODE_EXCEPTIONS as err:
+                    _LOGGER.error(
+                        "Error parsing manifest.json file at %s: %s", manifest_path, err
+                    )
+                    continue
+
+                # Avoid the listdir for virtual integrations
+                # as they cannot have any platforms
+                is_virtual = manifest.get("integration_type") == "virtual"
+                top_level_files = None if is_virtual else set(os.listdir(file_path))
+                if manifest_cache is not None and stats is not None:
+                    manifest_cache.set(file_path, *stats, manifest, top_level_files)
+
             integration = cls(
                 hass,
                 f"{root_module.__name__}.{domain}",
                 file_path,
                 manifest,
-                None if is_virtual else set(os.listdir(file_path)),
+                top_level_files,
             )
 
             if not integration.import_executor:
@@ -1043,7 +1190,7 @@ class Integration:
 
         return comp
 
-    def get_component(self) -> ComponentProtocol:
+    def get_component(self, preload_platforms: bool = False) -> ComponentProtocol:
         """Return the component.
 
         This method must be thread-safe as it's called from the executor
@@ -1056,11 +1203,14 @@ class Integration:
         This is mostly a thin wrapper around importlib.import_module
         with a dict cache which is thread-safe since importlib has
         appropriate locks.
+
+        If preload_platforms is True, the platforms that are preloaded when
+        the component is imported in the executor are imported as well.
         """
         domain = self.domain
         if domain in (cache := self._cache):
             return cache[domain]
-        return self._get_component()
+        return self._get_component(preload_platforms)
 
     def _get_component(self, preload_platforms: bool = False) -> ComponentProtocol:
         """Return the component."""
@@ -1414,6 +1564,7 @@ async def async_get_integrations(
         integrations = await hass.async_add_executor_job(
             _resolve_integrations_from_root, hass, components, needed
         )
+        _async_save_manifest_cache(hass)
         for domain, future in needed.items():
             int_or_exc = integrations.get(domain)
             if not int_or_exc:
@@ -72,6 +72,16 @@ async def async_load_installed_versions(
     await _async_get_manager(hass).async_load_installed_versions(requirements)
 
 
+@callback
+def async_requirements_installed(hass: HomeAssistant, requirements: list[str]) -> bool:
+    """Return if the requirements are known to be installed.
+
+    Requirements that were not installed or found to be installed yet
+    are not known to be installed.
+    """
+    return _async_get_manager(hass).async_requirements_installed(requirements)
+
+
 @callback
 @singleton.singleton(DATA_REQUIREMENTS_MANAGER)
 def _async_get_manager(hass: HomeAssistant) -> RequirementsManager:
@@ -268,6 +278,19 @@ class RequirementsManager:
             if missing := self._find_missing_requirements(requirements):
                 await self._async_process_requirements(name, missing)
 
+    @callback
+    def async_requirements_installed(self, requirements: list[str]) -> bool:
+        """Return if the requirements are known to be installed."""
+        if self.hass.config.skip_pip:
+            return True
+        if skip_pip_packages := self.hass.config.skip_pip_packages:
+            requirements = [
+                req
+                for req in requirements
+                if Requirement(req).name not in skip_pip_packages
+            ]
+        return not self._find_missing_requirements(requirements)
+
     def _find_missing_requirements(self, requirements: list[str]) -> list[str]:
         """Find requirements that are missing in the cache."""
         return [req for req in requirements if req not in self.is_installed_cache]
@@ -6,17 +6,20 @@ import argparse
 import asyncio
 from collections.abc import Callable
 from contextlib import suppress
+from functools import partial
 import logging
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 
 from homeassistant import core
-from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE, EVENT_STATE_CHANGED
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.event import (
     async_track_state_change,
     async_track_state_change_event,
 )
 from homeassistant.helpers.json import JSON_DUMP
+from homeassistant.helpers.storage import Store
 
 # mypy: allow-untyped-calls, allow-untyped-defs, no-check-untyped-defs
 # mypy: no-warn-return-any
@@ -308,3 +311,314 @@ async def json_serialize_states(hass):
     start = timer()
     JSON_DUMP(states)
     return timer() - start
+
+
+async def _websocket_fan_out(hass, clients):
+    """Send 10k state changes to websocket clients subscribed to events."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.websocket_api import messages
+
+    count = 0
+    messages_to_send = 10**4 * clients
+
+    @core.callback
+    def send_message(message):
+        """Handle message."""
+        nonlocal count
+        count += 1
+
+    @core.callback
+    def forward_event(message_id_as_bytes, event):
+        """Forward the event like subscribe_events."""
+        send_message(messages.cached_event_message(message_id_as_bytes, event))
+
+    for idx in range(clients):
+        hass.bus.async_listen(
+            EVENT_STATE_CHANGED, partial(forward_event, str(idx).encode())
+        )
+
+    start = timer()
+
+    for idx in range(10**4):
+        hass.states.async_set(
+            "light.kitchen", "on" if idx % 2 else "off", {"brightness": idx}
+        )
+    await hass.async_block_till_done()
+
+    assert count == messages_to_send
+
+    return timer() - start
+
+
+@benchmark
+async def websocket_fan_out_1_client(hass):
+    """Send 10k state changes to 1 websocket client."""
+    return await _websocket_fan_out(hass, 1)
+
+
+@benchmark
+async def websocket_fan_out_10_clients(hass):
+    """Send 10k state changes to 10 websocket clients."""
+    return await _websocket_fan_out(hass, 10)
+
+
+@benchmark
+async def websocket_fan_out_50_clients(hass):
+    """Send 10k state changes to 50 websocket clients."""
+    return await _websocket_fan_out(hass, 50)
+
+
+async def _load_entity_registry(hass, entries, binary_snapshot):
+    """Load an entity registry sized store from JSON or its snapshot."""
+    data = {
+        "entities": [
+            {
+                "aliases": [],
+                "area_id": None,
+                "capabilities": {"state_class": "measurement"},
+                "config_entry_id": f"config_entry_{idx // 100}",
+                "device_class": None,
+                "device_id": f"device_{idx // 5}",
+                "disabled_by": None,
+                "entity_category": None,
+                "entity_id": f"sensor.benchmark_{idx}",
+                "has_entity_name": True,
+                "hidden_by": None,
+                "icon": None,
+                "id": f"id_{idx}",
+                "labels": [],
+                "name": None,
+                "options": {"sensor": {"suggested_display_precision": 1}},
+                "original_device_class": "temperature",
+                "original_name": "Temperature",
+                "platform": "benchmark",
+                "unique_id": f"unique_id_{idx}",
+                "unit_of_measurement": "°C",
+            }
+            for idx in range(entries)
+        ],
+        "deleted_entities": [],
+    }
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+        await Store(hass, 1, "core.entity_registry", binary_snapshot=True).async_save(
+            data
+        )
+        # The snapshot is written when Home Assistant stops
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        store = Store(hass, 1, "core.entity_registry", binary_snapshot=binary_snapshot)
+
+        start = timer()
+        assert await store.async_load() == data
+        return timer() - start
+
+
+@benchmark
+async def load_entity_registry_json_1k(hass):
+    """Load an entity registry with 1k entries from JSON."""
+    return await _load_entity_registry(hass, 10**3, False)
+
+
+@benchmark
+async def load_entity_registry_snapshot_1k(hass):
+    """Load an entity registry with 1k entries from the binary snapshot."""
+    return await _load_entity_registry(hass, 10**3, True)
+
+
+@benchmark
+async def load_entity_registry_json_10k(hass):
+    """Load an entity registry with 10k entries from JSON."""
+    return await _load_entity_registry(hass, 10**4, False)
+
+
+@benchmark
+async def load_entity_registry_snapshot_10k(hass):
+    """Load an entity registry with 10k entries from the binary snapshot."""
+    return await _load_entity_registry(hass, 10**4, True)
+
+
+@benchmark
+async def load_entity_registry_json_50k(hass):
+    """Load an entity registry with 50k entries from JSON."""
+    return await _load_entity_registry(hass, 5 * 10**4, False)
+
+
+@benchmark
+async def load_entity_registry_snapshot_50k(hass):
+    """Load an entity registry with 50k entries from the binary snapshot."""
+    return await _load_entity_registry(hass, 5 * 10**4, True)
+
+
+async def _history_stats_sliding_window(hass, tracking):
+    """Move a history_stats window over a recorded entity a minute at a time."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.history_stats.data import HistoryStats
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.helpers.template import Template
+    from homeassistant.setup import async_setup_component
+
+    entity_id = "binary_sensor.benchmark"
+    events = []
+
+    @core.callback
+    def listener(event):
+        """Handle event."""
+        events.append(event)
+
+    recorder_helper.async_initialize_recorder(hass)
+    assert await async_setup_component(
+        hass, "recorder", {"recorder": {"db_url": "sqlite://"}}
+    )
+    await hass.async_start()
+    await get_instance(hass).async_db_ready
+
+    hass.states.async_set("sensor.benchmark_minute", "0")
+    history_stats = HistoryStats(
+        hass,
+        entity_id,
+        ["on"],
+        Template(
+            "{{ as_timestamp(now()) - 86400"
+            " + states('sensor.benchmark_minute') | int * 60 }}",
+            hass,
+        ),
+        Template(
+            "{{ as_timestamp(now())"
+            " + states('sensor.benchmark_minute') | int * 60 }}",
+            hass,
+        ),
+        None,
+    )
+    history_stats.async_set_tracking(tracking)
+    async_track_state_change_event(hass, [entity_id], listener)
+
+    start = timer()
+    for minute in range(1000):
+        hass.states.async_set("sensor.benchmark_minute", str(minute))
+        hass.states.async_set(entity_id, "on" if minute % 2 else "off")
+        await history_stats.async_update(events.pop() if events else None)
+    return timer() - start
+
+
+@benchmark
+async def history_stats_sliding_window_refetch(hass):
+    """Move a history_stats window by querying the database every update."""
+    return await _history_stats_sliding_window(hass, False)
+
+
+@benchmark
+async def history_stats_sliding_window_incremental(hass):
+    """Move a history_stats window from the tracked state changes."""
+    return await _history_stats_sliding_window(hass, True)
+
+
+async def _active_zone(hass, zones, indexed):
+    """Find the active zone of locations among zones spread over a region."""
+    # pylint: disable-next=import-outside-toplevel
+    from homeassistant.components import zone
+
+    for idx in range(zones):
+        hass.states.async_set(
+            f"zone.benchmark_{idx}",
+            "0",
+            {
+                "latitude": 52 + (idx % 32) * 0.05,
+                "longitude": 4 + (idx // 32) * 0.05,
+                "radius": 500,
+                "passive": False,
+            },
+        )
+    zone.async_setup_track_zone_entity_ids(hass)
+    if not indexed:
+        del hass.data[zone.DATA_ZONE_INDEX]
+    locations = [
+        (52 + (idx * 0.00731) % 1.6, 4 + (idx * 0.01337) % 1.6) for idx in range(10**4)
+    ]
+
+    start = timer()
+    for latitude, longitude in locations:
+        zone.async_active_zone(hass, latitude, longitude, 50)
+    return timer() - start
+
+
+@benchmark
+async def active_zone_10_zones(hass):
+    """Find the active zone among 10 zones with the index."""
+    return await _active_zone(hass, 10, True)
+
+
+@benchmark
+async def active_zone_10_zones_scan(hass):
+    """Find the active zone among 10 zones by checking every zone."""
+    return await _active_zone(hass, 10, False)
+
+
+@benchmark
+async def active_zone_100_zones(hass):
+    """Find the active zone among 100 zones with the index."""
+    return await _active_zone(hass, 100, True)
+
+
+@benchmark
+async def active_zone_100_zones_scan(hass):
+    """Find the active zone among 100 zones by checking every zone."""
+    return await _active_zone(hass, 100, False)
+
+
+@benchmark
+async def active_zone_1000_zones(hass):
+    """Find the active zone among 1000 zones with the index."""
+    return await _active_zone(hass, 1000, True)
+
+
+@benchmark
+async def active_zone_1000_zones_scan(hass):
+    """Find the active zone among 1000 zones by checking every zone."""
+    return await _active_zone(hass, 1000, False)
+
+
+async def _recorder_write_states(hass, bulk_write):
+    """Record 100k state changes of 1000 entities and report the rows/sec."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.recorder import get_instance
+    from homeassistant.components.recorder.tasks import CommitTask
+    from homeassistant.helpers import recorder as recorder_helper
+    from homeassistant.setup import async_setup_component
+
+    states_to_write = 10**5
+
+    recorder_helper.async_initialize_recorder(hass)
+    assert await async_setup_component(
+        hass,
+        "recorder",
+        {"recorder": {"db_url": "sqlite://", "bulk_write": bulk_write}},
+    )
+    await hass.async_start()
+    instance = get_instance(hass)
+    await instance.async_db_ready
+
+    start = timer()
+    for idx in range(states_to_write):
+        hass.states.async_set(
+            f"sensor.benchmark_{idx % 1000}", str(idx), {"idx": idx % 10}
+        )
+    instance.queue_task(CommitTask())
+    await instance.async_block_till_done()
+    runtime = timer() - start
+
+    print(f"Recorded {states_to_write / runtime:.0f} rows/sec")
+    return runtime
+
+
+@benchmark
+async def recorder_write_states_orm(hass):
+    """Record state changes with the ORM unit of work."""
+    return await _recorder_write_states(hass, False)
+
+
+@benchmark
+async def recorder_write_states_bulk(hass):
+    """Record state changes with multi-row INSERTs."""
+    return await _recorder_write_states(hass, True)
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
+from collections.abc import Sequence
 import logging
 import os
 import tempfile
+from typing import IO, Any
 
 from atomicwrites import AtomicWriter
 
@@ -77,3 +79,83 @@ def write_utf8_file(
                     filename,
                     err,
                 )
+
+
+def write_utf8_files_atomic(
+    files: Sequence[tuple[str, bytes | str, bool, str]],
+) -> list[WriteError | None]:
+    """Write files and rename them into place with grouped fsyncs.
+
+    Writes all or nothing for each file. The files are given as
+    (filename, utf8_data, private, mode) tuples.
+
+    All files are written before the first one is synced so the
+    filesystem can commit them together and each directory is
+    synced once after the files are renamed into place.
+
+    Returns the error of each file or None if it was written.
+    """
+    errors: list[WriteError | None] = [None] * len(files)
+    written: list[tuple[int, str, IO[Any]]] = []
+    for idx, (filename, utf8_data, private, mode) in enumerate(files):
+        encoding = "utf-8" if "b" not in mode else None
+        fdesc: IO[Any] | None = None
+        try:
+            # Modern versions of Python tempfile create this file with mode 0o600
+            fdesc = tempfile.NamedTemporaryFile(  # noqa: SIM115
+                mode=mode,
+                encoding=encoding,
+                dir=os.path.dirname(filename),
+                delete=False,
+            )
+            fdesc.write(utf8_data)
+            fdesc.flush()
+            if not private:
+                os.fchmod(fdesc.fileno(), 0o644)
+        except OSError as error:
+            errors[idx] = _failed_write(filename, fdesc, error)
+        else:
+            written.append((idx, filename, fdesc))
+
+    directories: set[str] = set()
+    for idx, filename, fdesc in written:
+        try:
+            os.fsync(fdesc.fileno())
+            fdesc.close()
+            os.replace(fdesc.name, filename)
+        except OSError as error:
+            errors[idx] = _failed_write(filename, fdesc, error)
+        else:
+            directories.add(os.path.dirname(filename))
+
+    for directory in directories:
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError as err:
+            _LOGGER.warning("Syncing directory %s failed: %s", directory, err)
+
+    return errors
+
+
+def _failed_write(filename: str, fdesc: IO[Any] | None, error: OSError) -> WriteError:
+    """Log a failed write, remove its temporary file and return the error."""
+    _LOGGER.exception("Saving file failed: %s", filename)
+    if fdesc is not None:
+        try:
+            fdesc.close()
+            if os.path.exists(fdesc.name):
+                os.remove(fdesc.name)
+        except OSError as err:
+            # If we are cleaning up then something else went wrong, so
+            # we should suppress likely follow-on errors in the cleanup
+            _LOGGER.error(
+                "File replacement cleanup failed for %s while saving %s: %s",
+                fdesc.name,
+                filename,
+                err,
+            )
+    return WriteError(error)
@@ -2,9 +2,11 @@
 
 import asyncio
 from datetime import timedelta
+import threading
 from unittest.mock import ANY, patch
 
 from freezegun import freeze_time
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant.components import history
@@ -232,6 +234,199 @@ async def test_history_during_period_impossible_conditions(
     assert response["result"] == {}
 
 
+async def test_history_during_period_chunked(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    hass_access_token: str,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test history_during_period sends the history in chunks."""
+    now = dt_util.utcnow()
+    refresh_token = hass.auth.async_validate_access_token(hass_access_token)
+    await async_setup_component(hass, "history", {})
+    await async_recorder_block_till_done(hass)
+    freezer.tick(timedelta(seconds=1))
+    hass.states.async_set("sensor.one", "on")
+    hass.states.async_set("sensor.two", "on")
+    await async_recorder_block_till_done(hass)
+    freezer.tick(timedelta(days=1))
+    hass.states.async_set("sensor.one", "off")
+    await async_recorder_block_till_done(hass)
+    freezer.tick(timedelta(days=1, hours=1))
+    hass.states.async_set("sensor.two", "off")
+    await async_wait_recording_done(hass)
+    end = dt_util.utcnow()
+
+    # The access token of the fixture expired while the time moved on
+    client = await hass_ws_client(
+        hass, hass.auth.async_create_access_token(refresh_token)
+    )
+    with patch.object(websocket_api, "HISTORY_CHUNK_ENTITIES", 1):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "significant_changes_only": False,
+                "no_attributes": True,
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        assert response["id"] == 1
+        assert response["result"] is None
+
+        chunks = []
+        while "complete" not in (event := (await client.receive_json())["event"]):
+            chunks.append(event)
+
+    assert event == {"complete": True}
+    day_1 = (now + timedelta(days=1)).timestamp()
+    day_2 = (now + timedelta(days=2)).timestamp()
+    assert [
+        (
+            chunk["start_time"],
+            chunk["end_time"],
+            {
+                entity_id: [state["s"] for state in states]
+                for entity_id, states in chunk["states"].items()
+            },
+        )
+        for chunk in chunks
+    ] == [
+        (now.timestamp(), day_1, {"sensor.one": ["on"]}),
+        (now.timestamp(), day_1, {"sensor.two": ["on"]}),
+        (day_1, day_2, {"sensor.one": ["off"]}),
+        (day_2, end.timestamp(), {"sensor.two": ["off"]}),
+    ]
+
+    future = dt_util.utcnow() + timedelta(hours=10)
+    await client.send_json(
+        {
+            "id": 2,
+            "type": "history/history_during_period",
+            "start_time": future.isoformat(),
+            "entity_ids": ["sensor.one"],
+            "chunked": True,
+        }
+    )
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+    response = await client.receive_json()
+    assert response == {"id": 2, "type": "event", "event": {"complete": True}}
+
+
+async def test_history_during_period_chunked_unsubscribe(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+) -> None:
+    """Test no more chunks are sent once the client unsubscribed."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on")
+    hass.states.async_set("sensor.two", "on")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    fetching = threading.Event()
+    unsubscribed = threading.Event()
+
+    def _generate_history_chunk(*args):
+        fetching.set()
+        unsubscribed.wait(10)
+        return generate_history_chunk(*args)
+
+    generate_history_chunk = websocket_api._generate_history_chunk
+    with (
+        patch.object(websocket_api, "HISTORY_CHUNK_ENTITIES", 1),
+        patch.object(
+            websocket_api,
+            "_generate_history_chunk",
+            side_effect=_generate_history_chunk,
+        ) as mock_generate_history_chunk,
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one", "sensor.two"],
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        await hass.async_add_executor_job(fetching.wait, 10)
+
+        await client.send_json(
+            {"id": 2, "type": "unsubscribe_events", "subscription": 1}
+        )
+        response = await client.receive_json()
+        assert response["id"] == 2
+        assert response["success"]
+        unsubscribed.set()
+        await async_wait_recording_done(hass)
+
+        await client.send_json({"id": 3, "type": "ping"})
+        response = await client.receive_json()
+        assert response == {"id": 3, "type": "pong"}
+
+    assert mock_generate_history_chunk.call_count == 1
+
+
+async def test_history_during_period_chunked_error(
+    hass: HomeAssistant,
+    recorder_mock: Recorder,
+    hass_ws_client: WebSocketGenerator,
+    caplog: pytest.LogCaptureFixture,
+) -> None:
+    """Test the subscription ends with an error event if fetching a chunk fails."""
+    now = dt_util.utcnow()
+    await async_setup_component(hass, "history", {})
+    hass.states.async_set("sensor.one", "on")
+    await async_wait_recording_done(hass)
+
+    client = await hass_ws_client()
+    with patch.object(
+        websocket_api, "_generate_history_chunk", side_effect=ValueError("Boom")
+    ):
+        await client.send_json(
+            {
+                "id": 1,
+                "type": "history/history_during_period",
+                "start_time": now.isoformat(),
+                "entity_ids": ["sensor.one"],
+                "chunked": True,
+            }
+        )
+        response = await client.receive_json()
+        assert response["success"]
+        response = await client.receive_json()
+
+    assert response == {
+        "id": 1,
+        "type": "event",
+        "event": {
+            "error": {
+                "code": "unknown_error",
+                "message": "Error fetching history",
+            }
+        },
+    }
+    assert "Error fetching the history of ['sensor.one']" in caplog.text
+
+    # The subscription was removed
+    await client.send_json({"id": 2, "type": "unsubscribe_events", "subscription": 1})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+
 @pytest.mark.parametrize(
     "time_zone", ["UTC", "Europe/Berlin", "America/Chicago", "US/Hawaii"]
 )
@@ -14,6 +14,7 @@ from homeassistant.components.history_stats.const import (
     DEFAULT_NAME,
     DOMAIN,
 )
+from homeassistant.components.history_stats.data import HistoryStats
 from homeassistant.components.history_stats.sensor import (
     PLATFORM_SCHEMA as SENSOR_SCHEMA,
 )
@@ -31,6 +32,7 @@ import homeassistant.core as ha
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 from homeassistant.helpers.entity_component import async_update_entity
+from homeassistant.helpers.template import Template
 from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
@@ -1377,6 +1379,145 @@ async def test_measure_from_end_going_backwards(
     assert hass.states.get("sensor.sensor4").state == "83.3"
 
 
+async def test_sliding_window_from_state_changes(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test a sliding window is moved from the state changes without queries."""
+    start_time = dt_util.utcnow().replace(microsecond=0)
+    recorded = [("on", start_time - timedelta(hours=2))]
+    queries = 0
+
+    def _fake_states(hass, start, end, entity_id, **kwargs):
+        nonlocal queries
+        queries += 1
+        states = []
+        for state, last_changed in recorded:
+            if last_changed > end:
+                break
+            if last_changed <= start:
+                states = []
+                last_changed = start
+            states.append(ha.State(entity_id, state, last_changed=last_changed))
+        return {entity_id: states}
+
+    def _set_state(state: str) -> None:
+        recorded.append((state, dt_util.utcnow()))
+        hass.states.async_set("binary_sensor.test_id", state)
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        freeze_time(start_time) as freezer,
+    ):
+        await async_setup_component(
+            hass,
+            "sensor",
+            {
+                "sensor": [
+                    {
+                        "platform": "history_stats",
+                        "entity_id": "binary_sensor.test_id",
+                        "name": "sensor1",
+                        "state": "on",
+                        "start": "{{ as_timestamp(now()) - 3600 }}",
+                        "end": "{{ now() }}",
+                        "type": "time",
+                    },
+                ]
+            },
+        )
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "1.0"
+
+        freezer.move_to(start_time + timedelta(minutes=10))
+        _set_state("off")
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "1.0"
+
+        freezer.move_to(start_time + timedelta(minutes=20))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "0.83"
+        queries_before_sliding = queries
+
+        freezer.move_to(start_time + timedelta(minutes=40))
+        _set_state("on")
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "0.5"
+
+        freezer.move_to(start_time + timedelta(minutes=70))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "0.5"
+
+        freezer.move_to(start_time + timedelta(minutes=100))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+        assert hass.states.get("sensor.sensor1").state == "1.0"
+
+    assert queries == queries_before_sliding
+
+
+async def test_sliding_window_with_uncommitted_state_changes(
+    recorder_mock: Recorder, hass: HomeAssistant
+) -> None:
+    """Test tracked state changes the query did not return are not lost."""
+    start_time = dt_util.utcnow().replace(microsecond=0)
+    committed = [("on", start_time - timedelta(hours=2))]
+
+    def _fake_states(hass, start, end, entity_id, **kwargs):
+        states = []
+        for state, last_changed in committed:
+            if last_changed > end:
+                break
+            if last_changed <= start:
+                states = []
+                last_changed = start
+            states.append(ha.State(entity_id, state, last_changed=last_changed))
+        return {entity_id: states}
+
+    history_stats = HistoryStats(
+        hass,
+        "binary_sensor.test_id",
+        ["on"],
+        Template("{{ as_timestamp(now()) - 3600 }}", hass),
+        Template("{{ now() }}", hass),
+        None,
+    )
+    history_stats.async_set_tracking(True)
+
+    with (
+        patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            _fake_states,
+        ),
+        freeze_time(start_time + timedelta(minutes=10)) as freezer,
+    ):
+        # The state change that triggers the query is not committed yet
+        new_state = ha.State("binary_sensor.test_id", "off")
+        event = ha.Event(
+            "state_changed",
+            {
+                "entity_id": "binary_sensor.test_id",
+                "old_state": None,
+                "new_state": new_state,
+            },
+        )
+        state = await history_stats.async_update(event)
+        assert state.seconds_matched == 3600
+
+        committed.append(("off", new_state.last_changed))
+        freezer.move_to(start_time + timedelta(minutes=40))
+        with patch(
+            "homeassistant.components.recorder.history.state_changes_during_period",
+            side_effect=AssertionError("The window moves without a query"),
+        ):
+            state = await history_stats.async_update(None)
+        assert state.seconds_matched == 1800
+
+
 async def test_measure_cet(recorder_mock: Recorder, hass: HomeAssistant) -> None:
     """Test the history statistics sensor measure with a non-UTC timezone."""
     await hass.config.async_set_time_zone("Europe/Berlin")
@@ -372,3 +372,57 @@ async def test_waiting_for_client_with_disabled_entry(
 
     # returns False because entry is disabled
     assert not await mqtt.async_wait_for_mqtt_client(hass)
+
+
+@pytest.mark.parametrize(
+    ("topic_filter", "topic", "matches"),
+    [
+        ("test/state", "test/state", True),
+        ("test/state", "test/other", False),
+        ("test/+/state", "test/bla/state", True),
+        ("test/+/state", "test/bla/bla/state", False),
+        ("test/+", "test", False),
+        ("test/#", "test/bla/state", True),
+        ("test/#", "test", True),
+        ("test/#", "other/bla", False),
+        ("+/+", "test/state", True),
+        ("+/#", "test", True),
+        ("#", "test/state", True),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_topic_trie_matches(topic_filter: str, topic: str, matches: bool) -> None:
+    """Test matching topics against topic filters in the topic trie."""
+    trie: mqtt.util.TopicTrie[str] = mqtt.util.TopicTrie()
+    trie.add(topic_filter, topic_filter)
+    assert trie.matches(topic) == ([topic_filter] if matches else [])
+
+
+def test_topic_trie_add_remove() -> None:
+    """Test adding and removing items from the topic trie."""
+    trie: mqtt.util.TopicTrie[str] = mqtt.util.TopicTrie()
+    trie.add("test/+/state", "sub1")
+    trie.add("test/+/state", "sub2")
+    trie.add("test/#", "sub3")
+    trie.add("test/#", "sub3")
+    assert len(trie) == 3
+    assert set(trie) == {"sub1", "sub2", "sub3"}
+    assert sorted(trie.matches("test/bla/state")) == ["sub1", "sub2", "sub3"]
+    assert trie.has_topic_filter("test/+/state")
+    assert not trie.has_topic_filter("test/+")
+
+    trie.remove("test/+/state", "sub1")
+    assert sorted(trie.matches("test/bla/state")) == ["sub2", "sub3"]
+    trie.remove("test/+/state", "sub2")
+    assert not trie.has_topic_filter("test/+/state")
+    assert trie.matches("test/bla/state") == ["sub3"]
+
+    with pytest.raises(KeyError):
+        trie.remove("test/+/state", "sub2")
+
+    trie.remove("test/#", "sub3")
+    assert len(trie) == 0
+    assert trie.matches("test/bla/state") == []
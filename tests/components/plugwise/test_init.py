@@ -14,6 +14,10 @@ from plugwise.exceptions import (
 )
 import pytest
 
+from homeassistant.components.climate import (
+    DOMAIN as CLIMATE_DOMAIN,
+    SERVICE_SET_TEMPERATURE,
+)
 from homeassistant.components.plugwise.const import DOMAIN
 from homeassistant.config_entries import ConfigEntryState
 from homeassistant.const import Platform
@@ -312,3 +316,73 @@ async def test_update_device(
         for device_entry in list(device_registry.devices.values()):
             item_list.extend(x[1] for x in device_entry.identifiers)
         assert "1772a4ea304041adb83f357b751341ff" not in item_list
+
+
+async def test_update_changed_devices(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_anna: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test only the entities of changed devices are updated."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    thermostat_state = hass.states.get("sensor.anna_illuminance")
+    assert thermostat_state
+
+    data = mock_smile_anna.async_update.return_value
+    data.devices[HEATER_ID]["sensors"]["dhw_temperature"] = 99.0
+    freezer.tick(timedelta(minutes=1))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    state = hass.states.get("sensor.opentherm_dhw_temperature")
+    assert state
+    assert float(state.state) == 99.0
+
+    # The thermostat did not change, so its entities were not written
+    state = hass.states.get("sensor.anna_illuminance")
+    assert state
+    assert state.last_reported == thermostat_state.last_reported
+
+
+async def test_adaptive_update_interval(
+    hass: HomeAssistant,
+    mock_config_entry: MockConfigEntry,
+    mock_smile_anna: MagicMock,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the update interval backs off when idle and speeds up on commands."""
+    mock_config_entry.add_to_hass(hass)
+    await hass.config_entries.async_setup(mock_config_entry.entry_id)
+    await hass.async_block_till_done()
+
+    coordinator = mock_config_entry.runtime_data
+    assert coordinator.update_interval == timedelta(seconds=60)
+
+    for _ in range(3):
+        freezer.tick(timedelta(minutes=1))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert mock_smile_anna.async_update.call_count == 4
+    assert coordinator.update_interval == timedelta(minutes=2)
+
+    await hass.services.async_call(
+        CLIMATE_DOMAIN,
+        SERVICE_SET_TEMPERATURE,
+        {"entity_id": "climate.anna", "target_temp_high": 30, "target_temp_low": 20},
+        blocking=True,
+    )
+    assert coordinator.update_interval == timedelta(seconds=10)
+
+    # The debounced refresh and two fast updates
+    for delay in (2, 11, 11):
+        freezer.tick(timedelta(seconds=delay))
+        async_fire_time_changed(hass)
+        await hass.async_block_till_done()
+
+    assert mock_smile_anna.async_update.call_count == 7
+    assert coordinator.update_interval == timedelta(seconds=60)
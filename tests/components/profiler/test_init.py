@@ -15,6 +15,7 @@ import pytest
 from homeassistant.components.profiler import (
     _LRU_CACHE_WRAPPER_OBJECT,
     _SQLALCHEMY_LRU_OBJECT,
+    _TEMPLATE_RENDER_CACHE_OBJECT,
     CONF_ENABLED,
     CONF_SECONDS,
     SERVICE_DUMP_LOG_OBJECTS,
@@ -25,18 +26,22 @@ from homeassistant.components.profiler import (
     SERVICE_MEMORY,
     SERVICE_SET_ASYNCIO_DEBUG,
     SERVICE_START,
+    SERVICE_START_JOB_TIMING,
     SERVICE_START_LOG_OBJECT_SOURCES,
     SERVICE_START_LOG_OBJECTS,
+    SERVICE_STOP_JOB_TIMING,
     SERVICE_STOP_LOG_OBJECT_SOURCES,
     SERVICE_STOP_LOG_OBJECTS,
 )
 from homeassistant.components.profiler.const import DOMAIN
 from homeassistant.const import CONF_SCAN_INTERVAL, CONF_TYPE
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.event import TemplateRenderCache
 import homeassistant.util.dt as dt_util
 
 from tests.common import MockConfigEntry, async_fire_time_changed
+from tests.typing import WebSocketGenerator
 
 
 async def test_basic_usage(hass: HomeAssistant, tmp_path: Path) -> None:
@@ -295,12 +300,16 @@ async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture)
             self._data = {"sqlalchemy_test": 1}
 
     sqlalchemy_lru_cache = LRUCache()
+    render_cache = TemplateRenderCache()
+    render_cache.hits = 5
 
     def _mock_by_type(type_):
         if type_ == _LRU_CACHE_WRAPPER_OBJECT:
             return [_dummy_test_lru_stats]
         if type_ == _SQLALCHEMY_LRU_OBJECT:
             return [sqlalchemy_lru_cache]
+        if type_ == _TEMPLATE_RENDER_CACHE_OBJECT:
+            return [render_cache]
         return [domain_data]
 
     with patch("objgraph.by_type", side_effect=_mock_by_type):
@@ -311,6 +320,7 @@ async def test_lru_stats(hass: HomeAssistant, caplog: pytest.LogCaptureFixture)
     assert "_dummy_test_lru_stats" in caplog.text
     assert "CacheInfo" in caplog.text
     assert "sqlalchemy_test" in caplog.text
+    assert "hits=5, misses=0" in caplog.text
 
 
 async def test_log_object_sources(
@@ -446,3 +456,74 @@ async def test_set_asyncio_debug(
 
     assert await hass.config_entries.async_unload(entry.entry_id)
     await hass.async_block_till_done()
+
+
+async def test_job_timing(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator, tmp_path: Path
+) -> None:
+    """Test timing the jobs run in the event loop."""
+    entry = MockConfigEntry(domain=DOMAIN)
+    entry.add_to_hass(hass)
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.services.has_service(DOMAIN, SERVICE_START_JOB_TIMING)
+    assert hass.services.has_service(DOMAIN, SERVICE_STOP_JOB_TIMING)
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "profiler/job_timings"})
+    response = await client.receive_json()
+    assert not response["success"]
+    assert response["error"]["code"] == "not_found"
+
+    with pytest.raises(HomeAssistantError, match="Job timing not running"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_JOB_TIMING, {}, blocking=True
+        )
+
+    await hass.services.async_call(DOMAIN, SERVICE_START_JOB_TIMING, {}, blocking=True)
+    with pytest.raises(HomeAssistantError, match="Job timing already started"):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_START_JOB_TIMING, {}, blocking=True
+        )
+
+    @callback
+    def _listener(event) -> None:
+        """Listen for the test event."""
+
+    hass.bus.async_listen("test_job_timing", _listener)
+    for _ in range(3):
+        hass.bus.async_fire("test_job_timing")
+    await hass.async_block_till_done()
+
+    await client.send_json_auto_id({"type": "profiler/job_timings"})
+    response = await client.receive_json()
+    assert response["success"]
+    jobs = {job["name"]: job for job in response["result"]["jobs"]}
+    job = jobs[f"{__name__}.test_job_timing.<locals>._listener"]
+    assert job["calls"] == 3
+    assert job["integration"] == "core"
+    assert sum(job["histogram"].values()) == 3
+    assert response["result"]["integrations"]["core"]["calls"] >= 3
+
+    await client.send_json_auto_id({"type": "profiler/job_timings", "limit": 1})
+    response = await client.receive_json()
+    assert response["success"]
+    assert len(response["result"]["jobs"]) == 1
+
+    def _mock_path(filename: str) -> str:
+        return str(tmp_path / filename)
+
+    with patch.object(hass.config, "path", _mock_path):
+        await hass.services.async_call(
+            DOMAIN, SERVICE_STOP_JOB_TIMING, {}, blocking=True
+        )
+    await hass.async_block_till_done()
+
+    reports = list(tmp_path.glob("job_timings.*.json"))
+    assert len(reports) == 1
+    assert "async_run_hass_job" not in vars(hass)
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
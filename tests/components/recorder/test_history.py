@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from copy import copy
 from datetime import datetime, timedelta
+from functools import partial
 import json
 from unittest.mock import sentinel
 
@@ -19,6 +20,10 @@ from homeassistant.components.recorder.db_schema import (
 )
 from homeassistant.components.recorder.filters import Filters
 from homeassistant.components.recorder.models import process_timestamp
+from homeassistant.components.recorder.recent_states import (
+    RecentState,
+    RecentStatesBuffer,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.core import HomeAssistant, State
 from homeassistant.helpers.json import JSONEncoder
@@ -726,6 +731,74 @@ async def test_get_significant_states_only_minimal_response(
     assert len(hist["sensor.test"]) == 3
 
 
+@pytest.mark.parametrize("persistent_database", [True])
+@pytest.mark.parametrize("recorder_config", [{"commit_interval": 3600}])
+async def test_get_significant_states_not_committed(
+    hass: HomeAssistant, setup_recorder: recorder.Recorder
+) -> None:
+    """Test states which are not committed yet are included."""
+    instance = recorder.get_instance(hass)
+    start = dt_util.utcnow()
+    await async_wait_recording_done(hass)
+    hass.states.async_set("sensor.test", "on", attributes={"any": "attr"})
+    hass.states.async_set("sensor.test", "off", attributes={"any": "attr"})
+    hass.states.async_set("sensor.new", "1")
+    await async_recorder_block_till_done(hass)
+    assert len(instance.recent_states) == 3
+
+    # The event session is not committed, the database is queried from the
+    # database executor while the recorder holds it open
+    hist = await instance.async_add_executor_job(
+        partial(
+            history.get_significant_states,
+            hass,
+            start,
+            entity_ids=["sensor.test", "sensor.new"],
+        )
+    )
+    assert [state.state for state in hist["sensor.test"]] == ["on", "off"]
+    assert hist["sensor.test"][0].attributes == {"any": "attr"}
+    assert [state.state for state in hist["sensor.new"]] == ["1"]
+
+    await async_wait_recording_done(hass)
+    assert len(instance.recent_states) == 0
+
+    committed_hist = await instance.async_add_executor_job(
+        partial(
+            history.get_significant_states,
+            hass,
+            start,
+            entity_ids=["sensor.test", "sensor.new"],
+        )
+    )
+    assert [state.state for state in committed_hist["sensor.test"]] == ["on", "off"]
+    assert [state.state for state in committed_hist["sensor.new"]] == ["1"]
+
+
+def test_recent_states_evicted(caplog: pytest.LogCaptureFixture) -> None:
+    """Test evicting states which are not committed yet is logged once."""
+    buffer = RecentStatesBuffer(max_size=2)
+    for last_updated_ts in (1.0, 2.0, 3.0, 4.0):
+        buffer.add(
+            "sensor.test",
+            RecentState(1, "on", last_updated_ts, None, None, None),
+        )
+    assert len(buffer) == 2
+    assert [
+        state.last_updated_ts
+        for state in buffer.get_states(["sensor.test"])["sensor.test"]
+    ] == [3.0, 4.0]
+    assert caplog.text.count("More than 2 states are not committed") == 1
+
+    buffer.clear()
+    for last_updated_ts in (5.0, 6.0, 7.0):
+        buffer.add(
+            "sensor.test",
+            RecentState(1, "on", last_updated_ts, None, None, None),
+        )
+    assert caplog.text.count("More than 2 states are not committed") == 2
+
+
 def record_states(
     hass: HomeAssistant,
 ) -> tuple[datetime, datetime, dict[str, list[State]]]:
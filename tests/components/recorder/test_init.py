@@ -21,6 +21,7 @@ from homeassistant.components.lock import LockState
 from homeassistant.components.recorder import (
     CONF_AUTO_PURGE,
     CONF_AUTO_REPACK,
+    CONF_BULK_WRITE,
     CONF_COMMIT_INTERVAL,
     CONF_DB_MAX_RETRIES,
     CONF_DB_RETRY_WAIT,
@@ -1468,6 +1469,110 @@ async def test_saving_sets_old_state(hass: HomeAssistant, setup_recorder: None)
         assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
 
 
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_WRITE: True}])
+async def test_saving_sets_old_state_bulk_write(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test saving states and events in bulk write mode sets old state."""
+    hass.states.async_set("test.one", "s1", {"attr": 1})
+    hass.states.async_set("test.two", "s2", {"attr": 1})
+    hass.states.async_set("test.one", "s3", {"attr": 2})
+    hass.bus.async_fire("bulk_event", {"data": 1})
+    hass.bus.async_fire("bulk_event", {"data": 1})
+    hass.states.async_set("test.two", "s4", {})
+    hass.states.async_set("test.one", "s5", {"attr": 2})
+    hass.states.async_remove("test.two")
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(
+            session.query(
+                StatesMeta.entity_id,
+                States.state_id,
+                States.old_state_id,
+                States.state,
+                StateAttributes.shared_attrs,
+            )
+            .outerjoin(StatesMeta, States.metadata_id == StatesMeta.metadata_id)
+            .outerjoin(
+                StateAttributes, States.attributes_id == StateAttributes.attributes_id
+            )
+        )
+        assert len(states) == 6
+        states_by_state = {state.state: state for state in states}
+
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s2"].old_state_id is None
+        assert states_by_state["s3"].old_state_id == states_by_state["s1"].state_id
+        assert states_by_state["s4"].old_state_id == states_by_state["s2"].state_id
+        assert states_by_state["s5"].old_state_id == states_by_state["s3"].state_id
+        assert states_by_state[None].entity_id == "test.two"
+        assert states_by_state[None].old_state_id == states_by_state["s4"].state_id
+        assert states_by_state["s1"].shared_attrs == '{"attr":1}'
+        assert states_by_state["s5"].shared_attrs == '{"attr":2}'
+
+        events = list(
+            session.query(Events, EventData, EventTypes)
+            .outerjoin(EventData, Events.data_id == EventData.data_id)
+            .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "bulk_event")
+        )
+        assert len(events) == 2
+        assert events[0].EventData.shared_data == '{"data":1}'
+        assert events[0].Events.data_id == events[1].Events.data_id
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_WRITE: True}])
+async def test_saving_bulk_write_unlinks_states_not_recorded(
+    hass: HomeAssistant, setup_recorder: None
+) -> None:
+    """Test states which are not recorded in bulk write mode unlink the old state."""
+    hass.states.async_set("test.one", "s1", {})
+    hass.states.async_set("test.one", "s2", {"fail": CannotSerializeMe()})
+    hass.states.async_set("test.one", "s3", {})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s4", {"fail": CannotSerializeMe()})
+    await async_wait_recording_done(hass)
+    hass.states.async_set("test.one", "s5", {})
+    await async_wait_recording_done(hass)
+
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(session.query(States.state_id, States.old_state_id, States.state))
+        assert len(states) == 3
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s1"].old_state_id is None
+        assert states_by_state["s3"].old_state_id is None
+        assert states_by_state["s5"].old_state_id is None
+
+
+@pytest.mark.parametrize("recorder_config", [{CONF_BULK_WRITE: True}])
+async def test_saving_bulk_write_falls_back_to_single_events(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
+) -> None:
+    """Test a chunk that fails to be written in bulk is written event by event."""
+    with patch(
+        "homeassistant.components.recorder.core.write_events_in_bulk",
+        side_effect=SQLAlchemyError("bulk insert failed"),
+    ):
+        hass.states.async_set("test.one", "s1", {})
+        hass.bus.async_fire("bulk_event", {"data": 1})
+        hass.states.async_set("test.one", "s2", {})
+        await async_wait_recording_done(hass)
+
+    assert "events in bulk, writing them one at a time" in caplog.text
+    with session_scope(hass=hass, read_only=True) as session:
+        states = list(session.query(States.state_id, States.old_state_id, States.state))
+        assert len(states) == 2
+        states_by_state = {state.state: state for state in states}
+        assert states_by_state["s2"].old_state_id == states_by_state["s1"].state_id
+        events = list(
+            session.query(Events)
+            .outerjoin(EventTypes, Events.event_type_id == EventTypes.event_type_id)
+            .filter(EventTypes.event_type == "bulk_event")
+        )
+        assert len(events) == 1
+
+
 async def test_saving_state_with_serializable_data(
     hass: HomeAssistant, caplog: pytest.LogCaptureFixture, setup_recorder: None
 ) -> None:
@@ -25,7 +25,7 @@ from homeassistant.components.recorder.db_schema import (
     StatisticsShortTerm,
 )
 from homeassistant.components.recorder.history import get_significant_states
-from homeassistant.components.recorder.purge import purge_old_data
+from homeassistant.components.recorder.purge import PurgeProgress, purge_old_data
 from homeassistant.components.recorder.queries import select_event_type_ids
 from homeassistant.components.recorder.services import (
     SERVICE_PURGE,
@@ -110,6 +110,49 @@ async def test_purge_big_database(hass: HomeAssistant, recorder_mock: Recorder)
             assert state_attributes.count() == 1
 
 
+async def test_purge_progress(hass: HomeAssistant, recorder_mock: Recorder) -> None:
+    """Test the batch sizes adapt to slow purge tasks and the progress is tracked."""
+    for _ in range(12):
+        await _add_test_states(hass, wait_recording_done=False)
+    await async_wait_recording_done(hass)
+    assert recorder_mock.purge_progress is None
+
+    purge_before = dt_util.utcnow() - timedelta(days=4)
+    # A purge that is in progress is continued with its batch sizes
+    progress = recorder_mock.purge_progress = PurgeProgress(purge_before)
+    progress.states_batch_size = progress.events_batch_size = 2
+    with (
+        patch.object(recorder_mock, "max_bind_vars", 12),
+        patch.object(recorder_mock.database_engine, "max_bind_vars", 12),
+        patch("homeassistant.components.recorder.purge.PURGE_TASK_TARGET_TIME", 0),
+    ):
+        recorder_mock.queue_task(
+            PurgeTask(purge_before, repack=False, apply_filter=False)
+        )
+        await async_wait_purge_done(hass, 6)
+
+    assert recorder_mock.purge_progress is progress
+    assert progress.finished is not None
+    # Every task is slower than the target so the first task purges two
+    # batches of 12 states and the next ones a single batch
+    assert progress.as_dict() | {"rate": 0} == {
+        "purge_before": purge_before.isoformat(),
+        "started": progress.started.isoformat(),
+        "finished": progress.finished.isoformat(),
+        "tasks": 4,
+        "states_deleted": 48,
+        "events_deleted": 0,
+        "rate": 0,
+        "estimated_states_remaining": 0,
+        "states_batch_size": 1,
+        "events_batch_size": 1,
+        "last_task_duration": progress.last_task_duration,
+    }
+
+    with session_scope(hass=hass) as session:
+        assert session.query(States).count() == 24
+
+
 async def test_purge_old_states(hass: HomeAssistant, recorder_mock: Recorder) -> None:
     """Test deleting old states."""
     await _add_test_states(hass)
@@ -1,7 +1,8 @@
 """The tests for sensor recorder platform."""
 
+from collections.abc import Callable
 from datetime import timedelta
-from typing import Any
+from typing import Any, Literal
 from unittest.mock import ANY, Mock, patch
 
 import pytest
@@ -30,6 +31,9 @@ from homeassistant.components.recorder.statistics import (
     get_metadata_with_session,
     get_short_term_statistics_run_cache,
     list_statistic_ids,
+    reduce_day_ts_factory,
+    reduce_month_ts_factory,
+    reduce_week_ts_factory,
     validate_statistics,
 )
 from homeassistant.components.recorder.table_managers.statistics_meta import (
@@ -1928,6 +1932,108 @@ def test_cache_key_for_generate_statistics_at_time_stmt() -> None:
     assert cache_key_1 != cache_key_3
 
 
+@pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
+@pytest.mark.parametrize(
+    ("factory", "period"),
+    [
+        (reduce_day_ts_factory, timedelta(days=1)),
+        (reduce_week_ts_factory, timedelta(days=7)),
+        (reduce_month_ts_factory, timedelta(days=31)),
+    ],
+)
+async def test_reduce_statistics_numpy(
+    hass: HomeAssistant,
+    timezone: str,
+    factory: Callable[
+        [],
+        tuple[Callable[[float, float], bool], Callable[[float], tuple[float, float]]],
+    ],
+    period: timedelta,
+) -> None:
+    """Test the NumPy reduction matches the reduction row by row."""
+    await hass.config.async_set_time_zone(timezone)
+    start = dt_util.parse_datetime("2022-01-01 00:00:00+00:00").timestamp()
+    stats: dict[str, list[statistics.StatisticsRow]] = {}
+    for idx in range(3):
+        stat_list: list[statistics.StatisticsRow] = []
+        # Stagger the statistics and leave gaps of several hours between rows
+        row_start = start + idx * 86400 * 5
+        for hour in range(24 * 400):
+            row_start += 3600 * (1 if hour % 11 else 30)
+            stat_list.append(
+                {
+                    "start": row_start,
+                    "end": row_start + 3600,
+                    "mean": None if hour % 13 == 0 else hour * 0.7 % 17,
+                    "min": None if hour % 17 == 0 else hour * 0.3 % 11,
+                    "max": None if hour < 24 * 40 else hour * 1.1 % 23,
+                    "last_reset": None if hour % 5 else row_start,
+                    "state": hour * 0.5,
+                    "sum": hour * 2.0,
+                }
+            )
+        stats[f"sensor.test{idx}"] = stat_list
+    types: set[Literal["last_reset", "max", "mean", "min", "state", "sum"]] = {
+        "last_reset",
+        "max",
+        "mean",
+        "min",
+        "state",
+        "sum",
+    }
+
+    same_period, period_start_end = factory()
+    expected = statistics._reduce_statistics_loop(
+        stats, same_period, period_start_end, period, types
+    )
+    # Periods without any max are None
+    assert expected["sensor.test0"][0]["max"] is None
+
+    same_period, period_start_end = factory()
+    _assert_reduced_statistics_equal(
+        statistics._reduce_statistics_numpy(stats, period_start_end, types),
+        expected,
+    )
+
+    same_period, period_start_end = factory()
+    _assert_reduced_statistics_equal(
+        statistics._reduce_statistics_numpy(stats, period_start_end, {"mean", "sum"}),
+        {
+            statistic_id: [
+                {
+                    "start": row["start"],
+                    "end": row["end"],
+                    "mean": row["mean"],
+                    "sum": row["sum"],
+                }
+                for row in rows
+            ]
+            for statistic_id, rows in expected.items()
+        },
+    )
+
+    with patch.object(statistics, "HAS_NUMPY", False):
+        same_period, period_start_end = factory()
+        _assert_reduced_statistics_equal(
+            statistics._reduce_statistics(
+                stats, same_period, period_start_end, period, types
+            ),
+            expected,
+        )
+
+
+def _assert_reduced_statistics_equal(
+    reduced: dict[str, list[statistics.StatisticsRow]],
+    expected: dict[str, list[statistics.StatisticsRow]],
+) -> None:
+    """Assert reduced statistics are equal, allowing for rounding errors."""
+    assert reduced.keys() == expected.keys()
+    for statistic_id, rows in reduced.items():
+        assert len(rows) == len(expected[statistic_id])
+        for row, expected_row in zip(rows, expected[statistic_id], strict=True):
+            assert row == pytest.approx(expected_row)
+
+
 @pytest.mark.parametrize("timezone", ["America/Regina", "Europe/Vienna", "UTC"])
 @pytest.mark.freeze_time("2022-10-01 00:00:00+00:00")
 async def test_change(
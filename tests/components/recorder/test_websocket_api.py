@@ -2597,6 +2597,41 @@ async def test_recorder_info_no_instance(
         assert response["result"]["thread_running"] is False
 
 
+async def test_recorder_purge_progress(
+    recorder_mock: Recorder, hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test getting the progress of the purge."""
+    client = await hass_ws_client()
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] is None
+
+    await hass.services.async_call(
+        recorder.DOMAIN, "purge", {"keep_days": 0}, blocking=True
+    )
+    await async_wait_recording_done(hass)
+
+    await client.send_json_auto_id({"type": "recorder/purge_progress"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"] == {
+        "purge_before": ANY,
+        "started": ANY,
+        "finished": ANY,
+        "tasks": 1,
+        "states_deleted": ANY,
+        "events_deleted": ANY,
+        "rate": ANY,
+        "estimated_states_remaining": 0,
+        "states_batch_size": 20,
+        "events_batch_size": 15,
+        "last_task_duration": ANY,
+    }
+    assert response["result"]["finished"] is not None
+
+
 async def test_recorder_info_migration_queue_exhausted(
     hass: HomeAssistant,
     hass_ws_client: WebSocketGenerator,
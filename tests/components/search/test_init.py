@@ -1,5 +1,8 @@
 """Tests for Search integration."""
 
+from typing import Any
+from unittest.mock import patch
+
 import pytest
 from pytest_unordered import unordered
 
@@ -1013,3 +1016,59 @@ async def test_search(
         ),
         ItemType.SCRIPT: unordered(["script.device", "script.hue"]),
     }
+
+
+async def test_reference_graph_follows_reloads(
+    hass: HomeAssistant, hass_ws_client: WebSocketGenerator
+) -> None:
+    """Test the reference graph is updated when automations are reloaded."""
+    assert await async_setup_component(hass, "search", {})
+
+    def automation_config(entity_id: str) -> dict[str, Any]:
+        """Return an automation turning on an entity."""
+        return {
+            "id": "kitchen",
+            "alias": "kitchen",
+            "trigger": {"platform": "event", "event_type": "test_event"},
+            "action": {"action": "test.script", "target": {"entity_id": entity_id}},
+        }
+
+    assert await async_setup_component(
+        hass, "automation", {"automation": automation_config("light.kitchen")}
+    )
+    await hass.async_block_till_done()
+
+    def search(item_type: ItemType, item_id: str) -> dict[str, set[str]]:
+        """Search."""
+        return Searcher(hass, {}).async_search(item_type, item_id)
+
+    assert search(ItemType.ENTITY, "light.kitchen") == {
+        ItemType.AUTOMATION: {"automation.kitchen"}
+    }
+
+    with patch(
+        "homeassistant.config.load_yaml_config_file",
+        autospec=True,
+        return_value={"automation": automation_config("light.living_room")},
+    ):
+        await hass.services.async_call("automation", "reload", blocking=True)
+        await hass.async_block_till_done()
+
+    assert not search(ItemType.ENTITY, "light.kitchen")
+    assert search(ItemType.ENTITY, "light.living_room") == {
+        ItemType.AUTOMATION: {"automation.kitchen"}
+    }
+
+    client = await hass_ws_client(hass)
+    await client.send_json_auto_id({"type": "search/graph_stats"})
+    response = await client.receive_json()
+    assert response["success"]
+    assert response["result"]["entities"] == {
+        "automation": 1,
+        "group": 0,
+        "person": 0,
+        "scene": 0,
+        "script": 0,
+    }
+    assert response["result"]["referenced"]["automation"]["entity"] == 1
+    assert response["result"]["edges"] == 1
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import deque
 from collections.abc import Sequence
 from datetime import datetime, timedelta
 import statistics
@@ -26,6 +27,9 @@ from homeassistant.components.statistics.sensor import (
     CONF_SAMPLES_MAX_BUFFER_SIZE,
     CONF_STATE_CHARACTERISTIC,
     STAT_MEAN,
+    RunningMoments,
+    SlidingExtremes,
+    SortedSamples,
     StatisticsSensor,
 )
 from homeassistant.const import (
@@ -156,6 +160,16 @@ async def test_sensor_defaults_numeric(hass: HomeAssistant) -> None:
     )
     assert new_state.attributes.get("source_value_valid") is False
 
+    # Source sensor has a non-finite state, it is not added to the samples
+    for value in ("nan", "inf", "-inf"):
+        hass.states.async_set("sensor.test_monitored", value, {})
+        await hass.async_block_till_done()
+        new_state = hass.states.get("sensor.test")
+        assert new_state is not None
+        assert new_state.state == str(new_mean)
+        assert new_state.attributes.get("buffer_usage_ratio") == round(10 / 20, 2)
+        assert new_state.attributes.get("source_value_valid") is False
+
     # Source sensor has the STATE_UNKNOWN state, unit and state should not change
     state = hass.states.get("sensor.test")
     hass.states.async_set("sensor.test_monitored", STATE_UNKNOWN, {})
@@ -1701,3 +1715,32 @@ async def test_device_id(
     statistics_entity = entity_registry.async_get("sensor.statistics")
     assert statistics_entity is not None
     assert statistics_entity.device_id == source_entity.device_id
+
+
+def test_sliding_window_aggregates() -> None:
+    """Test the incremental aggregates match a full recalculation."""
+    samples: deque[float | bool] = deque(maxlen=5)
+    moments = RunningMoments(samples)
+    sorted_samples = SortedSamples()
+    extremes = SlidingExtremes()
+    for value in [*VALUES_NUMERIC, *reversed(VALUES_NUMERIC), 1e6, -3.5, 2, 2, 2]:
+        if len(samples) == samples.maxlen:
+            removed = samples.popleft()
+            moments.removed(removed)
+            sorted_samples.removed(removed)
+            extremes.removed(removed)
+        samples.append(value)
+        moments.added(value)
+        sorted_samples.added(value)
+        extremes.added(value)
+
+        assert moments.sum == pytest.approx(sum(samples))
+        assert extremes.max == max(samples)
+        assert extremes.min == min(samples)
+        assert sorted_samples.median() == statistics.median(samples)
+        assert sorted_samples.values == sorted(samples)
+        if len(samples) >= 2:
+            assert moments.variance == pytest.approx(statistics.variance(samples))
+            assert sorted_samples.percentile(25) == pytest.approx(
+                statistics.quantiles(samples, n=100, method="exclusive")[24]
+            )
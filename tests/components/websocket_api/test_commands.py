@@ -2,6 +2,7 @@
 
 import asyncio
 from copy import deepcopy
+import json
 import logging
 from typing import Any
 from unittest.mock import ANY, AsyncMock, Mock, patch
@@ -734,6 +735,136 @@ async def test_get_config(
     assert result == config
 
 
+async def test_get_connection_stats(
+    hass: HomeAssistant,
+    hass_client_no_auth: ClientSessionGenerator,
+    hass_access_token: str,
+) -> None:
+    """Test get_connection_stats command and the compression threshold."""
+    assert await async_setup_component(hass, "websocket_api", {})
+    hass.states.async_set("sensor.large", "on", {"data": "large " * 5000})
+    client = await hass_client_no_auth()
+
+    async with client.ws_connect(URL, compress=15) as ws:
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_REQUIRED
+        await ws.send_json({"type": TYPE_AUTH, "access_token": hass_access_token})
+        auth_msg = await ws.receive_json()
+        assert auth_msg["type"] == TYPE_AUTH_OK
+
+        await ws.send_json(
+            {
+                "id": 5,
+                "type": "supported_features",
+                "features": {const.FEATURE_CONNECTION_STATS: 1},
+            }
+        )
+        reply = await ws.receive_str()
+        assert json.loads(reply)["success"]
+
+        await ws.send_json({"id": 6, "type": "get_connection_stats"})
+        stats_reply = await ws.receive_str()
+        msg = json.loads(stats_reply)
+        assert msg["id"] == 6
+        assert msg["type"] == const.TYPE_RESULT
+        assert msg["success"]
+        stats = msg["result"]
+        # Each reply is counted when it is sent
+        assert stats == {
+            "compression": True,
+            "compression_threshold": const.DEFAULT_COMPRESSION_THRESHOLD,
+            "bytes_before_compression": len(reply),
+            "bytes_after_compression": len(reply),
+        }
+
+        await ws.send_json({"id": 7, "type": "get_states"})
+        states_reply = await ws.receive_str()
+        msg = json.loads(states_reply)
+        assert msg["success"]
+        assert msg["result"][0]["attributes"]["data"] == "large " * 5000
+
+        await ws.send_json({"id": 8, "type": "get_connection_stats"})
+        msg = await ws.receive_json()
+        before = (
+            msg["result"]["bytes_before_compression"]
+            - stats["bytes_before_compression"]
+        )
+        after = (
+            msg["result"]["bytes_after_compression"] - stats["bytes_after_compression"]
+        )
+        # The small stats reply is not compressed, the large states reply is
+        assert before == len(stats_reply) + len(states_reply)
+        assert len(stats_reply) < after < len(stats_reply) + len(states_reply) // 10
+
+        await ws.send_json(
+            {
+                "id": 9,
+                "type": "supported_features",
+                "features": {
+                    const.FEATURE_CONNECTION_STATS: 1,
+                    const.FEATURE_COMPRESSION_THRESHOLD: 100000,
+                },
+            }
+        )
+        msg = await ws.receive_json()
+        assert msg["success"]
+
+        await ws.send_json({"id": 10, "type": "get_connection_stats"})
+        stats_reply = await ws.receive_str()
+        stats = json.loads(stats_reply)["result"]
+        assert stats["compression_threshold"] == 100000
+
+        await ws.send_json({"id": 11, "type": "get_states"})
+        states_reply = await ws.receive_str()
+        msg = json.loads(states_reply)
+        assert msg["success"]
+        assert msg["result"][0]["attributes"]["data"] == "large " * 5000
+
+        await ws.send_json({"id": 12, "type": "get_connection_stats"})
+        msg = await ws.receive_json()
+        before = (
+            msg["result"]["bytes_before_compression"]
+            - stats["bytes_before_compression"]
+        )
+        after = (
+            msg["result"]["bytes_after_compression"] - stats["bytes_after_compression"]
+        )
+        # Messages below the threshold are not compressed
+        assert before == after == len(stats_reply) + len(states_reply)
+
+
+async def test_get_connection_stats_without_compression(
+    websocket_client: MockHAClientWebSocket,
+) -> None:
+    """Test get_connection_stats command when compression is not negotiated."""
+    await websocket_client.send_json({"id": 5, "type": "get_connection_stats"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    # The bytes are only counted with the connection stats feature
+    assert msg["result"] == {
+        "compression": False,
+        "compression_threshold": const.DEFAULT_COMPRESSION_THRESHOLD,
+        "bytes_before_compression": 0,
+        "bytes_after_compression": 0,
+    }
+
+    await websocket_client.send_json(
+        {
+            "id": 6,
+            "type": "supported_features",
+            "features": {const.FEATURE_CONNECTION_STATS: 1},
+        }
+    )
+    reply = await websocket_client.receive_str()
+    assert json.loads(reply)["success"]
+
+    await websocket_client.send_json({"id": 7, "type": "get_connection_stats"})
+    msg = await websocket_client.receive_json()
+    assert msg["result"]["bytes_before_compression"] == len(reply)
+    assert msg["result"]["bytes_after_compression"] == len(reply)
+
+
 async def test_ping(websocket_client: MockHAClientWebSocket) -> None:
     """Test get_panels command."""
     await websocket_client.send_json({"id": 5, "type": "ping"})
@@ -10,6 +10,8 @@ from homeassistant.components.websocket_api.messages import (
 )
 from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.core import Context, Event, HomeAssistant, State, callback
+from homeassistant.helpers.json import json_bytes
+from homeassistant.util.json import json_loads
 
 from tests.common import async_capture_events
 
@@ -76,6 +78,12 @@ async def test_cached_event_message_with_different_idens(hass: HomeAssistant) ->
 
     assert msg0 != msg1
     assert msg0 != msg2
+    assert json_loads(msg0) == {
+        "id": 2,
+        "type": "event",
+        "event": json_loads(json_bytes(events[0].as_dict())),
+    }
+    assert json_loads(msg2)["id"] == 4
 
     cache_info = lru_event_cache.cache_info()
     assert cache_info.hits == 2
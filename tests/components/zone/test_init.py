@@ -270,6 +270,72 @@ async def test_async_active_zone_with_non_zero_radius(
     assert active.entity_id == "zone.small_zone"
 
 
+async def test_active_zone_uses_index(hass: HomeAssistant) -> None:
+    """Test async_active_zone follows the zones through the index."""
+    assert await setup.async_setup_component(
+        hass,
+        zone.DOMAIN,
+        {
+            "zone": [
+                {
+                    "name": "Near Zone",
+                    "latitude": 32.880600,
+                    "longitude": -117.237561,
+                    "radius": 250,
+                },
+                {
+                    "name": "Far Zone",
+                    "latitude": 52.370216,
+                    "longitude": 4.895168,
+                    "radius": 250,
+                },
+            ]
+        },
+    )
+    zone_index = hass.data[zone.DATA_ZONE_INDEX]
+    assert zone_index.async_candidates(32.880600, -117.237561, 0) == [
+        "zone.home",
+        "zone.near_zone",
+    ]
+    # Too large to use the index, all zones are checked
+    assert zone_index.async_candidates(32.880600, -117.237561, 10**7) is None
+
+    active = zone.async_active_zone(hass, 52.370216, 4.895168)
+    assert active.entity_id == "zone.far_zone"
+
+    # Zones are moved, added and removed in the index
+    hass.states.async_set(
+        "zone.far_zone",
+        "0",
+        {"latitude": 32.880600, "longitude": -117.237561, "radius": 200},
+    )
+    hass.states.async_set(
+        "zone.antimeridian",
+        "0",
+        {"latitude": 0.0, "longitude": 179.9999, "radius": 1000},
+    )
+    await hass.async_block_till_done()
+    assert zone.async_active_zone(hass, 52.370216, 4.895168) is None
+    active = zone.async_active_zone(hass, 32.880600, -117.237561)
+    assert active.entity_id == "zone.far_zone"
+    active = zone.async_active_zone(hass, 0.0, -179.9999)
+    assert active.entity_id == "zone.antimeridian"
+
+    # Zones that can't be indexed are always candidates
+    hass.states.async_set("zone.invalid", "0", {"latitude": 0.0})
+    await hass.async_block_till_done()
+    assert zone_index.async_candidates(0.0, -179.9999, 0) == [
+        "zone.antimeridian",
+        "zone.invalid",
+    ]
+    hass.states.async_remove("zone.invalid")
+
+    hass.states.async_remove("zone.far_zone")
+    await hass.async_block_till_done()
+    active = zone.async_active_zone(hass, 32.880600, -117.237561)
+    assert active.entity_id == "zone.near_zone"
+
+
 async def test_core_config_update(hass: HomeAssistant) -> None:
     """Test updating core config will update home zone."""
     assert await setup.async_setup_component(hass, "zone", {})
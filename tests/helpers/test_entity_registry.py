@@ -1,6 +1,6 @@
 """Tests for the Entity Registry."""
 
-from datetime import datetime, timedelta
+from datetime import UTC, datetime, timedelta
 from functools import partial
 from typing import Any
 from unittest.mock import patch
@@ -1741,6 +1741,155 @@ def test_entity_registry_items() -> None:
     assert entities.get_entry(entry2.id) is None
 
 
+def _storage_entity(
+    entity_id: str,
+    unique_id: str,
+    config_entry_id: str | None,
+    device_id: str | None,
+    disabled_by: str | None = None,
+    *,
+    area_id: str | None = None,
+    labels: list[str] | None = None,
+    entry_id: str | None = None,
+) -> dict[str, Any]:
+    """Return the storage data of an entity registry entry."""
+    return {
+        "aliases": [],
+        "area_id": area_id,
+        "capabilities": None,
+        "categories": {},
+        "config_entry_id": config_entry_id,
+        "created_at": "2024-02-14T12:00:00.900075+00:00",
+        "device_class": None,
+        "device_id": device_id,
+        "disabled_by": disabled_by,
+        "entity_category": None,
+        "entity_id": entity_id,
+        "has_entity_name": False,
+        "hidden_by": None,
+        "icon": None,
+        "id": entry_id or f"id_{unique_id}",
+        "labels": labels or [],
+        "modified_at": "2024-02-14T12:00:00.900075+00:00",
+        "name": None,
+        "options": None,
+        "original_device_class": None,
+        "original_icon": None,
+        "original_name": None,
+        "platform": "hue",
+        "previous_unique_id": None,
+        "supported_features": 0,
+        "translation_key": None,
+        "unique_id": unique_id,
+        "unit_of_measurement": None,
+    }
+
+
+def test_entity_registry_items_pending() -> None:
+    """Test entries loaded from storage are created when they are accessed."""
+    entities = er.EntityRegistryItems()
+    entities.add_pending(_storage_entity("light.one", "1", "entry_a", "device_1"))
+    entities.add_pending(_storage_entity("light.two", "2", "entry_a", "device_2"))
+    entities.add_pending(
+        _storage_entity("light.three", "3", "entry_b", None, disabled_by="user")
+    )
+    entities.add_pending(_storage_entity("light.four", "4", None, "device_2"))
+
+    assert len(entities) == 4
+    assert "light.one" in entities
+    assert "light.five" not in entities
+    assert entities.data == {}
+    assert entities.get_entity_id(("light", "hue", "2")) == "light.two"
+
+    assert entities.get_entry("id_1").entity_id == "light.one"
+    assert set(entities.data) == {"light.one"}
+
+    assert [
+        entry.entity_id for entry in entities.get_entries_for_device_id("device_2")
+    ] == [
+        "light.two",
+        "light.four",
+    ]
+    assert set(entities.data) == {"light.one", "light.two", "light.four"}
+    assert entities.get_entity_id(("light", "hue", "2")) == "light.two"
+
+    assert entities.get_device_ids() == {"device_1", "device_2"}
+    assert [
+        entry if isinstance(entry, dict) else entry.as_storage_fragment
+        for entry in entities.storage_data()
+    ] == [
+        entities["light.one"].as_storage_fragment,
+        entities["light.two"].as_storage_fragment,
+        entities["light.four"].as_storage_fragment,
+        _storage_entity("light.three", "3", "entry_b", None, disabled_by="user"),
+    ]
+    assert [entry.entity_id for entry in entities.get_enabled_entries()] == [
+        "light.one",
+        "light.two",
+        "light.four",
+    ]
+    assert len(entities.data) == 3
+
+    entry = entities["light.three"]
+    assert entry.disabled_by is er.RegistryEntryDisabler.USER
+    assert entry.created_at == datetime(2024, 2, 14, 12, 0, 0, 900075, tzinfo=UTC)
+    assert entities.get_entries_for_config_entry_id("entry_b") == [entry]
+    assert len(entities) == 4
+    assert len(entities.storage_data()) == 4
+
+    entities.add_pending(_storage_entity("light.five", "5", "entry_c", None))
+    del entities["light.five"]
+    assert "light.five" not in entities
+    assert entities.get_entity_id(("light", "hue", "5")) is None
+    assert entities.get_entries_for_config_entry_id("entry_c") == []
+
+
+def test_entity_registry_items_pending_area_and_label() -> None:
+    """Test looking up entries by area or label only creates those entries."""
+    entities = er.EntityRegistryItems()
+    entities.add_pending(
+        _storage_entity("light.one", "1", None, "device_1", area_id="kitchen")
+    )
+    entities.add_pending(
+        _storage_entity("light.two", "2", None, None, labels=["night", "porch"])
+    )
+    entities.add_pending(_storage_entity("light.three", "3", None, None))
+
+    assert entities.get_device_ids() == {"device_1"}
+    assert entities.data == {}
+
+    assert [
+        entry.entity_id for entry in entities.get_entries_for_area_id("kitchen")
+    ] == ["light.one"]
+    assert set(entities.data) == {"light.one"}
+    assert entities.get_device_ids() == {"device_1"}
+
+    assert [entry.entity_id for entry in entities.get_entries_for_label("porch")] == [
+        "light.two"
+    ]
+    assert set(entities.data) == {"light.one", "light.two"}
+    assert [entry.entity_id for entry in entities.get_entries_for_label("night")] == [
+        "light.two"
+    ]
+    assert entities.get_entries_for_area_id("garden") == []
+    assert set(entities.data) == {"light.one", "light.two"}
+
+
+def test_entity_registry_items_pending_shared_id() -> None:
+    """Test creating stored entries which share an id or a unique_id."""
+    entities = er.EntityRegistryItems()
+    entities.add_pending(_storage_entity("light.one", "1", None, None, entry_id="a"))
+    entities.add_pending(_storage_entity("light.two", "1", None, None, entry_id="a"))
+
+    # The indexes point to the entry that was added last
+    assert entities.get_entity_id(("light", "hue", "1")) == "light.two"
+    assert entities["light.one"].id == "a"
+    assert entities.get_entity_id(("light", "hue", "1")) == "light.one"
+    assert entities["light.two"].id == "a"
+    assert len(entities.data) == 2
+    assert len(entities.storage_data()) == 2
+
+
 async def test_disabled_by_str_not_allowed(entity_registry: er.EntityRegistry) -> None:
     """Test we need to pass disabled by type."""
     with pytest.raises(ValueError):
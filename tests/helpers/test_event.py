@@ -30,6 +30,7 @@ from homeassistant.helpers.event import (
     TrackTemplate,
     TrackTemplateResult,
     async_call_later,
+    async_get_template_render_cache,
     async_track_device_registry_updated_event,
     async_track_entity_registry_updated_event,
     async_track_point_in_time,
@@ -444,6 +445,31 @@ async def test_async_track_state_change_filtered(hass: HomeAssistant) -> None:
     track_throws.async_remove()
 
 
+async def test_async_track_state_change_filtered_domain_entity_added(
+    hass: HomeAssistant,
+) -> None:
+    """Test queued changes are not dropped when an entity of a domain is added."""
+    hass.states.async_set("switch.existing", "off")
+    changes = []
+
+    @ha.callback
+    def _async_changed(event: Event[EventStateChangedData]) -> None:
+        changes.append((event.data["entity_id"], event.data["new_state"].state))
+
+    tracker = async_track_state_change_filtered(
+        hass, TrackStates(False, set(), {"switch"}), _async_changed
+    )
+
+    # The change of the existing entity is dispatched in the next loop
+    # iteration, after the tracker subscribed to the added entity
+    hass.states.async_set("switch.existing", "on")
+    hass.states.async_set("switch.added", "on")
+    await hass.async_block_till_done()
+    assert sorted(changes) == [("switch.added", "on"), ("switch.existing", "on")]
+
+    tracker.async_remove()
+
+
 async def test_async_track_state_change_event(hass: HomeAssistant) -> None:
     """Test async_track_state_change_event."""
     single_entity_id_tracker = []
@@ -1959,6 +1985,52 @@ async def test_track_template_result_with_wildcard(hass: HomeAssistant) -> None:
     assert "cover.office_skylight=open" in specific_runs[0]
 
 
+async def test_track_template_result_shared_render(hass: HomeAssistant) -> None:
+    """Test identical templates render once per state change."""
+    runs = []
+    render_cache = async_get_template_render_cache(hass)
+
+    @ha.callback
+    def run_callback(
+        event: Event[EventStateChangedData] | None,
+        updates: list[TrackTemplateResult],
+    ) -> None:
+        runs.append(int(updates.pop().result))
+
+    for variables in (None, {"this": 1}, {"test": 5}):
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(
+                    Template("{{ states('sensor.test') | int + 1 }}", hass),
+                    variables,
+                )
+            ],
+            run_callback,
+        )
+    # Templates referencing their variables do not share renders
+    async_track_template_result(
+        hass,
+        [
+            TrackTemplate(
+                Template("{{ states('sensor.test') | int + test }}", hass),
+                {"test": 5},
+            )
+        ],
+        run_callback,
+    )
+    await hass.async_block_till_done()
+    hits = render_cache.hits
+    misses = render_cache.misses
+
+    hass.states.async_set("sensor.test", 5)
+    await hass.async_block_till_done()
+
+    assert sorted(runs) == [6, 6, 6, 10]
+    assert render_cache.hits - hits == 2
+    assert render_cache.misses - misses == 2
+
+
 async def test_track_template_result_with_group(hass: HomeAssistant) -> None:
     """Test tracking template with a group."""
     hass.states.async_set("sensor.power_1", 0)
@@ -0,0 +1,50 @@
+"""Test the job timing helper."""
+
+from functools import partial
+
+from homeassistant.core import HassJob, HomeAssistant, callback
+from homeassistant.helpers.job_timing import (
+    async_disable_job_timing,
+    async_enable_job_timing,
+    async_get_job_timings,
+)
+
+
+async def test_job_timing(hass: HomeAssistant) -> None:
+    """Test enabling and disabling the job timing."""
+    calls: list[int] = []
+
+    @callback
+    def _job(value: int) -> None:
+        calls.append(value)
+
+    assert async_get_job_timings(hass) is None
+    assert async_disable_job_timing(hass) is None
+
+    timings = async_enable_job_timing(hass)
+    assert async_enable_job_timing(hass) is timings
+    assert async_get_job_timings(hass) is timings
+
+    hass.async_run_hass_job(HassJob(_job), 1)
+    hass.async_run_hass_job(HassJob(partial(_job, 2)))
+    assert calls == [1, 2]
+
+    report = timings.async_as_dict()
+    assert report["jobs"] == [
+        {
+            "name": f"{__name__}.test_job_timing.<locals>._job",
+            "integration": "core",
+            "calls": 2,
+            "total": report["jobs"][0]["total"],
+            "mean": report["jobs"][0]["mean"],
+            "max": report["jobs"][0]["max"],
+            "histogram": {"<1ms": 2, "<10ms": 0, "<100ms": 0, "<1s": 0, ">=1s": 0},
+        }
+    ]
+    assert report["integrations"]["core"]["calls"] == 2
+
+    assert async_disable_job_timing(hass) is timings
+    assert async_get_job_timings(hass) is None
+    hass.async_run_hass_job(HassJob(_job), 3)
+    assert calls == [1, 2, 3]
+    assert timings.async_as_dict()["jobs"][0]["calls"] == 2
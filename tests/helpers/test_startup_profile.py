@@ -0,0 +1,133 @@
+"""Test the startup profile helper."""
+
+from datetime import timedelta
+from typing import Any
+from unittest.mock import patch
+
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.startup_profile import (
+    SAVE_DELAY,
+    STORAGE_KEY,
+    StartupProfile,
+    async_get_startup_profile,
+)
+from homeassistant.requirements import async_load_installed_versions
+
+from tests.common import MockModule, async_fire_time_changed, mock_integration
+
+
+async def test_plan_imports(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    """Test the imports are planned from the dependencies and the last start."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "data": {
+            "integrations": {
+                "slow_leaf": {"import": 2.0, "setup": 1.0},
+                "fast_leaf": {"import": 0.1},
+            }
+        },
+    }
+    integrations = {
+        module.DOMAIN: mock_integration(hass, module)
+        for module in (
+            MockModule("base"),
+            MockModule("middle", dependencies=["base"]),
+            MockModule("fast_leaf", dependencies=["middle"]),
+            MockModule("slow_leaf", dependencies=["middle"]),
+            MockModule("new_leaf", dependencies=["middle", "unknown"]),
+            MockModule("stage_1", dependencies=["middle"]),
+        )
+    }
+    for integration in integrations.values():
+        await integration.resolve_dependencies()
+    profile = StartupProfile(hass)
+    await profile.async_load()
+
+    plan = profile.async_plan_imports(integrations, ["stage_1", "middle"])
+    assert [integration.domain for integration in plan] == [
+        "base",
+        "middle",
+        "stage_1",
+        "slow_leaf",
+        "fast_leaf",
+        "new_leaf",
+    ]
+
+    await profile.async_preimport(plan)
+    # The dependencies of new_leaf could not be resolved
+    assert {
+        domain: timeline.import_ is not None
+        for domain, timeline in profile.current.items()
+    } == dict.fromkeys(integrations.keys() - {"new_leaf"}, True)
+
+
+async def test_preimport_requirements_installed(hass: HomeAssistant) -> None:
+    """Test only integrations with their requirements installed are pre-imported."""
+    integrations = [
+        mock_integration(hass, module)
+        for module in (
+            MockModule("installed", requirements=["installed==1.0"]),
+            MockModule("outdated", requirements=["outdated==2.0"]),
+            MockModule("depends_outdated", dependencies=["outdated"]),
+            MockModule("skipped", requirements=["skipped==1.0"]),
+        )
+    ]
+    for integration in integrations:
+        await integration.resolve_dependencies()
+    hass.config.skip_pip = False
+    hass.config.skip_pip_packages = ["skipped"]
+    profile = StartupProfile(hass)
+    await profile.async_load()
+
+    with patch(
+        "homeassistant.requirements.pkg_util.get_installed_versions",
+        return_value={"installed==1.0"},
+    ):
+        await async_load_installed_versions(
+            hass, {"installed==1.0", "outdated==2.0", "skipped==1.0"}
+        )
+        await profile.async_preimport(integrations)
+
+    assert {
+        domain: timeline.import_ is not None
+        for domain, timeline in profile.current.items()
+    } == {"installed": True, "skipped": True}
+
+
+async def test_profile_is_saved(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """Test the timeline of the current start is saved."""
+    hass_storage[STORAGE_KEY] = {
+        "version": 1,
+        "data": {"integrations": {"imported": {"import": 0.5, "setup": 4.0}}},
+    }
+    profile = async_get_startup_profile(hass)
+    assert async_get_startup_profile(hass) is profile
+    await profile.async_load()
+
+    profile.async_resolved(["imported", "new"])
+    profile.async_imported("new", 0.25)
+    profile.async_set_up({"imported": 3.0, "new": 1.0})
+
+    freezer.tick(timedelta(seconds=SAVE_DELAY))
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+
+    integrations = hass_storage[STORAGE_KEY]["data"]["integrations"]
+    assert integrations == {
+        "imported": {
+            "resolved": integrations["imported"]["resolved"],
+            "import": 0.5,
+            "setup": 3.0,
+        },
+        "new": {
+            "resolved": integrations["new"]["resolved"],
+            "import": 0.25,
+            "setup": 1.0,
+        },
+    }
@@ -2,6 +2,7 @@
 
 import asyncio
 from datetime import timedelta
+from functools import partial
 import json
 import os
 from typing import Any, NamedTuple
@@ -21,7 +22,7 @@ from homeassistant.core import DOMAIN as HOMEASSISTANT_DOMAIN, CoreState, HomeAs
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers import issue_registry as ir, storage
 from homeassistant.helpers.json import json_bytes
-from homeassistant.util import dt as dt_util
+from homeassistant.util import dt as dt_util, json as json_util
 from homeassistant.util.color import RGBColor
 
 from tests.common import (
@@ -1180,3 +1181,112 @@ async def test_storage_concurrent_load(hass: HomeAssistant) -> None:
         )
         for load in loads:
             assert load == "data"
+
+
+async def test_delayed_writes_are_batched(tmpdir: py.path.local) -> None:
+    """Test delayed writes that are due close together are written in one batch."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store1 = storage.Store(hass, MOCK_VERSION, "store1")
+        store2 = storage.Store(hass, MOCK_VERSION, "store2", atomic_writes=True)
+        store3 = storage.Store(hass, MOCK_VERSION, "store3", atomic_writes=True)
+        store4 = storage.Store(hass, MOCK_VERSION, "store4")
+
+        store1.async_delay_save(lambda: MOCK_DATA, 0.1)
+        store2.async_delay_save(lambda: MOCK_DATA, 0.5)
+        store3.async_delay_save(lambda: MOCK_DATA2, 0.9)
+        store4.async_delay_save(lambda: MOCK_DATA, 30)
+
+        with patch.object(
+            storage._StoreManager,
+            "_write_pending",
+            autospec=True,
+            side_effect=storage._StoreManager._write_pending,
+        ) as mock_write_pending:
+            async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=0.1))
+            await hass.async_block_till_done()
+
+        assert mock_write_pending.call_count == 1
+        assert [write.store for write in mock_write_pending.mock_calls[0][1][1]] == [
+            store1,
+            store2,
+            store3,
+        ]
+        assert await store3.async_load() == MOCK_DATA2
+
+        write_stats = storage.async_get_write_stats(hass)
+        assert set(write_stats) == {"store1", "store2", "store3"}
+        assert write_stats["store2"]["writes"] == 1
+        assert write_stats["store2"]["errors"] == 0
+        assert write_stats["store2"]["bytes"] == os.path.getsize(store2.path)
+
+        await hass.async_stop(force=True)
+
+
+async def test_binary_snapshot(tmpdir: py.path.local) -> None:
+    """Test a store loads its binary snapshot and falls back to JSON."""
+    loop = asyncio.get_running_loop()
+    config_dir = await loop.run_in_executor(None, tmpdir.mkdir, "temp_storage")
+    async with async_test_home_assistant(config_dir=config_dir.strpath) as hass:
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, binary_snapshot=True)
+        await store.async_save(MOCK_DATA)
+        snapshot_path = f"{store.path}{storage.SNAPSHOT_SUFFIX}"
+        # The snapshot is only written when Home Assistant stops
+        assert not await hass.async_add_executor_job(os.path.isfile, snapshot_path)
+
+        store.async_delay_save(lambda: MOCK_DATA2, 10)
+        hass.set_state(CoreState.stopping)
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert await hass.async_add_executor_job(os.path.isfile, snapshot_path)
+        snapshot_mtime = await hass.async_add_executor_job(
+            os.path.getmtime, snapshot_path
+        )
+
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, binary_snapshot=True)
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json", side_effect=OSError
+        ):
+            assert await store.async_load() == MOCK_DATA2
+
+        # The snapshot is not rewritten if the JSON file did not change
+        hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+        await hass.async_block_till_done()
+        assert (
+            await hass.async_add_executor_job(os.path.getmtime, snapshot_path)
+            == snapshot_mtime
+        )
+
+        # The snapshot is ignored once the mtime of the JSON file changes
+        json_stat = await hass.async_add_executor_job(os.stat, store.path)
+        await hass.async_add_executor_job(
+            partial(
+                os.utime,
+                store.path,
+                ns=(json_stat.st_atime_ns, json_stat.st_mtime_ns + 1),
+            )
+        )
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, binary_snapshot=True)
+        with patch(
+            "homeassistant.helpers.storage.json_util.load_json",
+            wraps=json_util.load_json,
+        ) as mock_load_json:
+            assert await store.async_load() == MOCK_DATA2
+        assert mock_load_json.called
+        hass.set_state(CoreState.running)
+        await store.async_save(MOCK_DATA)
+
+        # The snapshot is ignored once the JSON file changes
+        def _write_json() -> None:
+            with open(store.path, "w", encoding="utf8") as fp:
+                json.dump({"version": MOCK_VERSION, "data": MOCK_DATA2}, fp)
+
+        await hass.async_add_executor_job(_write_json)
+        store = storage.Store(hass, MOCK_VERSION, MOCK_KEY, binary_snapshot=True)
+        assert await store.async_load() == MOCK_DATA2
+
+        await store.async_remove()
+        assert not await hass.async_add_executor_job(os.path.isfile, snapshot_path)
+
+        await hass.async_stop(force=True)
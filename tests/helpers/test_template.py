@@ -13,6 +13,8 @@ from typing import Any
 from unittest.mock import patch
 
 from freezegun import freeze_time
+import jinja2
+from lru import LRU
 import orjson
 import pytest
 from syrupy import SnapshotAssertion
@@ -120,6 +122,40 @@ def assert_result_info(
         assert not hasattr(info, "_domains")
 
 
+async def test_compiled_templates_cache(hass: HomeAssistant) -> None:
+    """Test the compiled code of a source is reused by new templates."""
+    compiled_templates = LRU(2)
+    hass.data[template._COMPILED_TEMPLATES] = compiled_templates
+    assert template.Template("{{ 1 + 1 }}", hass).async_render() == 2
+    code = compiled_templates[("full", "{{ 1 + 1 }}")]
+
+    with patch.object(jinja2.Environment, "compile") as mock_compile:
+        assert template.TemplateEnvironment(hass).compile("{{ 1 + 1 }}") is code
+    assert not mock_compile.called
+
+    template.TemplateEnvironment(hass).compile("{{ 1 + 2 }}")
+    template.TemplateEnvironment(hass).compile("{{ 1 + 3 }}")
+    assert ("full", "{{ 1 + 1 }}") not in compiled_templates
+
+
+async def test_compiled_templates_cache_environments(hass: HomeAssistant) -> None:
+    """Test code compiled in another kind of environment is not reused."""
+    compiled_templates = LRU(16)
+    hass.data[template._COMPILED_TEMPLATES] = compiled_templates
+    hass.states.async_set("sensor.a", "1")
+    source = "{{ 'sensor.a' | expand | map(attribute='state') | list }}"
+
+    # Filters passing the context are compiled differently per environment
+    template.TemplateEnvironment(hass, limited=True).compile(source)
+    assert ("limited", source) in compiled_templates
+    assert ("full", source) not in compiled_templates
+
+    assert template.Template(source, hass).async_render() == ["1"]
+    assert (
+        compiled_templates[("full", source)] != compiled_templates[("limited", source)]
+    )
+
+
 async def test_template_render_missing_hass(hass: HomeAssistant) -> None:
     """Test template render when hass is not set."""
     hass.states.async_set("sensor.test", "23")
@@ -3450,6 +3486,29 @@ async def test_closest_function_home_vs_group_state(hass: HomeAssistant) -> None
     assert info.rate_limit is None
 
 
+async def test_attribute_entities(hass: HomeAssistant) -> None:
+    """Test attribute_entities function."""
+    info = render_to_info(hass, "{{ attribute_entities('device_class', 'battery') }}")
+    assert_result_info(info, [], all_states=True)
+
+    hass.states.async_set("sensor.phone", "50", {"device_class": "battery"})
+    hass.states.async_set("binary_sensor.phone", "off", {"device_class": "battery"})
+    hass.states.async_set("sensor.outside", "12", {"device_class": "temperature"})
+
+    info = render_to_info(
+        hass, "{{ attribute_entities('device_class', 'battery') | sort }}"
+    )
+    assert_result_info(info, ["binary_sensor.phone", "sensor.phone"], all_states=True)
+
+    info = render_to_info(
+        hass, "{{ 'device_class' | attribute_entities('battery', 'sensor') }}"
+    )
+    assert_result_info(info, ["sensor.phone"], all_states=True)
+
+    info = render_to_info(hass, "{{ attribute_entities('device_class', none) }}")
+    assert_result_info(info, [], all_states=True)
+
+
 async def test_expand(hass: HomeAssistant) -> None:
     """Test expand function."""
     info = render_to_info(hass, "{{ expand('test.object') }}")
@@ -248,6 +248,48 @@ async def test_update_context(
     assert not set(crd.async_contexts())
 
 
+async def test_changed_contexts(
+    crd: update_coordinator.DataUpdateCoordinator[int],
+) -> None:
+    """Test only the listeners of changed contexts are updated."""
+    updates = []
+
+    crd.async_add_listener(lambda: updates.append("a"), "a")
+    crd.async_add_listener(lambda: updates.append("b"), "b")
+    crd.async_add_listener(lambda: updates.append(None))
+
+    crd.async_set_changed_contexts({"a"})
+    crd.async_set_updated_data(1)
+    assert updates == ["a", None]
+
+    # Without changed contexts all listeners are updated
+    updates.clear()
+    crd.async_set_updated_data(2)
+    assert updates == ["a", "b", None]
+
+    # All listeners are updated when the update fails or recovers
+    updates.clear()
+    crd.async_set_changed_contexts({"b"})
+    crd.async_set_update_error(update_coordinator.UpdateFailed())
+    assert updates == ["a", "b", None]
+
+    updates.clear()
+    crd.async_set_changed_contexts({"b"})
+    crd.async_set_updated_data(3)
+    assert updates == ["a", "b", None]
+
+    async def refresh() -> int:
+        crd.async_set_changed_contexts({"b"})
+        return 4
+
+    updates.clear()
+    crd.update_method = refresh
+    await crd.async_refresh()
+    assert updates == ["b", None]
+
+    crd._unschedule_refresh()
+
+
 async def test_request_refresh(
     crd: update_coordinator.DataUpdateCoordinator[int],
 ) -> None:
@@ -37,6 +37,7 @@ from homeassistant.const import (
     EVENT_STATE_CHANGED,
     EVENT_STATE_REPORTED,
     MATCH_ALL,
+    UnitOfLength,
     __version__,
 )
 import homeassistant.core as ha
@@ -358,7 +359,7 @@ async def test_async_create_task_schedule_coroutine_with_name() -> None:
 
 async def test_async_run_eager_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(_job_timer=None)
     calls = []
 
     def job():
@@ -371,7 +372,7 @@ async def test_async_run_eager_hass_job_calls_callback() -> None:
 
 async def test_async_run_eager_hass_job_calls_coro_function() -> None:
     """Test running coros from async_run_hass_job with eager_start."""
-    hass = MagicMock()
+    hass = MagicMock(_job_timer=None)
 
     async def job():
         pass
@@ -382,7 +383,7 @@ async def test_async_run_eager_hass_job_calls_coro_function() -> None:
 
 async def test_async_run_hass_job_calls_callback() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(_job_timer=None)
     calls = []
 
     def job():
@@ -395,7 +396,7 @@ async def test_async_run_hass_job_calls_callback() -> None:
 
 async def test_async_run_hass_job_delegates_non_async() -> None:
     """Test that the callback annotation is respected."""
-    hass = MagicMock()
+    hass = MagicMock(_job_timer=None)
     calls = []
 
     def job():
@@ -1169,6 +1170,93 @@ async def test_eventbus_filtered_listener(hass: HomeAssistant) -> None:
     unsub()
 
 
+async def test_eventbus_keyed_listener(hass: HomeAssistant) -> None:
+    """Test listening for events by a value of their data."""
+    calls = []
+    other_calls = []
+    old_count = hass.bus.async_listeners().get("test", 0)
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    @ha.callback
+    def other_listener(event):
+        """Mock listener for multiple values."""
+        other_calls.append(event)
+
+    unsub = hass.bus.async_listen_keyed("test", "entity_id", ["light.a"], listener)
+    job = ha.HassJob(other_listener)
+    unsub_job_a = hass.bus.async_listen_keyed("test", "entity_id", ["light.a"], job)
+    unsub_job_b = hass.bus.async_listen_keyed("test", "entity_id", ["light.b"], job)
+    # The same job listening for multiple values is counted once
+    assert hass.bus.async_listeners()["test"] == old_count + 2
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    hass.bus.async_fire("test", {"entity_id": "light.b"})
+    hass.bus.async_fire("test", {"entity_id": "light.c"})
+    hass.bus.async_fire("test", {"entity_id": ["unhashable"]})
+    hass.bus.async_fire("test", {"other": "light.a"})
+    hass.bus.async_fire("test")
+    await hass.async_block_till_done()
+
+    assert [event.data["entity_id"] for event in calls] == ["light.a"]
+    assert [event.data["entity_id"] for event in other_calls] == [
+        "light.a",
+        "light.b",
+    ]
+
+    unsub()
+    unsub_job_a()
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    hass.bus.async_fire("test", {"entity_id": "light.b"})
+    await hass.async_block_till_done()
+    assert len(calls) == 1
+    assert len(other_calls) == 3
+
+    unsub_job_b()
+    assert hass.bus.async_listeners().get("test", 0) == old_count
+
+    with pytest.raises(HomeAssistantError):
+        hass.bus.async_listen_keyed(MATCH_ALL, "entity_id", ["light.a"], listener)
+
+
+async def test_eventbus_keyed_listener_order(hass: HomeAssistant) -> None:
+    """Test keyed listeners run after the other listeners of an event."""
+    calls = []
+
+    def _make_listener(name):
+        @ha.callback
+        def listener(event):
+            """Mock listener."""
+            calls.append(name)
+
+        return listener
+
+    unsubs = [
+        hass.bus.async_listen_keyed(
+            "test", "entity_id", ["light.a"], _make_listener("keyed 1")
+        ),
+        hass.bus.async_listen("test", _make_listener("plain")),
+        hass.bus.async_listen_keyed(
+            "test", "entity_id", ["light.a"], _make_listener("keyed 2")
+        ),
+        hass.bus.async_listen(
+            "test",
+            _make_listener("filtered"),
+            event_filter=ha.callback(lambda event_data: True),
+        ),
+        hass.bus.async_listen(MATCH_ALL, _make_listener("match all")),
+    ]
+
+    hass.bus.async_fire("test", {"entity_id": "light.a"})
+    assert calls == ["plain", "filtered", "match all", "keyed 1", "keyed 2"]
+
+    for unsub in unsubs:
+        unsub()
+
+
 async def test_eventbus_run_immediately_callback(hass: HomeAssistant) -> None:
     """Test we can call events immediately with a callback."""
     calls = []
@@ -2484,6 +2572,98 @@ async def test_async_all(hass: HomeAssistant) -> None:
     } == {"light.bowl", "light.frog", "switch.link"}
 
 
+async def test_async_all_with_attribute(hass: HomeAssistant) -> None:
+    """Test async_all_with_attribute keeps its index up to date."""
+    assert hass.states.async_all_with_attribute("device_class", "battery") == []
+
+    hass.states.async_set("sensor.phone", "50", {"device_class": "battery"})
+    hass.states.async_set("sensor.watch", "80", {"device_class": "battery"})
+    hass.states.async_set("binary_sensor.phone", "off", {"device_class": "battery"})
+    hass.states.async_set("sensor.outside", "12", {"device_class": "temperature"})
+    hass.states.async_set("sensor.list", "1", {"device_class": ["unhashable"]})
+
+    def _entity_ids(*args: Any) -> set[str]:
+        return {
+            state.entity_id
+            for state in hass.states.async_all_with_attribute("device_class", *args)
+        }
+
+    assert _entity_ids("battery") == {
+        "sensor.phone",
+        "sensor.watch",
+        "binary_sensor.phone",
+    }
+    assert _entity_ids("battery", "sensor") == {"sensor.phone", "sensor.watch"}
+    assert _entity_ids("battery", ["binary_sensor"]) == {"binary_sensor.phone"}
+    assert _entity_ids("humidity") == set()
+    # Unhashable values are looked up without the index
+    assert _entity_ids(["unhashable"]) == {"sensor.list"}
+
+    # The index follows attribute changes and removals
+    hass.states.async_set("sensor.watch", "80", {"device_class": "temperature"})
+    hass.states.async_set("sensor.tablet", "20", {"device_class": "battery"})
+    hass.states.async_remove("binary_sensor.phone")
+    assert _entity_ids("battery") == {"sensor.phone", "sensor.tablet"}
+    assert _entity_ids("temperature") == {"sensor.outside", "sensor.watch"}
+
+    # The index holds the current state objects
+    hass.states.async_set("sensor.phone", "40", {"device_class": "battery"})
+    assert [
+        state.state
+        for state in hass.states.async_all_with_attribute(
+            "device_class", "battery", "sensor"
+        )
+        if state.entity_id == "sensor.phone"
+    ] == ["40"]
+
+    hass.states.async_set("sensor.phone", "40")
+    hass.states.async_remove("sensor.tablet")
+    assert _entity_ids("battery") == set()
+    assert hass.states._states._attribute_index["device_class"].keys() == {
+        (str, "temperature")
+    }
+
+    with pytest.raises(ValueError):
+        hass.states.async_all_with_attribute("device_class", None)
+
+
+async def test_async_all_with_attribute_not_indexed(hass: HomeAssistant) -> None:
+    """Test async_all_with_attribute only indexes the selected attributes."""
+    hass.states.async_set("sensor.int", "1", {"level": 1, "unit_of_measurement": 1})
+    hass.states.async_set(
+        "sensor.float", "1", {"level": 1.0, "unit_of_measurement": 1.0}
+    )
+    hass.states.async_set(
+        "sensor.bool", "1", {"level": True, "unit_of_measurement": True}
+    )
+    hass.states.async_set(
+        "sensor.enum", "1", {"level": "1", "unit_of_measurement": UnitOfLength.METERS}
+    )
+
+    def _entity_ids(attribute: str, value: Any) -> set[str]:
+        return {
+            state.entity_id
+            for state in hass.states.async_all_with_attribute(attribute, value)
+        }
+
+    # 1, 1.0 and True are equal but are different attribute values
+    for attribute in ("level", "unit_of_measurement"):
+        assert _entity_ids(attribute, 1) == {"sensor.int"}
+        assert _entity_ids(attribute, 1.0) == {"sensor.float"}
+        assert _entity_ids(attribute, True) == {"sensor.bool"}
+    assert _entity_ids("level", "1") == {"sensor.enum"}
+    assert _entity_ids("unit_of_measurement", "m") == {"sensor.enum"}
+
+    assert hass.states._states._attribute_index.keys() == {"unit_of_measurement"}
+
+    hass.states.async_set("sensor.total", "1", {"state_class": "total"})
+    assert _entity_ids("state_class", "total") == {"sensor.total"}
+    assert hass.states._states._attribute_index.keys() == {
+        "state_class",
+        "unit_of_measurement",
+    }
+
+
 async def test_async_entity_ids_count(hass: HomeAssistant) -> None:
     """Test async_entity_ids_count."""
 
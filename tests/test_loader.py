@@ -9,6 +9,7 @@ from typing import Any
 from unittest.mock import MagicMock, Mock, patch
 
 from awesomeversion import AwesomeVersion
+from freezegun.api import FrozenDateTimeFactory
 import pytest
 
 from homeassistant import loader
@@ -19,7 +20,12 @@ from homeassistant.helpers import frame
 from homeassistant.helpers.json import json_dumps
 from homeassistant.util.json import json_loads
 
-from .common import MockModule, async_get_persistent_notifications, mock_integration
+from .common import (
+    MockModule,
+    async_fire_time_changed,
+    async_get_persistent_notifications,
+    mock_integration,
+)
 
 
 async def test_circular_component_dependencies(hass: HomeAssistant) -> None:
@@ -2025,3 +2031,71 @@ async def test_manifest_json_fragment_round_trip(hass: HomeAssistant) -> None:
         json_loads(json_dumps(integration.manifest_json_fragment))
         == integration.manifest
     )
+
+
+async def test_manifest_cache(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    freezer: FrozenDateTimeFactory,
+    tmp_path: pathlib.Path,
+) -> None:
+    """Test manifests are resolved from the cache while they are not modified."""
+    file_path = tmp_path / "custom_components" / "cached"
+    root_module = Mock(__path__=[str(tmp_path / "custom_components")])
+    root_module.__name__ = "custom_components"
+
+    def _write_manifest(version: str) -> None:
+        file_path.mkdir(parents=True, exist_ok=True)
+        (file_path / "__init__.py").write_text("")
+        (file_path / "manifest.json").write_text(
+            json_dumps({"domain": "cached", "name": "Cached", "version": version})
+        )
+
+    async def _async_resolve() -> loader.Integration | None:
+        return await hass.async_add_executor_job(
+            loader.Integration.resolve_from_root, hass, root_module, "cached"
+        )
+
+    removed_path = str(tmp_path / "custom_components" / "removed")
+    hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY] = {
+        "version": loader.MANIFEST_CACHE_STORAGE_VERSION,
+        "data": {
+            "entries": {
+                removed_path: {
+                    "manifest_mtime": 0,
+                    "manifest_size": 0,
+                    "dir_mtime": 0,
+                    "manifest": {"domain": "removed"},
+                    "files": None,
+                }
+            }
+        },
+    }
+    await hass.async_add_executor_job(_write_manifest, "1.0.0")
+    await loader.async_load_manifest_cache(hass)
+
+    integration = await _async_resolve()
+    assert integration is not None
+    assert integration.version == "1.0.0"
+
+    with patch.object(pathlib.Path, "read_text") as mock_read_text:
+        integration = await _async_resolve()
+    assert mock_read_text.call_count == 0
+    assert integration is not None
+    assert integration.version == "1.0.0"
+    assert integration.manifest["is_built_in"] is False
+
+    await hass.async_add_executor_job(_write_manifest, "1.10.0")
+    integration = await _async_resolve()
+    assert integration is not None
+    assert integration.version == "1.10.0"
+
+    loader._async_save_manifest_cache(hass)
+    freezer.tick(loader.MANIFEST_CACHE_SAVE_DELAY)
+    async_fire_time_changed(hass)
+    await hass.async_block_till_done()
+    entries = hass_storage[loader.MANIFEST_CACHE_STORAGE_KEY]["data"]["entries"]
+    # Entries that were not used since the start are dropped
+    assert entries.keys() == {str(file_path)}
+    assert entries[str(file_path)]["manifest"]["version"] == "1.10.0"
+    assert entries[str(file_path)]["files"] == ["__init__.py", "manifest.json"]
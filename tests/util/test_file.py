@@ -7,7 +7,12 @@ from unittest.mock import patch
 import py
 import pytest
 
-from homeassistant.util.file import WriteError, write_utf8_file, write_utf8_file_atomic
+from homeassistant.util.file import (
+    WriteError,
+    write_utf8_file,
+    write_utf8_file_atomic,
+    write_utf8_files_atomic,
+)
 
 
 @pytest.mark.parametrize("func", [write_utf8_file, write_utf8_file_atomic])
@@ -95,3 +100,30 @@ def test_write_utf8_file_atomic_fails(tmpdir: py.path.local) -> None:
         write_utf8_file_atomic(test_file, '{"some":"data"}', False)
 
     assert not os.path.exists(test_file)
+
+
+def test_write_utf8_files_atomic(tmpdir: py.path.local) -> None:
+    """Test writing files with grouped fsyncs."""
+    test_dir = tmpdir.mkdir("files")
+    test_file1 = str(test_dir / "test1.json")
+    test_file2 = str(test_dir / "test2.json")
+    missing_file = str(test_dir / "missing" / "test.json")
+
+    errors = write_utf8_files_atomic(
+        [
+            (test_file1, '{"some":"data"}', False, "w"),
+            (missing_file, '{"some":"data"}', False, "w"),
+            (test_file2, b'{"other":"data"}', True, "wb"),
+        ]
+    )
+    assert errors[0] is None
+    assert isinstance(errors[1], WriteError)
+    assert errors[2] is None
+
+    with open(test_file1, encoding="utf8") as fh:
+        assert fh.read() == '{"some":"data"}'
+    assert os.stat(test_file1).st_mode & 0o777 == 0o644
+    with open(test_file2, encoding="utf8") as fh:
+        assert fh.read() == '{"other":"data"}'
+    assert os.stat(test_file2).st_mode & 0o777 == 0o600
+    assert sorted(os.listdir(test_dir)) == ["test1.json", "test2.json"]